@@ -1,10 +1,24 @@
 from dataclasses import dataclass, field
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 from config.enums import BehaviorType
 from config.enums import EffectType
 from config.enums import TrajectoryType
 
 
+@dataclass(frozen=True)
+class ProjectileLOD:
+    """
+    Nivel de detalle de un hechizo cuando hay muchos de sus proyectiles
+    activos a la vez. Cada umbral compara la cantidad activa de ese hechizo
+    (0 = regla desactivada).
+    """
+    imposter_desde: int = 0          # Más activos que esto: círculo simple en lugar del sprite
+    fusion_desde: int = 0            # Más activos que esto: los superpuestos se dibujan una vez
+    celda_fusion: int = 16           # Lado (px lógicos) de la celda que define "superpuestos"
+    animacion_lenta_desde: int = 0   # Más activos que esto: animación más lenta
+    factor_animacion: float = 2.0    # Multiplicador de la duración de cada frame
+
+
 @dataclass
 class SpellData:
     """Configuración completa de un hechizo"""
@@ -23,6 +37,9 @@ class SpellData:
     # Modificadores de trayectoria
     gravedad: float = 0.0  # Para trayectorias aéreas
     friccion: float = 0.0  # Para proyectiles en suelo
+    
+    # Nivel de detalle con muchos proyectiles en pantalla (None = siempre completo)
+    lod: Optional[ProjectileLOD] = None
 
 # ======================
 # BASE DE DATOS DE HECHIZOS
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import List
+
+# ======================
+# NIVELES DE CALIDAD
+# ======================
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    """Qué se dibuja (y cuánto) en un nivel de calidad"""
+    nombre: str
+    capas_parallax: int          # Capas del fondo en movimiento que se dibujan
+    glow_circulos: bool          # Halo pulsante de los círculos mágicos
+    degradado_areas: bool        # Brillo interior de los efectos de área procedurales
+    glow_proyectiles: bool       # Halo aditivo de los proyectiles
+    barras_hp: bool              # Barras de HP sobre los enemigos
+    iconos_estado: bool          # Iconos de estado sobre los enemigos
+    densidad_particulas: float   # Fracción de las partículas emitidas (0.0 - 1.0)
+    escala_render: float         # Tope de la escala de render interno
+
+
+# De mayor a menor calidad; el gobernador baja y sube de a un nivel
+QUALITY_TIERS: List[QualityTier] = [
+    QualityTier("alta", capas_parallax=4, glow_circulos=True, degradado_areas=True,
+                glow_proyectiles=True, barras_hp=True,
+                iconos_estado=True, densidad_particulas=1.0, escala_render=1.0),
+    QualityTier("media", capas_parallax=2, glow_circulos=True, degradado_areas=False,
+                glow_proyectiles=True, barras_hp=True,
+                iconos_estado=True, densidad_particulas=0.6, escala_render=1.0),
+    QualityTier("baja", capas_parallax=0, glow_circulos=False, degradado_areas=False,
+                glow_proyectiles=False, barras_hp=True,
+                iconos_estado=False, densidad_particulas=0.3, escala_render=0.75),
+    QualityTier("mínima", capas_parallax=0, glow_circulos=False, degradado_areas=False,
+                glow_proyectiles=False, barras_hp=False,
+                iconos_estado=False, densidad_particulas=0.0, escala_render=0.5),
+]
+
+# ======================
+# GOBERNADOR
+# ======================
+
+QUALITY_AUTO = True              # False = siempre en QUALITY_TIERS[0]
+FRAME_BUDGET_MS = 1000 / 60      # Presupuesto por frame
+QUALITY_PERCENTILE = 90          # Percentil del tiempo de frame que se compara
+QUALITY_WINDOW = 90              # Frames en la ventana (y mínimo entre cambios)
+DOWNGRADE_RATIO = 1.0            # Bajar si percentil > presupuesto * ratio
+UPGRADE_RATIO = 0.6              # Subir si percentil < presupuesto * ratio
+UPGRADE_HOLD = 600               # Frames sin subir tras haber bajado (evita oscilar)
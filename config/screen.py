@@ -0,0 +1,19 @@
+from typing import Tuple
+
+# ======================
+# ESPACIO LÓGICO DEL JUEGO
+# ======================
+
+# Toda la simulación (posiciones, velocidades, colisiones) usa estas
+# coordenadas, sin importar la resolución de la ventana
+LOGICAL_WIDTH = 1280
+LOGICAL_HEIGHT = 720
+LOGICAL_SIZE: Tuple[int, int] = (LOGICAL_WIDTH, LOGICAL_HEIGHT)
+
+# Escalas de render interno disponibles (fracción del tamaño lógico)
+RENDER_SCALES = [0.5, 0.75, 1.0]
+DEFAULT_RENDER_SCALE = 1.0
+
+# Backend de presentación (ver systems/render_backend.py):
+# "auto" usa el renderer de SDL2 si hay driver acelerado, si no software
+RENDER_BACKEND = "auto"
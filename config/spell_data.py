@@ -4,7 +4,7 @@ from config.enums import BehaviorType
 from config.enums import EffectType
 from config.enums import SpellType
 from config.enums import Element
-from config.dataclass import SpellData
+from config.dataclass import SpellData, ProjectileLOD
 from config.enums import TrajectoryType
 
 SPELL_DATABASE: Dict[SpellType, SpellData] = {
@@ -188,7 +188,15 @@ SPELL_DATABASE: Dict[SpellType, SpellData] = {
             "num_proyectiles": 20,      # Dispara 5 proyectiles
             "spread_angulo": 85,       # Ángulo de dispersión
             "duracion_congelacion": 2.0
-        }
+        },
+        # Una sola descarga ya son 20 proyectiles: con dos en el aire se simplifican
+        lod=ProjectileLOD(
+            imposter_desde=20,
+            fusion_desde=20,
+            celda_fusion=12,
+            animacion_lenta_desde=10,
+            factor_animacion=2.0
+        )
     ),
     
     SpellType.AVALANCHA: SpellData(
@@ -5,7 +5,11 @@ from typing import Optional, List, Dict, Set
 from dataclasses import dataclass
 
 from config.enums import Element, TrajectoryType
-from systems.animation import AnimationController, Animation, load_animation_frames, create_placeholder_frames
+from config.screen import LOGICAL_WIDTH, LOGICAL_HEIGHT
+from systems.animation import (load_animation_frames, has_animation_frames, animation_frame_requests,
+                               animation_clock)
+from systems.quality_governor import quality_governor
+from systems.render_queue import RenderLayer, RenderQueue
 
 
 # ======================
@@ -92,6 +96,204 @@ ENEMY_DATABASE: Dict[EnemyType, EnemyData] = {
 }
 
 
+def _enemy_sprite_args(enemy_type: EnemyType) -> tuple:
+    """Argumentos (carpeta, prefijo, frames, escala) de la animación de un enemigo"""
+    data = ENEMY_DATABASE[enemy_type]
+    folder_path = f"assets/sprites/enemies/{enemy_type.name.lower()}"
+    return folder_path, "frame_", data.num_frames, (data.tamaño * 3, data.tamaño * 3)
+
+
+def load_enemy_frames(enemy_type: EnemyType) -> Optional[List[pygame.Surface]]:
+    """
+    Carga los frames de un tipo de enemigo (vía caché y atlas de sprites).
+    
+    Returns:
+        Lista de frames, o None si el enemigo no tiene sprites (usar procedural)
+    """
+    folder_path, prefix, num_frames, scale = _enemy_sprite_args(enemy_type)
+    
+    # Sin sprites: consulta O(1) al manifiesto
+    if not has_animation_frames(folder_path, prefix):
+        return None
+    
+    return load_animation_frames(folder_path, prefix, num_frames=num_frames, scale=scale)
+
+
+def enemy_frame_requests(enemy_type: EnemyType) -> List[tuple]:
+    """Imágenes (ruta, escala) que cargaría load_enemy_frames, para precargar"""
+    return animation_frame_requests(*_enemy_sprite_args(enemy_type))
+
+
+# ======================
+# PROTOTIPOS
+# ======================
+
+# Tintes (multiplicativos) de los estados visuales
+STATUS_TINTS = {
+    "frozen": (100, 200, 255, 100),   # Azul semi-transparente
+    "stunned": (255, 255, 150, 255),  # Amarillo
+    "burning": (255, 150, 100, 255),  # Naranja
+    "slowed": (170, 210, 255, 255),   # Celeste
+}
+
+class EnemyPrototype:
+    """
+    Datos compartidos por todos los enemigos de un mismo tipo: frames ya
+    cargados y escalados, tamaños de colisión y el gráfico procedural
+    pre-renderizado. Se crea una vez por tipo; los enemigos solo guardan
+    su cursor de animación.
+    """
+    
+    def __init__(self, enemy_type: EnemyType):
+        """
+        Args:
+            enemy_type: Tipo de enemigo
+        """
+        self.enemy_type = enemy_type
+        self.data = ENEMY_DATABASE[enemy_type]
+        
+        # Colisión: cuadrado de lado 2 * tamaño centrado en el enemigo
+        self.half_size = self.data.tamaño
+        self.rect_size = (self.data.tamaño * 2, self.data.tamaño * 2)
+        
+        # Frames de la animación; sin sprites, el gráfico procedural
+        # (círculo con borde) pre-renderizado como único frame
+        self.frames = load_enemy_frames(enemy_type)
+        self.procedural = self.frames is None
+        if self.procedural:
+            self.frames = [self._render_procedural(self.data.color_placeholder)]
+        self.frame_duration = self.data.frame_duration
+        
+        # Variantes tintadas por (estado, índice de frame), creadas al primer uso
+        self._variants: Dict[tuple, pygame.Surface] = {}
+    
+    def _render_procedural(self, color: tuple) -> pygame.Surface:
+        """Pre-renderiza el gráfico procedural del enemigo"""
+        radius = self.data.tamaño
+        surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        pygame.draw.circle(surf, (255, 255, 255), (radius, radius), radius, 2)
+        return surf
+    
+    def frame_index(self, anim_time: float) -> int:
+        """Índice del frame para un tiempo de animación (en loop)"""
+        return int(anim_time / self.frame_duration) % len(self.frames)
+    
+    def get_frame(self, anim_time: float, status: Optional[str] = None) -> pygame.Surface:
+        """
+        Retorna el frame correspondiente a un tiempo de animación.
+        
+        Args:
+            anim_time: Segundos desde que empezó la animación
+            status: Estado visual ("frozen", "stunned", "burning", "slowed") o None
+        """
+        index = self.frame_index(anim_time)
+        if status is None:
+            return self.frames[index]
+        
+        variant = self._variants.get((status, index))
+        if variant is None:
+            variant = self._build_variant(status, index)
+            self._variants[(status, index)] = variant
+        return variant
+    
+    def _build_variant(self, status: str, index: int) -> pygame.Surface:
+        """Crea la versión tintada de un frame"""
+        # El procedural congelado se dibuja directamente en azul claro
+        if self.procedural and status == "frozen":
+            return self._render_procedural((100, 200, 255))
+        
+        variant = self.frames[index].copy()
+        variant.fill(STATUS_TINTS[status], special_flags=pygame.BLEND_RGBA_MULT)
+        return variant
+
+
+# Prototipos compartidos (se crean la primera vez que se piden)
+_prototypes: Dict[EnemyType, EnemyPrototype] = {}
+
+
+def get_enemy_prototype(enemy_type: EnemyType) -> EnemyPrototype:
+    """Retorna el prototipo de un tipo de enemigo, creándolo si hace falta"""
+    prototype = _prototypes.get(enemy_type)
+    if prototype is None:
+        prototype = EnemyPrototype(enemy_type)
+        _prototypes[enemy_type] = prototype
+    return prototype
+
+
+# ======================
+# BARRAS DE HP E ICONOS
+# ======================
+
+HP_BAR_HEIGHT = 5
+STATUS_ICON_SPACING = 8
+STATUS_ICON_PAD = 4  # Radio máximo de un icono
+
+# Superficies compartidas: (ancho, relleno) -> barra, flags de estado -> iconos
+_hp_bars: Dict[tuple, pygame.Surface] = {}
+_status_icons: Dict[tuple, pygame.Surface] = {}
+
+
+def get_hp_bar(width: int, fill_width: int) -> pygame.Surface:
+    """Retorna (creándola la primera vez) la barra de HP con un nivel de relleno"""
+    key = (width, fill_width)
+    bar = _hp_bars.get(key)
+    if bar is None:
+        bar = pygame.Surface((width, HP_BAR_HEIGHT))
+        bar.fill((100, 0, 0))                                              # Fondo (rojo)
+        bar.fill((0, 255, 0), (0, 0, fill_width, HP_BAR_HEIGHT))           # HP actual (verde)
+        pygame.draw.rect(bar, (255, 255, 255), bar.get_rect(), 1)          # Borde
+        _hp_bars[key] = bar
+    return bar
+
+
+def get_status_icons(stunned: bool, frozen: bool, confused: bool,
+                     slowed: bool, burning: bool) -> Optional[pygame.Surface]:
+    """
+    Retorna la tira de iconos para una combinación de estados, o None si
+    no hay ninguno. El primer icono queda centrado en (STATUS_ICON_PAD,
+    STATUS_ICON_PAD) de la superficie.
+    """
+    key = (stunned, frozen, confused, slowed, burning)
+    if key in _status_icons:
+        return _status_icons[key]
+    if not any((stunned, confused, slowed, burning)):
+        _status_icons[key] = None
+        return None
+
+    pad = STATUS_ICON_PAD
+    surf = pygame.Surface((STATUS_ICON_SPACING * 4 + pad * 2 + 1, pad * 2 + 1), pygame.SRCALPHA)
+    x, y = pad, pad
+
+    if stunned:
+        if frozen:
+            # Icono de hielo (azul)
+            pygame.draw.circle(surf, (100, 200, 255), (x, y), 4)
+            pygame.draw.circle(surf, (200, 240, 255), (x, y), 2)
+        else:
+            # Estrellitas de aturdimiento (amarillo)
+            pygame.draw.circle(surf, (255, 255, 0), (x, y), 3)
+        x += STATUS_ICON_SPACING
+
+    if confused:
+        # Icono de confusión (espirales moradas)
+        pygame.draw.circle(surf, (180, 100, 180), (x, y), 4)
+        pygame.draw.circle(surf, (220, 150, 220), (x, y), 2)
+        x += STATUS_ICON_SPACING
+
+    if slowed:
+        # Icono de hielo/ralentización
+        pygame.draw.circle(surf, (100, 200, 255), (x, y), 3)
+        x += STATUS_ICON_SPACING
+
+    if burning:
+        # Icono de fuego/veneno
+        pygame.draw.circle(surf, (255, 100, 0), (x, y), 3)
+
+    _status_icons[key] = surf
+    return surf
+
+
 # ======================
 # CLASE ENEMY
 # ======================
@@ -101,21 +303,24 @@ class Enemy:
     Enemigo base con animaciones, debilidades y movimiento.
     """
     
-    # Constantes de pantalla
-    SCREEN_WIDTH = 1280
-    SCREEN_HEIGHT = 720
+    # Límites del espacio lógico (independientes de la ventana)
+    SCREEN_WIDTH = LOGICAL_WIDTH
+    SCREEN_HEIGHT = LOGICAL_HEIGHT
     
     # Spawn desde la derecha
     SPAWN_X = SCREEN_WIDTH + 50
     
-    def __init__(self, enemy_type: EnemyType, spawn_y: float):
+    def __init__(self, enemy_type: EnemyType, spawn_y: float,
+                 prototype: Optional[EnemyPrototype] = None):
         """
         Args:
             enemy_type: Tipo de enemigo
             spawn_y: Altura Y donde aparece
+            prototype: Prototipo del tipo (por defecto el compartido)
         """
         self.enemy_type = enemy_type
-        self.data = ENEMY_DATABASE[enemy_type]
+        self.prototype = prototype or get_enemy_prototype(enemy_type)
+        self.data = self.prototype.data
         
         # Estado
         self.x = self.SPAWN_X
@@ -146,56 +351,17 @@ class Enemy:
         self.dot_next_tick = 0.0
         
         # Colisión
-        self.rect = pygame.Rect(
-            int(self.x - self.data.tamaño),
-            int(self.y - self.data.tamaño),
-            self.data.tamaño * 2,
-            self.data.tamaño * 2
-        )
-        
-        # Animación
-        self.anim_controller = None
-        self._load_animation()
-    
-    def _load_animation(self):
-        """Carga la animación del enemigo"""
-        try:
-            enemy_name = self.enemy_type.name.lower()
-            frames = load_animation_frames(
-                f"assets/sprites/enemies/{enemy_name}",
-                "frame_",
-                num_frames=self.data.num_frames,
-                scale=(self.data.tamaño * 3, self.data.tamaño * 3)
-            )
-            
-            # Verificar si se cargaron sprites válidos
-            test_path = f"assets/sprites/enemies/{enemy_name}/frame_0.png"
-            pygame.image.load(test_path).convert_alpha()
-            
-            # Crear animación
-            anim = Animation(
-                frames,
-                frame_duration=self.data.frame_duration,
-                loop=True
-            )
-            
-            self.anim_controller = AnimationController()
-            self.anim_controller.add_animation("walk", anim)
-            self.anim_controller.play("walk")
-            
-        except Exception as e:
-            # Fallback: sin animación, usar gráficos procedurales
-            self.anim_controller = None
+        half = self.prototype.half_size
+        self.rect = pygame.Rect((int(self.x - half), int(self.y - half)), self.prototype.rect_size)
+        
+        # Animación: solo el instante de inicio, los frames viven en el prototipo
+        self.anim_start = animation_clock.time
     
     def update(self, dt: float):
         """Actualiza el enemigo"""
         if not self.activo:
             return
         
-        # Actualizar animación
-        if self.anim_controller:
-            self.anim_controller.update(dt)
-        
         # Actualizar efectos de estado
         self._update_status_effects(dt)
         
@@ -333,102 +499,56 @@ class Enemy:
         # Solo se necesita que horizontal sea verdadero
         return touching_horizontal and touching_vertical
 
-    def draw(self, screen: pygame.Surface):
-        """Dibuja el enemigo"""
+    def submit(self, queue: RenderQueue):
+        """Encola el enemigo, su barra de HP y sus iconos de estado"""
         if not self.activo:
             return
 
-        if self.anim_controller:
-            # Usar animación
-            frame = self.anim_controller.get_current_frame()
-            if frame:
-                # Si está congelado, aplicar tinte azul
-                if self.frozen:
-                    # Crear una copia del frame con tinte azul
-                    frozen_frame = frame.copy()
-                    frozen_overlay = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
-                    frozen_overlay.fill((100, 200, 255, 100))  # Azul semi-transparente
-                    frozen_frame.blit(frozen_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                    frame = frozen_frame
-
-                rect = frame.get_rect(center=(int(self.x), int(self.y)))
-                screen.blit(frame, rect)
-        else:
-            # Fallback: gráfico procedural
-            color = self.data.color_placeholder
-
-            # Si está congelado, cambiar color a azul claro
-            if self.frozen:
-                color = (100, 200, 255)
-
-            pygame.draw.circle(
-                screen,
-                color,
-                (int(self.x), int(self.y)),
-                self.data.tamaño
-            )
-            pygame.draw.circle(
-                screen,
-                (255, 255, 255),
-                (int(self.x), int(self.y)),
-                self.data.tamaño,
-                2
-            )
-
-        # Dibujar barra de HP
-        self._draw_hp_bar(screen)
+        # Un solo blit: las variantes tintadas vienen del prototipo
+        frame = self.prototype.get_frame(animation_clock.elapsed(self.anim_start),
+                                         self._visual_status())
+        queue.submit_centered(frame, (self.x, self.y), RenderLayer.ENEMIES)
 
-        # Indicadores de estado
-        self._draw_status_indicators(screen)
-    
-    def _draw_hp_bar(self, screen: pygame.Surface):
-        """Dibuja la barra de vida sobre el enemigo"""
-        bar_width = self.data.tamaño * 2
-        bar_height = 5
-        bar_x = int(self.x - bar_width // 2)
-        bar_y = int(self.y - self.data.tamaño - 10)
+        tier = quality_governor.tier
 
-        # Fondo (rojo)
-        pygame.draw.rect(screen, (100, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+        # Barra de HP (superficie compartida por nivel de relleno)
+        if tier.barras_hp:
+            self._submit_hp_bar(queue)
 
-        # HP actual (verde)
-        hp_percent = max(0, self.hp / self.max_hp)
-        fill_width = int(bar_width * hp_percent)
-        pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, fill_width, bar_height))
-
-        # Borde
-        pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 1)
-
-    def _draw_status_indicators(self, screen: pygame.Surface):
-        """Dibuja iconos de efectos de estado"""
-        icon_y = int(self.y - self.data.tamaño - 20)
-        icon_x = int(self.x - 10)
+        # Indicadores de estado
+        if tier.iconos_estado:
+            self._submit_status_icons(queue)
 
+    def _submit_hp_bar(self, queue: RenderQueue):
+        """Encola la barra de HP sobre el enemigo"""
+        bar_width = self.data.tamaño * 2
+        fill_width = int(bar_width * max(0, self.hp / self.max_hp))
+        queue.submit(get_hp_bar(bar_width, fill_width),
+                     (int(self.x - bar_width // 2), int(self.y - self.data.tamaño - 10)),
+                     RenderLayer.ENEMY_UI)
+
+    def _submit_status_icons(self, queue: RenderQueue):
+        """Encola los iconos de los estados activos"""
+        icons = get_status_icons(self.stunned, self.frozen, self.confused,
+                                 self.slowed, self.dot_active)
+        if icons is not None:
+            queue.submit(icons,
+                         (int(self.x - 10) - STATUS_ICON_PAD,
+                          int(self.y - self.data.tamaño - 20) - STATUS_ICON_PAD),
+                         RenderLayer.ENEMY_UI)
+    
+    def _visual_status(self) -> Optional[str]:
+        """Estado que define el tinte (prioridad: congelado > aturdido > quemado > lento)"""
+        if self.frozen:
+            return "frozen"
         if self.stunned:
-            if self.frozen:
-                # Icono de hielo (azul)
-                pygame.draw.circle(screen, (100, 200, 255), (icon_x, icon_y), 4)
-                pygame.draw.circle(screen, (200, 240, 255), (icon_x, icon_y), 2)
-            else:
-                # Estrellitas de aturdimiento (amarillo)
-                pygame.draw.circle(screen, (255, 255, 0), (icon_x, icon_y), 3)
-            icon_x += 8
-
-        if self.confused:
-        # Icono de confusión (espirales moradas/signos de interrogación)
-            pygame.draw.circle(screen, (180, 100, 180), (icon_x, icon_y), 4)
-            pygame.draw.circle(screen, (220, 150, 220), (icon_x, icon_y), 2)
-            icon_x += 8
-
-        if self.slowed:
-            # Icono de hielo/ralentización
-            pygame.draw.circle(screen, (100, 200, 255), (icon_x, icon_y), 3)
-            icon_x += 8
-
+            return "stunned"
         if self.dot_active:
-            # Icono de fuego/veneno
-            pygame.draw.circle(screen, (255, 100, 0), (icon_x, icon_y), 3)
-
+            return "burning"
+        if self.slowed:
+            return "slowed"
+        return None
+    
     def apply_knockback(self, fuerza: float, direccion_x: float = 1):
         """
         Aplica un empujón al enemigo.
@@ -465,11 +585,17 @@ class EnemyManager:
     Gestiona el spawn, actualización y eliminación de enemigos.
     """
     
-    GROUND_Y = 675  # Altura del suelo
+    GROUND_Y = 675  # Altura del suelo (coordenadas lógicas)
     AIR_Y = 400     # Altura de enemigos voladores
     
     def __init__(self):
         self.enemies: List[Enemy] = []
+        
+        # Un prototipo por tipo: los spawns no cargan ni escalan nada
+        self.prototypes: Dict[EnemyType, EnemyPrototype] = {
+            enemy_type: get_enemy_prototype(enemy_type) for enemy_type in EnemyType
+        }
+        
         self.spawn_timer = 0.0
         self.spawn_interval = 2.0  # Segundos entre spawns
     
@@ -481,7 +607,7 @@ class EnemyManager:
         else:
             spawn_y = self.GROUND_Y
         
-        enemy = Enemy(enemy_type, spawn_y)
+        enemy = Enemy(enemy_type, spawn_y, self.prototypes[enemy_type])
         self.enemies.append(enemy)
         return enemy
     
@@ -499,10 +625,10 @@ class EnemyManager:
         # Eliminar enemigos inactivos
         self.enemies = [e for e in self.enemies if e.activo]
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja todos los enemigos"""
+    def submit(self, queue: RenderQueue):
+        """Encola todos los enemigos"""
         for enemy in self.enemies:
-            enemy.draw(screen)
+            enemy.submit(queue)
     
     def clear_all(self):
         """Elimina todos los enemigos (cuando el jugador recibe daño)"""
@@ -629,6 +755,7 @@ class PlayingState(State):
     def draw(self, pantalla):
         # ... código existente ...
         
-        # Dibujar enemigos
-        self.enemy_manager.draw(pantalla)
+        # Encolar enemigos
+        self.enemy_manager.submit(self.render_queue)
+        self.render_queue.flush(pantalla)
 """
\ No newline at end of file
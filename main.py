@@ -1,19 +1,52 @@
 import pygame
 import cv2
 from systems.gesture_detector import GestureDetector
-from states import OptionsState, MenuState, PlayingState, PauseState, VictoryState, GameOverState
+from states import OptionsState, MenuState, PlayingState, PauseState, VictoryState, GameOverState, LoadingState
 from systems.audio_manager import AudioManager, MusicTrack, SoundEffect
+from systems.asset_manifest import asset_manifest
+from systems.asset_cache import asset_cache
+from systems.asset_bundle import AssetBundle
+from systems.asset_loader import AssetLoader
+from systems.world_canvas import WorldCanvas
+from systems.render_backend import create_backend
+from systems.screen_effects import screen_effects
+from systems.quality_governor import quality_governor
+from config.screen import LOGICAL_SIZE, DEFAULT_RENDER_SCALE, RENDER_BACKEND
 
 
 
 class Game:
+    # Eventos de ventana tras los cuales hay que redibujar todo
+    REDRAW_EVENTS = (
+        pygame.VIDEOEXPOSE,
+        pygame.WINDOWEXPOSED,
+        pygame.WINDOWRESTORED,
+        pygame.WINDOWSIZECHANGED,
+    )
+    
     def __init__(self):
         pygame.init()
-        self.pantalla = pygame.display.set_mode((1280, 720))
-        pygame.display.set_caption("SETUP WIZARD")
+        
+        # Software o renderer de SDL2, según lo que soporte la máquina
+        self.backend = create_backend(RENDER_BACKEND, "SETUP WIZARD")
+        self.pantalla = self.backend.open(LOGICAL_SIZE)
+        print(f"🖥️ Backend de render: {self.backend.name}")
         self.clock = pygame.time.Clock()
         self.corriendo = True
         
+        # Índice de assets disponibles (una sola pasada por disco)
+        asset_manifest.scan()
+        world_bundle = AssetBundle.open_world()
+        asset_cache.mount_world_bundle(world_bundle)
+        if world_bundle is None:
+            print("⚠️ Sin bundle de capas del mundo "
+                  "(hornear con: python -m systems.asset_bundle)")
+        self._mount_asset_bundle()
+        asset_cache.set_screen_size(self.pantalla.get_size())
+        
+        # Reconstrucción en segundo plano de los fondos al cambiar de resolución
+        self.background_loader = None
+        
         self.fuente_grande = pygame.font.Font(None, 74)
         self.fuente_chica = pygame.font.Font(None, 36)
         self.fuente_mini = pygame.font.Font(None, 24)
@@ -21,14 +54,20 @@ class Game:
         # Configuraciones
         self.volumen = 0.5
         self.gestos_activos = True
+        self.render_scale = DEFAULT_RENDER_SCALE
+        
+        # La partida se dibuja en coordenadas lógicas sobre este lienzo
+        self.canvas = WorldCanvas(self.render_scale)
         
         # Sistema de detección de gestos
         self.gesture_detector = GestureDetector()
-        self.audio = AudioManager()
+        # Los efectos de sonido se decodifican en el LoadingState
+        self.audio = AudioManager(preload_sounds=False)
         
         # ✨ Registro de estados (ahora incluye Victory y GameOver)
         self.states = {
             "menu": MenuState(self),
+            "cargando": LoadingState(self),
             "jugando": PlayingState(self),
             "pausa": PauseState(self),
             "opciones": OptionsState(self),
@@ -40,14 +79,56 @@ class Game:
         self.change_state("menu")
         
     def set_resolution(self, ancho, alto):
-        self.pantalla = pygame.display.set_mode((ancho, alto))
+        self.pantalla = self.backend.open((ancho, alto))
+        self._mount_asset_bundle()
+        
+        # Solo se reconstruyen los assets que dependen del tamaño de pantalla
+        self._rebuild_screen_assets(asset_cache.set_screen_size((ancho, alto)))
+        screen_effects.clear()
+        
+    def set_render_scale(self, render_scale):
+        """
+        Cambia la escala de render interno de la partida (la elegida en
+        opciones; el nivel de calidad actual puede limitarla)
+        """
+        self.render_scale = render_scale
+        self.canvas.set_render_scale(min(render_scale, quality_governor.tier.escala_render))
+        
+    def _rebuild_screen_assets(self, requests):
+        """Decodifica en hilos los fondos para la nueva resolución"""
+        if self.background_loader is not None:
+            self.background_loader.cancel()
+            self.background_loader = None
+        if not requests:
+            return
+        
+        loader = AssetLoader()
+        for path, scale, alpha in requests:
+            loader.add_image(path, scale, alpha)
+        loader.start()
+        self.background_loader = loader
+        
+    def _mount_asset_bundle(self):
+        """Monta el bundle de fondos de menú pre-horneados de la resolución actual"""
+        bundle = AssetBundle.open_for_resolution(self.pantalla.get_size())
+        asset_cache.mount_bundle(bundle)
+        
+        if bundle is None:
+            print("⚠️ Sin bundle de fondos para esta resolución "
+                  "(hornear con: python -m systems.asset_bundle)")
+        elif bundle.stale_sources():
+            print("⚠️ Bundle de fondos desactualizado, re-hornear con: "
+                  "python -m systems.asset_bundle")
         
     def change_state(self, nombre):
         """Cambia entre estados del juego"""
         if self.current_state:
             self.current_state.exit()
+            # Los estados que dibujan encima (pausa) parten del último frame
+            self.backend.capture(self.pantalla, self.canvas)
         self.current_state = self.states[nombre]
         self.current_state.enter()
+        self.current_state.invalidate()
         
     def run(self):
         while self.corriendo:
@@ -55,14 +136,23 @@ class Game:
             eventos = pygame.event.get()
             
             for e in eventos:
-                if e.type == pygame.QUIT:
+                if e.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                     self.corriendo = False
+                elif e.type in self.REDRAW_EVENTS:
+                    self.current_state.invalidate()
+            
+            if self.background_loader is not None:
+                self.background_loader.pump()
+                if self.background_loader.done:
+                    self.background_loader.print_report()
+                    self.background_loader = None
                     
             self.current_state.handle_events(eventos)
             self.current_state.update(dt)
-            self.current_state.draw(self.pantalla)
             
-            pygame.display.flip()
+            # Los estados casi estáticos retornan solo lo que cambió
+            rects = self.current_state.draw(self.pantalla)
+            self.backend.present(self.pantalla, rects)
             
         # Limpiar recursos
         self.gesture_detector.detener_camara()
@@ -1,46 +1,82 @@
 import pygame
 
+from systems.asset_cache import asset_cache
+from systems.render_queue import RenderLayer
+
 class ParallaxLayer:
-    def __init__(self, ruta, velocidad, pantalla):
-        self.pantalla = pantalla
-        self.velocidad = velocidad
-        
-        # cargar imagen
-        self.image = pygame.image.load(ruta).convert_alpha()
-        self.image = pygame.transform.scale(
-            self.image,
-            (pantalla.get_width(), pantalla.get_height())
-        )
-
-        # posiciones de las dos copias para scroll infinito
-        self.x1 = 0
-        self.x2 = self.image.get_width()
-
-    def update(self):
+    def __init__(self, ruta, velocidad, size):
+        self.velocidad = velocidad  # píxeles lógicos por segundo (positiva = hacia la izquierda)
+
+        # cargar imagen al tamaño lógico del mundo (compartida vía caché)
+        self.ruta = ruta
+        self.image = asset_cache.load_image(ruta, size)
+
+        # columna de la imagen que se ve en el borde izquierdo (scroll infinito)
+        self.offset = 0.0
+
+    def update(self, dt):
         # si la capa no se mueve, no tocar posiciones
         if self.velocidad == 0:
             return
 
-        ancho = self.image.get_width()
+        # el módulo cubre ambos sentidos (velocidad negativa = hacia la derecha)
+        self.offset = (self.offset + self.velocidad * dt) % self.image.get_width()
 
-        # mover ambas imágenes
-        self.x1 -= self.velocidad
-        self.x2 -= self.velocidad
+    def submit(self, queue):
+        ancho, alto = self.image.get_size()
+        corte = int(self.offset)
 
-        # ========== MOVIMIENTO IZQUIERDA (velocidad positiva) ==========
-        if self.velocidad > 0:
-            if self.x1 <= -ancho:
-                self.x1 = self.x2 + ancho
-            if self.x2 <= -ancho:
-                self.x2 = self.x1 + ancho
+        # dos rebanadas de la misma imagen en lugar de dos copias completas
+        queue.submit(self.image, (0, 0), RenderLayer.BACKGROUND,
+                     area=pygame.Rect(corte, 0, ancho - corte, alto))
+        if corte:
+            queue.submit(self.image, (ancho - corte, 0), RenderLayer.BACKGROUND,
+                         area=pygame.Rect(0, 0, corte, alto))
 
-        # ========== MOVIMIENTO DERECHA (velocidad negativa) ==========
+
+class StaticParallaxLayer:
+    """Varias capas quietas consecutivas aplanadas en una sola superficie"""
+
+    def __init__(self, rutas, size, opaca=False):
+        self.rutas = list(rutas)
+        self.opaca = opaca  # la capa del fondo no necesita alpha por píxel
+        self.velocidad = 0
+
+        capas = [asset_cache.load_image(ruta, size) for ruta in self.rutas]
+        if opaca:
+            self.image = pygame.Surface(size).convert()
         else:
-            if self.x1 >= ancho:
-                self.x1 = self.x2 - ancho
-            if self.x2 >= ancho:
-                self.x2 = self.x1 - ancho
-
-    def draw(self):
-        self.pantalla.blit(self.image, (self.x1, 0))
-        self.pantalla.blit(self.image, (self.x2, 0))
+            self.image = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        for capa in capas:
+            self.image.blit(capa, (0, 0))
+
+    def update(self, dt):
+        pass
+
+    def submit(self, queue):
+        queue.submit(self.image, (0, 0), RenderLayer.BACKGROUND)
+
+
+def build_parallax_layers(capas, size):
+    """
+    Crea las capas del fondo a partir de una lista de (ruta, velocidad).
+    Las capas quietas consecutivas se aplanan en una sola; la primera
+    tanda (la del fondo) queda opaca.
+    """
+    layers = []
+    quietas = []
+
+    def cerrar_tanda():
+        if quietas:
+            layers.append(StaticParallaxLayer(quietas, size, opaca=not layers))
+            quietas.clear()
+
+    for ruta, velocidad in capas:
+        if velocidad == 0:
+            quietas.append(ruta)
+        else:
+            cerrar_tanda()
+            layers.append(ParallaxLayer(ruta, velocidad, size))
+    cerrar_tanda()
+
+    return layers
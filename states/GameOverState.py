@@ -6,6 +6,10 @@ from states.State import State
 from ui.menu_classes import Button
 import pygame
 from systems.audio_manager import MusicTrack, SoundEffect
+from systems.asset_cache import asset_cache
+from ui.text_cache import text_cache
+from ui.dirty_rects import DirtyRegionTracker
+from systems.screen_effects import screen_effects
 
 
 class GameOverState(State):
@@ -33,10 +37,9 @@ class GameOverState(State):
         
         # Cargar fondo
         try:
-            self.background = pygame.image.load("assets/backgrounds/gameover_bg.jpg").convert()
-            self.background = pygame.transform.scale(
-                self.background, 
-                (self.game.pantalla.get_width(), self.game.pantalla.get_height())
+            self.background = asset_cache.load_screen_image(
+                "assets/backgrounds/gameover_bg.jpg",
+                alpha=False
             )
         except Exception as e:
             print(f"WARNING: No se pudo cargar background de game over: {e}")
@@ -68,6 +71,7 @@ class GameOverState(State):
         )
         
         self.botones = [self.btn_reintentar, self.btn_menu]
+        self.dirty_regions = DirtyRegionTracker()
         
         # Animación de título (fade-in + shake)
         self.title_alpha = 0
@@ -153,6 +157,11 @@ class GameOverState(State):
     
     def draw(self, pantalla):
         """Renderiza la pantalla de Game Over"""
+        # Terminada la animación de entrada solo cambian los botones
+        animating = self._is_animating()
+        if not animating and not self.dirty_regions.needs_full_redraw(pantalla):
+            return self.dirty_regions.redraw_widgets(pantalla, self.botones)
+        
         # Fondo
         if self.background:
             pantalla.blit(self.background, (0, 0))
@@ -177,42 +186,33 @@ class GameOverState(State):
         if self.stats_alpha > 0:
             self._draw_stats(pantalla)
         
-        # Botones
-        for btn in self.botones:
-            btn.draw(pantalla)
-        
         # Hint en la parte inferior
-        hint_text = self.game.fuente_mini.render(
+        hint_text = text_cache.render(
+            self.game.fuente_mini,
             "Presiona ENTER para reintentar o ESC para volver al menú",
             True,
             (150, 150, 150)
         )
         hint_x = pantalla.get_width() // 2 - hint_text.get_width() // 2
         pantalla.blit(hint_text, (hint_x, pantalla.get_height() - 40))
+        
+        if not animating:
+            self.dirty_regions.save_backdrop(pantalla)
+        
+        # Botones
+        for btn in self.botones:
+            btn.draw(pantalla)
+    
+    def _is_animating(self):
+        """True mientras dura la animación de entrada (título, vignette, stats)"""
+        return (self.title_alpha < 255
+                or self.shake_timer < 0.5
+                or self.vignette_alpha < 180
+                or self.stats_alpha < 255)
     
     def _draw_vignette(self, pantalla):
         """Dibuja efecto de vignette (oscurecimiento en los bordes)"""
-        if self.vignette_alpha > 0:
-            vignette = pygame.Surface(pantalla.get_size(), pygame.SRCALPHA)
-            
-            # Crear efecto radial
-            cx = pantalla.get_width() // 2
-            cy = pantalla.get_height() // 2
-            max_distance = ((cx ** 2) + (cy ** 2)) ** 0.5
-            
-            for y in range(0, pantalla.get_height(), 4):
-                for x in range(0, pantalla.get_width(), 4):
-                    dx = x - cx
-                    dy = y - cy
-                    distance = (dx ** 2 + dy ** 2) ** 0.5
-                    
-                    # Factor de oscurecimiento según distancia del centro
-                    factor = distance / max_distance
-                    alpha = int(self.vignette_alpha * factor)
-                    
-                    pygame.draw.rect(vignette, (0, 0, 0, alpha), (x, y, 4, 4))
-            
-            pantalla.blit(vignette, (0, 0))
+        screen_effects.vignette(pantalla, self.vignette_alpha)
     
     def _draw_title(self, pantalla):
         """Dibuja el título animado"""
@@ -220,19 +220,19 @@ class GameOverState(State):
         
         # Texto principal
         title_text = "GAME OVER"
-        title_font = pygame.font.Font(None, 100)
+        title_font = text_cache.get_font(100)
         
         # Crear superficie para aplicar alpha
         title_surface = pygame.Surface((800, 150), pygame.SRCALPHA)
         
         # Sombra con blur simulado (múltiples capas)
         for offset in range(5, 0, -1):
-            shadow = title_font.render(title_text, True, (0, 0, 0, 100))
+            shadow = text_cache.render(title_font, title_text, True, (0, 0, 0, 100))
             shadow_rect = shadow.get_rect(center=(400 + offset + self.title_shake, 75 + offset))
             title_surface.blit(shadow, shadow_rect)
         
         # Texto principal con color rojo sangre
-        title = title_font.render(title_text, True, (200, 30, 30))
+        title = text_cache.render(title_font, title_text, True, (200, 30, 30))
         title_rect = title.get_rect(center=(400 + self.title_shake, 75))
         title_surface.blit(title, title_rect)
         
@@ -242,7 +242,8 @@ class GameOverState(State):
         
         # Subtítulo
         if self.title_alpha >= 255:
-            subtitle = self.game.fuente_chica.render(
+            subtitle = text_cache.render(
+                self.game.fuente_chica,
                 "Has sido derrotado",
                 True,
                 (150, 150, 150)
@@ -263,7 +264,7 @@ class GameOverState(State):
         pygame.draw.rect(stats_surface, (200, 50, 50, 200), (0, 0, 600, 250), 3, border_radius=15)
         
         # Título de estadísticas
-        stats_title = self.game.fuente_chica.render("Estadísticas Finales", True, (200, 50, 50))
+        stats_title = text_cache.render(self.game.fuente_chica, "Estadísticas Finales", True, (200, 50, 50))
         stats_surface.blit(stats_title, (300 - stats_title.get_width() // 2, 15))
         
         # Línea separadora
@@ -287,11 +288,11 @@ class GameOverState(State):
         y_offset = 70
         for label, value, color in stats_to_show:
             # Label
-            label_text = self.game.fuente_chica.render(label + ":", True, (200, 200, 200))
+            label_text = text_cache.render(self.game.fuente_chica, label + ":", True, (200, 200, 200))
             stats_surface.blit(label_text, (50, y_offset))
             
             # Valor
-            value_text = self.game.fuente_chica.render(str(value), True, color)
+            value_text = text_cache.render(self.game.fuente_chica, str(value), True, color)
             stats_surface.blit(value_text, (500 - value_text.get_width(), y_offset))
             
             y_offset += 45
@@ -0,0 +1,66 @@
+from states.State import State
+from systems.asset_loader import AssetLoader
+import pygame
+from ui.text_cache import text_cache
+
+
+class LoadingState(State):
+    """
+    Pantalla de carga entre el menú y la partida.
+    Decodifica en paralelo las imágenes y sonidos que necesita el juego y
+    cambia a "jugando" cuando todo está listo.
+    """
+
+    def enter(self):
+        print("Cargando recursos...")
+        self.loader = AssetLoader()
+
+        # Imágenes de la partida
+        for path, scale, alpha, packed in self.game.states["jugando"].get_asset_requests():
+            self.loader.add_image(path, scale, alpha, packed)
+
+        # Efectos de sonido (la decodificación también corre en los hilos)
+        audio = self.game.audio
+        for sound, filepath in audio.pending_sounds():
+            self.loader.add(
+                filepath,
+                lambda filepath=filepath: pygame.mixer.Sound(filepath),
+                lambda sfx, sound=sound: audio.register_sound(sound, sfx)
+            )
+
+        self.loader.start()
+
+    def exit(self):
+        # Si se sale antes de terminar, no dejar hilos trabajando
+        if not self.loader.done:
+            self.loader.cancel()
+
+    def handle_events(self, eventos):
+        pass
+
+    def update(self, dt):
+        self.loader.pump()
+
+        if self.loader.done:
+            self.loader.print_report()
+            self.game.change_state("jugando")
+
+    def draw(self, pantalla):
+        pantalla.fill((20, 25, 40))
+        cx = pantalla.get_width() // 2
+        cy = pantalla.get_height() // 2
+
+        texto = text_cache.render(self.game.fuente_chica, "Cargando...", True, (255, 255, 255))
+        pantalla.blit(texto, (cx - texto.get_width() // 2, cy - 60))
+
+        # Barra de progreso
+        bar_w, bar_h = 400, 20
+        bar_x = cx - bar_w // 2
+        pygame.draw.rect(pantalla, (60, 60, 80), (bar_x, cy, bar_w, bar_h))
+        pygame.draw.rect(pantalla, (100, 200, 255),
+                         (bar_x, cy, int(bar_w * self.loader.progress), bar_h))
+        pygame.draw.rect(pantalla, (255, 255, 255), (bar_x, cy, bar_w, bar_h), 2)
+
+        detalle = f"{self.loader.completed}/{len(self.loader.jobs)}  {self.loader.current_name}"
+        texto = text_cache.render(self.game.fuente_mini, detalle, True, (180, 180, 200))
+        pantalla.blit(texto, (cx - texto.get_width() // 2, cy + 35))
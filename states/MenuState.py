@@ -1,6 +1,9 @@
 from states.State import State
 from ui.menu_classes import Button
+from systems.asset_cache import asset_cache
 import pygame
+from ui.text_cache import text_cache
+from ui.dirty_rects import DirtyRegionTracker
 
 class MenuState(State):
     def enter(self):
@@ -10,16 +13,16 @@ class MenuState(State):
         self.btn_opciones = Button(cx - 100, 350, 200, 50, "OPCIONES", self.game.fuente_chica)
         self.btn_salir = Button(cx - 100, 420, 200, 50, "SALIR", self.game.fuente_chica, (120, 50, 50), (180, 70, 70))
         self.botones = [self.btn_jugar, self.btn_opciones, self.btn_salir]
+        self.dirty_regions = DirtyRegionTracker()
 
 
         self.game.audio.stop_music(0)
 
         try:
-            self.background = pygame.image.load("assets/backgrounds/menu_bg.jpg").convert()
-            # Escalar al tamaño de la pantalla
-            self.background = pygame.transform.scale(
-                self.background, 
-                (self.game.pantalla.get_width(), self.game.pantalla.get_height())
+            # Escalado al tamaño de la pantalla (compartido vía caché)
+            self.background = asset_cache.load_screen_image(
+                "assets/backgrounds/menu_bg.jpg",
+                alpha=False
             )
         except Exception as e:
             print(f"WARNING: No se pudo cargar background: {e}")
@@ -32,7 +35,7 @@ class MenuState(State):
     def handle_events(self, eventos):
      for e in eventos:
         if self.btn_jugar.clicked(e):
-            self.game.change_state("jugando")
+            self.game.change_state("cargando")
         elif self.btn_opciones.clicked(e):
             self.game.change_state("opciones")
         elif self.btn_salir.clicked(e):
@@ -44,14 +47,18 @@ class MenuState(State):
             btn.update(mouse_pos)
             
     def draw(self, pantalla):
-
+        # Pantalla quieta: solo se repintan los botones que cambiaron
+        if not self.dirty_regions.needs_full_redraw(pantalla):
+            return self.dirty_regions.redraw_widgets(pantalla, self.botones)
 
         if self.background:
             pantalla.blit(self.background, (0, 0))
         else:
             # Fallback: color sólido
             pantalla.fill((30, 40, 60))
-        titulo = self.game.fuente_grande.render("SETUP WIZARD", True, (0, 0, 0))
+        titulo = text_cache.render(self.game.fuente_grande, "SETUP WIZARD", True, (0, 0, 0))
         pantalla.blit(titulo, (pantalla.get_width()//2 - titulo.get_width()//2, 100))
+        self.dirty_regions.save_backdrop(pantalla)
+        
         for btn in self.botones:
             btn.draw(pantalla)
\ No newline at end of file
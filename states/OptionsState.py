@@ -1,6 +1,9 @@
 from ui.menu_classes import Slider, Selector, Button
 from states.State import State
 import pygame
+from ui.text_cache import text_cache
+from ui.dirty_rects import DirtyRegionTracker
+from config.screen import RENDER_SCALES
 
 class OptionsState(State):
     def enter(self):
@@ -18,7 +21,17 @@ class OptionsState(State):
         self.selector_gestos = Selector(cx - 120, 380, 240, 40, ["DESACTIVADO", "ACTIVADO"], 
                                        1 if self.game.gestos_activos else 0, self.game.fuente_chica)
         
-        self.btn_volver = Button(cx - 100, 480, 200, 50, "VOLVER", self.game.fuente_chica)
+        # Escala de render interno de la partida
+        self.escalas = [f"{int(escala * 100)}%" for escala in RENDER_SCALES]
+        indice = RENDER_SCALES.index(self.game.render_scale) if self.game.render_scale in RENDER_SCALES else len(RENDER_SCALES) - 1
+        self.selector_escala = Selector(cx - 120, 460, 240, 40, self.escalas, indice, self.game.fuente_chica)
+        
+        self.btn_volver = Button(cx - 100, 540, 200, 50, "VOLVER", self.game.fuente_chica)
+        
+        self.widgets = [self.slider_volumen, self.selector_res, self.selector_gestos,
+                        self.selector_escala, self.btn_volver]
+        self.dirty_regions = DirtyRegionTracker()
+        self._vol_label_rect = None
         
     def exit(self):
         print("Saliendo de opciones")
@@ -32,6 +45,8 @@ class OptionsState(State):
                 self.enter()
             if self.selector_gestos.handle_event(e):
                 self.game.gestos_activos = (self.selector_gestos.get_valor() == "ACTIVADO")
+            if self.selector_escala.handle_event(e):
+                self.game.set_render_scale(RENDER_SCALES[self.selector_escala.indice])
             if self.btn_volver.clicked(e):
                 self.game.audio.set_music_volume(self.slider_volumen.valor)
                 self.game.change_state("menu")
@@ -43,19 +58,41 @@ class OptionsState(State):
         self.btn_volver.update(pygame.mouse.get_pos())
         
     def draw(self, pantalla):
+        tracker = self.dirty_regions
+        if not tracker.needs_full_redraw(pantalla):
+            # Solo lo que cambió: la etiqueta del volumen sigue al slider
+            rects = []
+            if self.slider_volumen.dirty:
+                rects.append(self._draw_volume_label(pantalla))
+            rects += tracker.redraw_widgets(pantalla, self.widgets)
+            return rects
+        
         pantalla.fill((30, 30, 30))
-        titulo = self.game.fuente_grande.render("OPCIONES", True, (255, 255, 255))
+        titulo = text_cache.render(self.game.fuente_grande, "OPCIONES", True, (255, 255, 255))
         pantalla.blit(titulo, (pantalla.get_width()//2 - titulo.get_width()//2, 80))
         
-        lbl_vol = self.game.fuente_chica.render(f"Volumen: {int(self.slider_volumen.valor * 100)}%", True, (255, 255, 255))
-        lbl_res = self.game.fuente_chica.render("Resolución:", True, (255, 255, 255))
-        lbl_gestos = self.game.fuente_chica.render("Control por Gestos:", True, (255, 255, 255))
+        lbl_res = text_cache.render(self.game.fuente_chica, "Resolución:", True, (255, 255, 255))
+        lbl_gestos = text_cache.render(self.game.fuente_chica, "Control por Gestos:", True, (255, 255, 255))
+        lbl_escala = text_cache.render(self.game.fuente_chica, "Escala de Render:", True, (255, 255, 255))
         
-        pantalla.blit(lbl_vol, (pantalla.get_width()//2 - lbl_vol.get_width()//2, 165))
         pantalla.blit(lbl_res, (pantalla.get_width()//2 - lbl_res.get_width()//2, 265))
         pantalla.blit(lbl_gestos, (pantalla.get_width()//2 - lbl_gestos.get_width()//2, 345))
+        pantalla.blit(lbl_escala, (pantalla.get_width()//2 - lbl_escala.get_width()//2, 425))
+        tracker.save_backdrop(pantalla)
+        
+        self._vol_label_rect = None
+        self._draw_volume_label(pantalla)
+        for widget in self.widgets:
+            widget.draw(pantalla)
+    
+    def _draw_volume_label(self, pantalla):
+        """Dibuja la etiqueta del volumen y retorna el área que tocó"""
+        lbl_vol = text_cache.render(self.game.fuente_chica, f"Volumen: {int(self.slider_volumen.valor * 100)}%", True, (255, 255, 255))
+        rect = lbl_vol.get_rect(midtop=(pantalla.get_width()//2, 165))
         
-        self.slider_volumen.draw(pantalla)
-        self.selector_res.draw(pantalla)
-        self.selector_gestos.draw(pantalla)
-        self.btn_volver.draw(pantalla)
+        # El texto anterior puede ser más ancho que el nuevo
+        area = rect.union(self._vol_label_rect) if self._vol_label_rect else rect
+        area = self.dirty_regions.restore(pantalla, area)
+        pantalla.blit(lbl_vol, rect)
+        self._vol_label_rect = rect
+        return area
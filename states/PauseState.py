@@ -2,6 +2,9 @@ from states.State import State
 from ui.menu_classes import Button
 import pygame
 from systems.audio_manager import AudioManager
+from ui.text_cache import text_cache
+from ui.dirty_rects import DirtyRegionTracker
+from systems.screen_effects import screen_effects
 
 class PauseState(State):
     def enter(self):
@@ -10,6 +13,10 @@ class PauseState(State):
         self.btn_continuar = Button(cx - 100, 280, 200, 50, "CONTINUAR", self.game.fuente_chica)
         self.btn_menu = Button(cx - 100, 350, 200, 50, "MENÚ", self.game.fuente_chica, (120, 50, 50), (180, 70, 70))
         self.botones = [self.btn_continuar, self.btn_menu]
+        self.dirty_regions = DirtyRegionTracker()
+        
+        # Último frame de la partida, oscurecido una sola vez
+        self.snapshot = screen_effects.snapshot(self.game.pantalla, 150)
         self.game.audio.pause_music()
 
         
@@ -39,12 +46,15 @@ class PauseState(State):
             btn.update(mouse_pos)
             
     def draw(self, pantalla):
-        overlay = pygame.Surface(pantalla.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        pantalla.blit(overlay, (0, 0))
+        tracker = self.dirty_regions
+        if not tracker.needs_full_redraw(pantalla):
+            return tracker.redraw_widgets(pantalla, self.botones)
         
-        texto = self.game.fuente_grande.render("PAUSA", True, (255, 255, 255))
+        # El oscurecido ya está en la instantánea: redibujar no lo acumula
+        pantalla.blit(self.snapshot, (0, 0))
+        texto = text_cache.render(self.game.fuente_grande, "PAUSA", True, (255, 255, 255))
         pantalla.blit(texto, (pantalla.get_width()//2 - texto.get_width()//2, 180))
+        tracker.save_backdrop(pantalla)
         
         for btn in self.botones:
             btn.draw(pantalla)
@@ -1,23 +1,48 @@
 from states.State import State
 import pygame
-from config.enums import Element
+from config.enums import Element, SpellType
 from systems.spell_system import SpellSystem
 from systems.circle import CircleManager
 from systems.spell_creator import SpellCastingSystem
-from systems.animation import AnimationController, Animation, load_animation_frames, create_placeholder_frames
-from entities.enemies import EnemyManager, EnemyType
+from systems.animation import (AnimationController, Animation, animation_clock, load_animation_frames,
+                               create_placeholder_frames, animation_frame_requests)
+from entities.enemies import EnemyManager, EnemyType, load_enemy_frames, enemy_frame_requests
+from systems.projectile import get_spell_frames, spell_frame_requests
 from systems.wave_manager import WaveManager
 from systems.audio_manager import MusicTrack, SoundEffect
 from ui.game_hud import GameHUD
 from systems.combat_system import CombatSystem
 from systems.player_controller import PlayerController
+from systems.asset_cache import asset_cache
+from systems.asset_manifest import asset_manifest
 import time
-from parallax import ParallaxLayer  
+from systems.render_queue import RenderQueue, RenderLayer
+from systems.screen_effects import screen_effects
+from systems.particles import ParticleSystem, make_spark_sprite
+from systems.quality_governor import quality_governor
+from config.screen import LOGICAL_SIZE
+from parallax import build_parallax_layers
 
 
 class PlayingState(State):
     """Estado principal del juego - Completamente refactorizado"""
     
+    # Capas de fondo parallax: (ruta, velocidad en píxeles por segundo)
+    BACKGROUND_LAYERS = [
+        ("assets/backgrounds/sprite.fondo1.png", 0),     # estática
+        ("assets/backgrounds/sprite.fondo2.png", 60),    # derecha → izquierda
+        ("assets/backgrounds/sprite.fondo3.png", -60),   # izquierda → derecha
+        ("assets/backgrounds/sprite.fondo4.png", 120),   # más rápida
+        ("assets/backgrounds/sprite.fondo5.png", -120),  # más rápida en reversa
+        ("assets/backgrounds/sprite.fondo6.png", 0),   # estática
+        ("assets/backgrounds/sprite.fondo7.png", 0),   # estática
+        ("assets/backgrounds/sprite.fondo8.png", 0),   # estática
+    ]
+    
+    PLAYER_SIZE = (100, 100)
+    PRINCESS_SIZE = (100, 100)
+    PLAYER_ELEMENTS = ["fuego", "hielo", "rayo", "tierra", "agua", "neutral"]
+    
     def __init__(self, game):
         """Inicialización única del estado"""
         super().__init__(game)
@@ -52,10 +77,19 @@ class PlayingState(State):
         self.princess_x = 50
         self.princess_y = 200
 
+        # === RENDERIZADO ===
+        # Cada partida parte del nivel de calidad más alto (sin mediciones viejas)
+        quality_governor.reset()
+        self.game.set_render_scale(self.game.render_scale)
+        self.render_queue = RenderQueue()
+        self._fallback_sprites = {}
+        self.particles = ParticleSystem(gravity=600)  # Chispas e impactos
+
         # === CARGAR RECURSOS ===
         self._load_background()
         self._load_player_animations()
         self._load_princess_animation()
+        self._preload_sprites()
 
         # === SISTEMAS DE HECHIZOS ===
         self.spell_system = SpellSystem(projectile_pool_size=50, area_pool_size=30)
@@ -118,26 +152,16 @@ class PlayingState(State):
     
    
     def _load_background(self):
-        pantalla = self.game.pantalla
 
-    # Capas de fondo (parallax)
-        self.layers = [
-         ParallaxLayer("assets/backgrounds/sprite.fondo1.png", 0, pantalla),   # estática
-         ParallaxLayer("assets/backgrounds/sprite.fondo2.png", 1, pantalla),   # derecha → izquierda
-         ParallaxLayer("assets/backgrounds/sprite.fondo3.png", -1, pantalla),  # izquierda → derecha
-         ParallaxLayer("assets/backgrounds/sprite.fondo4.png", 2, pantalla),   # más rápida
-         ParallaxLayer("assets/backgrounds/sprite.fondo5.png", -2, pantalla),  # más rápida en reversa
-         ParallaxLayer("assets/backgrounds/sprite.fondo6.png", 0, pantalla),   # estática
-         ParallaxLayer("assets/backgrounds/sprite.fondo7.png", 0, pantalla),   # estática
-         ParallaxLayer("assets/backgrounds/sprite.fondo8.png", 0, pantalla),   # estática
-    ]
+    # Capas de fondo (parallax); las estáticas se aplanan en una sola
+        self.layers = build_parallax_layers(self.BACKGROUND_LAYERS, LOGICAL_SIZE)
 
             
     
     def _load_player_animations(self):
         """Carga todas las animaciones del jugador"""
         self.player_anim = AnimationController()
-        player_size = (100, 100)
+        player_size = self.PLAYER_SIZE
         
         try:
             # ANIMACIÓN IDLE
@@ -151,13 +175,10 @@ class PlayingState(State):
             self.player_anim.add_animation("idle", idle_anim)
             
             # ANIMACIONES DE ATAQUE
-            elementos = ["fuego", "hielo", "rayo", "tierra", "agua", "neutral"]
-            
-            for elemento in elementos:
+            for elemento in self.PLAYER_ELEMENTS:
                 try:
                     frame_path = f"assets/sprites/player/{elemento}.png"
-                    frame = pygame.image.load(frame_path).convert_alpha()
-                    frame = pygame.transform.scale(frame, player_size)
+                    frame = asset_cache.load_image(frame_path, player_size, packed=True)
                     
                     attack_frames = [frame] * 3
                     attack_anim = Animation(attack_frames, frame_duration=0.1, loop=False)
@@ -187,7 +208,7 @@ class PlayingState(State):
             idle_anim = Animation(idle_frames, frame_duration=0.5, loop=True)
             self.player_anim.add_animation("idle", idle_anim)
             
-            for elemento in ["fuego", "hielo", "rayo", "tierra", "agua", "neutral"]:
+            for elemento in self.PLAYER_ELEMENTS:
                 frames = create_placeholder_frames(3, player_size, (255, 100, 100))
                 anim = Animation(frames, frame_duration=0.1, loop=False)
                 self.player_anim.add_animation(f"cast_{elemento}", anim)
@@ -195,7 +216,7 @@ class PlayingState(State):
     def _load_princess_animation(self):
         """Carga animación de la princesa"""
         self.princess_anim = AnimationController()
-        princess_size = (100, 100)
+        princess_size = self.PRINCESS_SIZE
         try:
             idle_frames = load_animation_frames(
                 "assets/sprites/princess",
@@ -208,6 +229,36 @@ class PlayingState(State):
         except Exception as e:
             print(f"ERROR: No se pudieron cargar animaciones de la princesa: {e}")
             
+    def get_asset_requests(self) -> list:
+        """
+        Imágenes que necesita _initialize_game, para que el LoadingState las
+        decodifique en paralelo antes de entrar al estado.
+        
+        Returns:
+            Lista de (ruta, escala, alpha, packed) con los argumentos de asset_cache.load_image
+        """
+        requests = [(ruta, LOGICAL_SIZE, True, False) for ruta, _ in self.BACKGROUND_LAYERS]
+        
+        sprites = animation_frame_requests("assets/sprites/player", "idle_", 2, self.PLAYER_SIZE)
+        sprites += [(f"assets/sprites/player/{elemento}.png", self.PLAYER_SIZE)
+                    for elemento in self.PLAYER_ELEMENTS]
+        sprites += animation_frame_requests("assets/sprites/princess", "idle_", 2, self.PRINCESS_SIZE)
+        for enemy_type in EnemyType:
+            sprites += enemy_frame_requests(enemy_type)
+        for spell_type in SpellType:
+            sprites += spell_frame_requests(spell_type)
+        
+        requests += [(path, scale, True, True) for path, scale in sprites
+                     if asset_manifest.exists(path)]
+        return requests
+    
+    def _preload_sprites(self):
+        """Prepara (atlas y procedurales) los sprites de enemigos y hechizos antes de jugar"""
+        for enemy_type in EnemyType:
+            load_enemy_frames(enemy_type)
+        for spell_type in SpellType:
+            get_spell_frames(spell_type)
+            
     def exit(self):
         """Limpieza al salir del estado"""
         print("Saliendo de partida")
@@ -242,12 +293,19 @@ class PlayingState(State):
                     
     def update(self, dt):
         """Actualización principal del juego"""
+        # Un solo avance de reloj para todas las animaciones
+        animation_clock.tick(dt)
+        
+        # Calidad adaptativa según el tiempo de trabajo del frame anterior
+        if quality_governor.record(self.game.clock.get_rawtime()):
+            self.game.set_render_scale(self.game.render_scale)
+        self.particles.density = quality_governor.tier.densidad_particulas
+        
         # Actualizar fondo por capas
         for layer in self.layers:
-           layer.update()
+           layer.update(dt)
 
-        # Actualizar animaciones
-        self.princess_anim.update(dt)
+        # Animaciones: el frame sale del reloj al dibujar; aquí solo las transiciones
         self.player_controller.update(dt)
         
         # Actualizar sistemas de hechizos
@@ -271,6 +329,7 @@ class PlayingState(State):
         # Actualizar oleadas y enemigos
         self.wave_manager.update(dt)
         self.enemy_manager.update(dt)
+        self.particles.update(dt)
 
         # ✨ Actualizar sistema de combate (colisiones)
         combat_stats = self.combat.update(dt)
@@ -299,60 +358,65 @@ class PlayingState(State):
             self._trigger_game_over()
     
     def draw(self, pantalla):
-        """Renderizado principal del juego"""
-        # Dibujar fondo por capas
+        """
+        Renderizado principal del juego (el orden lo definen las capas).
+        Se dibuja en coordenadas lógicas sobre el lienzo del mundo, que
+        luego se escala a la ventana.
+        """
+        queue = self.render_queue
+        canvas = self.game.canvas
+        
+        # Fondo por capas (las que se mueven, según el nivel de calidad)
+        moving = quality_governor.tier.capas_parallax
         for layer in self.layers:
-         layer.draw()
-
+            if layer.velocidad != 0:
+                if moving <= 0:
+                    continue
+                moving -= 1
+            layer.submit(queue)
 
         # Flash de daño (si existe)
         if hasattr(self, 'damage_flash_timer') and self.damage_flash_timer > 0:
-            flash_overlay = pygame.Surface(pantalla.get_size(), pygame.SRCALPHA)
             alpha = int(150 * (self.damage_flash_timer / 0.3))
-            flash_overlay.fill((255, 0, 0, alpha))
-            pantalla.blit(flash_overlay, (0, 0))
-        
-        # Efectos de área (atrás)
-        self.spell_system.draw(pantalla)
+            queue.submit(screen_effects.solid(LOGICAL_SIZE, (255, 0, 0)), (0, 0),
+                         RenderLayer.SCREEN_FX, alpha=alpha)
         
-        # Círculos mágicos
-        self.spell_casting.draw(pantalla)
+        # Efectos de área, proyectiles y círculos mágicos
+        self.spell_system.submit(queue)
+        self.spell_casting.submit(queue)
 
-        # Princesa
-        self._draw_princess(pantalla)
+        # Princesa y jugador
+        self._submit_character(self.princess_anim, self.princess_x, self.princess_y,
+                               (255, 200, 255))
+        self._submit_character(self.player_anim, self.player_x, self.player_y,
+                               (100, 200, 255))
         
-        # Jugador
-        self._draw_player(pantalla)
-        
-        # Enemigos
-        self.enemy_manager.draw(pantalla)
+        # Enemigos (con barras de HP e iconos) y partículas
+        self.enemy_manager.submit(queue)
+        self.particles.submit(queue, RenderLayer.PARTICLES)
 
-        # UI
-        self.hud.draw(pantalla, self)
+        
+        # Mundo a la ventana (según el backend); la UI encima, sin pasar por la escala de render
+        self.game.backend.draw_world(pantalla, queue, canvas,
+                                     overlay=lambda screen, retained=False:
+                                         self.hud.draw(screen, self, retained))
     
-    def _draw_player(self, pantalla):
-        """Dibuja al jugador"""
-        frame = self.player_anim.get_current_frame()
-        if frame:
-            rect = frame.get_rect(center=(int(self.player_x), int(self.player_y)))
-            pantalla.blit(frame, rect)
-        else:
-            pygame.draw.circle(pantalla, (100, 200, 255), 
-                              (int(self.player_x), int(self.player_y)), 25)
-            pygame.draw.circle(pantalla, (255, 255, 255), 
-                              (int(self.player_x), int(self.player_y)), 25, 3)
+    def _submit_character(self, anim, x, y, color):
+        """Encola el frame actual de un personaje (o su marcador procedural)"""
+        frame = anim.get_current_frame()
+        if not frame:
+            frame = self._get_fallback_sprite(color)
+        self.render_queue.submit_centered(frame, (x, y), RenderLayer.CHARACTERS)
     
-    def _draw_princess(self, pantalla):
-        """Dibuja a la princesa"""
-        frame = self.princess_anim.get_current_frame()
-        if frame:
-            rect = frame.get_rect(center=(int(self.princess_x), int(self.princess_y)))
-            pantalla.blit(frame, rect)
-        else:
-            pygame.draw.circle(pantalla, (255, 200, 255), 
-                              (int(self.princess_x), int(self.princess_y)), 25)
-            pygame.draw.circle(pantalla, (255, 255, 255), 
-                              (int(self.princess_x), int(self.princess_y)), 25, 3)
+    def _get_fallback_sprite(self, color):
+        """Círculo con borde para personajes sin frames (creado una vez por color)"""
+        sprite = self._fallback_sprites.get(color)
+        if sprite is None:
+            sprite = pygame.Surface((51, 51), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (25, 25), 25)
+            pygame.draw.circle(sprite, (255, 255, 255), (25, 25), 25, 3)
+            self._fallback_sprites[color] = sprite
+        return sprite
     
     # === CALLBACKS ===
     
@@ -367,11 +431,32 @@ class PlayingState(State):
     
     def _on_projectile_hit(self, projectile, enemy):
         """Callback cuando un proyectil impacta"""
-        pass
+        spell_data = projectile.state.spell_data
+        if spell_data is None:
+            return
+        
+        # Chispas del color del hechizo (y del secundario si es combo)
+        x, y = enemy.x, enemy.y
+        self.particles.emit_burst(self._spark_kind(spell_data.color_primario), x, y,
+                                  count=10, speed=(80, 260), life=(0.2, 0.45))
+        if spell_data.color_secundario:
+            self.particles.emit_burst(self._spark_kind(spell_data.color_secundario), x, y,
+                                      count=5, speed=(40, 160), life=(0.2, 0.4))
     
     def _on_area_hit(self, area_effect, enemy):
         """Callback cuando un efecto de área afecta a un enemigo"""
-        pass
+        spell_data = area_effect.state.spell_data
+        if spell_data is None:
+            return
+        
+        # Pequeño impacto hacia arriba desde los pies del enemigo
+        self.particles.emit_burst(self._spark_kind(spell_data.color_primario),
+                                  enemy.x, enemy.y, count=4, speed=(60, 140),
+                                  life=(0.25, 0.4), direction=90, spread=70)
+    
+    def _spark_kind(self, color):
+        """Tipo de partícula de chispa para un color (se pre-rota una vez)"""
+        return self.particles.get_kind(("chispa", color), lambda: make_spark_sprite(color))
 
     def _on_wave_start(self, wave_number):
         """Callback cuando inicia una oleada"""
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 
 class State(ABC):
+    # Estados que dibujan por rectángulos sucios guardan aquí su
+    # DirtyRegionTracker (ver ui/dirty_rects.py)
+    dirty_regions = None
+    
     def __init__(self, game):
         self.game = game
         
@@ -22,4 +26,13 @@ class State(ABC):
         
     @abstractmethod
     def draw(self, pantalla):
-        pass
\ No newline at end of file
+        """
+        Dibuja el estado. Retorna None para actualizar la pantalla completa,
+        o una lista de rectángulos para pygame.display.update().
+        """
+        pass
+        
+    def invalidate(self):
+        """Fuerza un redibujado completo (la ventana se expuso o restauró)"""
+        if self.dirty_regions is not None:
+            self.dirty_regions.invalidate()
@@ -6,14 +6,32 @@ from states.State import State
 from ui.menu_classes import Button
 import pygame
 from systems.audio_manager import MusicTrack, SoundEffect
+from systems.asset_cache import asset_cache
+from ui.text_cache import text_cache
+from ui.dirty_rects import DirtyRegionTracker
+from systems.screen_effects import screen_effects
+from systems.particles import ParticleSystem, make_confetti_sprite
+import numpy as np
 
 
 class VictoryState(State):
     """Pantalla de victoria con estadísticas y opciones"""
     
+    # Confeti
+    CONFETTI_COUNT = 50
+    CONFETTI_COLORS = [
+        (255, 215, 0),   # Dorado
+        (255, 100, 100), # Rojo
+        (100, 255, 100), # Verde
+        (100, 100, 255), # Azul
+        (255, 255, 100), # Amarillo
+    ]
+    CONFETTI_SIZES = range(4, 9)
+    
     def __init__(self, game):
         super().__init__(game)
         self.stats = {}
+        self.particles = None  # Se crea en el primer enter() (sprites pre-rotados)
         
     def enter(self):
         """Inicializa la pantalla de victoria"""
@@ -33,10 +51,9 @@ class VictoryState(State):
         
         # Cargar fondo
         try:
-            self.background = pygame.image.load("assets/backgrounds/victory_bg.jpg").convert()
-            self.background = pygame.transform.scale(
-                self.background, 
-                (self.game.pantalla.get_width(), self.game.pantalla.get_height())
+            self.background = asset_cache.load_screen_image(
+                "assets/backgrounds/victory_bg.jpg",
+                alpha=False
             )
         except Exception as e:
             print(f"WARNING: No se pudo cargar background de victoria: {e}")
@@ -68,6 +85,7 @@ class VictoryState(State):
         )
         
         self.botones = [self.btn_jugar_de_nuevo, self.btn_menu]
+        self.dirty_regions = DirtyRegionTracker()
         
         # Animación de título
         self.title_scale = 0.0
@@ -80,7 +98,10 @@ class VictoryState(State):
         self.stats_timer = 0
         
         # Partículas de celebración (opcional)
-        self.particles = []
+        if self.particles is None:
+            self.particles = ParticleSystem(capacity=1024, gravity=400)
+        self.particles.bounds = self.game.pantalla.get_size()
+        self.particles.clear()
         self._create_celebration_particles()
     
     def set_stats(self, stats_dict):
@@ -143,6 +164,11 @@ class VictoryState(State):
     
     def draw(self, pantalla):
         """Renderiza la pantalla de victoria"""
+        # Terminada la animación de entrada solo cambian los botones
+        animating = self._is_animating()
+        if not animating and not self.dirty_regions.needs_full_redraw(pantalla):
+            return self.dirty_regions.redraw_widgets(pantalla, self.botones)
+        
         # Fondo
         if self.background:
             pantalla.blit(self.background, (0, 0))
@@ -158,9 +184,7 @@ class VictoryState(State):
                 pygame.draw.line(pantalla, color, (0, y), (pantalla.get_width(), y))
         
         # Overlay oscuro semi-transparente
-        overlay = pygame.Surface(pantalla.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        pantalla.blit(overlay, (0, 0))
+        screen_effects.dim(pantalla, 100)
         
         # Dibujar partículas de celebración
         self._draw_particles(pantalla)
@@ -172,38 +196,49 @@ class VictoryState(State):
         if self.stats_alpha > 0:
             self._draw_stats(pantalla)
         
-        # Botones
-        for btn in self.botones:
-            btn.draw(pantalla)
-        
         # Hint en la parte inferior
-        hint_text = self.game.fuente_mini.render(
+        hint_text = text_cache.render(
+            self.game.fuente_mini,
             "Presiona ENTER para jugar de nuevo o ESC para volver al menú",
             True,
             (200, 200, 200)
         )
         hint_x = pantalla.get_width() // 2 - hint_text.get_width() // 2
         pantalla.blit(hint_text, (hint_x, pantalla.get_height() - 40))
+        
+        if not animating:
+            self.dirty_regions.save_backdrop(pantalla)
+        
+        # Botones
+        for btn in self.botones:
+            btn.draw(pantalla)
+    
+    def _is_animating(self):
+        """True mientras dura la animación de entrada (título, stats, confeti)"""
+        return (self.title_scale < self.title_target
+                or self.stats_alpha < 255
+                or self.particles.count > 0)
     
     def _draw_title(self, pantalla):
         """Dibuja el título animado"""
         # Texto principal
         title_text = "¡VICTORIA!"
-        title_font = pygame.font.Font(None, int(100 * self.title_scale))
+        title_font = text_cache.get_font(int(100 * self.title_scale))
         
         # Sombra
-        shadow = title_font.render(title_text, True, (0, 0, 0))
+        shadow = text_cache.render(title_font, title_text, True, (0, 0, 0))
         shadow_rect = shadow.get_rect(center=(pantalla.get_width() // 2 + 4, 104))
         pantalla.blit(shadow, shadow_rect)
         
         # Texto principal con color dorado
-        title = title_font.render(title_text, True, (255, 215, 0))
+        title = text_cache.render(title_font, title_text, True, (255, 215, 0))
         title_rect = title.get_rect(center=(pantalla.get_width() // 2, 100))
         pantalla.blit(title, title_rect)
         
         # Subtítulo
         if self.title_scale >= 1.0:
-            subtitle = self.game.fuente_chica.render(
+            subtitle = text_cache.render(
+                self.game.fuente_chica,
                 "Has completado todas las oleadas",
                 True,
                 (200, 200, 200)
@@ -225,7 +260,7 @@ class VictoryState(State):
         pygame.draw.rect(stats_surface, (255, 215, 0, 200), (0, 0, 600, 250), 3, border_radius=15)
         
         # Título de estadísticas
-        stats_title = self.game.fuente_chica.render("Estadísticas", True, (255, 215, 0))
+        stats_title = text_cache.render(self.game.fuente_chica, "Estadísticas", True, (255, 215, 0))
         stats_surface.blit(stats_title, (300 - stats_title.get_width() // 2, 15))
         
         # Línea separadora
@@ -241,11 +276,11 @@ class VictoryState(State):
         y_offset = 70
         for label, value, color in stats_to_show:
             # Label
-            label_text = self.game.fuente_chica.render(label + ":", True, (200, 200, 200))
+            label_text = text_cache.render(self.game.fuente_chica, label + ":", True, (200, 200, 200))
             stats_surface.blit(label_text, (50, y_offset))
             
             # Valor
-            value_text = self.game.fuente_chica.render(str(value), True, color)
+            value_text = text_cache.render(self.game.fuente_chica, str(value), True, color)
             stats_surface.blit(value_text, (500 - value_text.get_width(), y_offset))
             
             y_offset += 45
@@ -256,55 +291,34 @@ class VictoryState(State):
     
     def _create_celebration_particles(self):
         """Crea partículas de celebración (confeti)"""
-        import random
-        
+        particles = self.particles
+        kinds = np.array([
+            particles.get_kind(("confeti", color, size),
+                               lambda c=color, sz=size: make_confetti_sprite(c, sz),
+                               fade=False)
+            for color in self.CONFETTI_COLORS
+            for size in self.CONFETTI_SIZES
+        ])
+        
+        n = self.CONFETTI_COUNT
         screen_width = self.game.pantalla.get_width()
-        colors = [
-            (255, 215, 0),   # Dorado
-            (255, 100, 100), # Rojo
-            (100, 255, 100), # Verde
-            (100, 100, 255), # Azul
-            (255, 255, 100), # Amarillo
-        ]
-        
-        for _ in range(50):
-            self.particles.append({
-                'x': random.randint(0, screen_width),
-                'y': random.randint(-100, 0),
-                'vx': random.uniform(-50, 50),
-                'vy': random.uniform(100, 300),
-                'size': random.randint(4, 8),
-                'color': random.choice(colors),
-                'rotation': random.uniform(0, 360),
-                'rotation_speed': random.uniform(-200, 200)
-            })
+        particles.spawn(
+            np.random.choice(kinds, n),
+            x=np.random.uniform(0, screen_width, n),
+            y=np.random.uniform(-100, 0, n),
+            vx=np.random.uniform(-50, 50, n),
+            vy=np.random.uniform(100, 300, n),
+            angle=np.random.uniform(0, 360, n),
+            spin=np.random.uniform(-200, 200, n)
+        )
     
     def _update_particles(self, dt):
         """Actualiza las partículas de confeti"""
-        screen_height = self.game.pantalla.get_height()
-        
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            particle['vy'] += 400 * dt  # Gravedad
-            particle['rotation'] += particle['rotation_speed'] * dt
-            
-            # Remover si sale de la pantalla
-            if particle['y'] > screen_height + 50:
-                self.particles.remove(particle)
+        self.particles.update(dt)
     
     def _draw_particles(self, pantalla):
         """Dibuja las partículas de confeti"""
-        for particle in self.particles:
-            # Dibujar rectángulo rotado (confeti)
-            size = particle['size']
-            rect_surface = pygame.Surface((size, size * 2), pygame.SRCALPHA)
-            pygame.draw.rect(rect_surface, particle['color'], (0, 0, size, size * 2))
-            
-            # Rotar
-            rotated = pygame.transform.rotate(rect_surface, particle['rotation'])
-            rect = rotated.get_rect(center=(int(particle['x']), int(particle['y'])))
-            pantalla.blit(rotated, rect)
+        self.particles.draw(pantalla)
     
     def _restart_game(self):
         """Reinicia el juego"""
@@ -3,4 +3,5 @@ from .OptionsState import OptionsState
 from .PlayingState import PlayingState
 from .PauseState import PauseState
 from .VictoryState import VictoryState
-from .GameOverState import GameOverState  
\ No newline at end of file
+from .GameOverState import GameOverState
+from .LoadingState import LoadingState  
\ No newline at end of file
@@ -1,47 +1,67 @@
 import pygame
 from typing import List, Optional
 
+from systems.asset_cache import asset_cache
+from systems.asset_manifest import asset_manifest
+
+
+class AnimationClock:
+    """
+    Reloj de animación compartido.
+    
+    Se avanza una sola vez por frame (PlayingState.update); cada entidad
+    guarda solo el instante en que empezó su animación y calcula el frame
+    al dibujarse. Las entidades que no se dibujan no cuestan nada.
+    """
+    
+    def __init__(self):
+        self.time = 0.0
+    
+    def tick(self, dt: float):
+        """Avanza el reloj (una vez por frame)"""
+        self.time += dt
+    
+    def elapsed(self, start: float) -> float:
+        """Segundos transcurridos desde start (un valor previo de self.time)"""
+        return self.time - start
+
+
+# Reloj compartido por todas las animaciones de la partida
+animation_clock = AnimationClock()
+
 
 class Animation:
     """
     Maneja una animación de sprites.
     Soporta múltiples frames con velocidad configurable.
+    
+    El frame actual se deriva del reloj compartido al pedirlo, no hay que
+    llamar a update() cada frame.
     """
     
-    def __init__(self, frames: List[pygame.Surface], frame_duration: float = 0.1, loop: bool = True):
+    def __init__(self, frames: List[pygame.Surface], frame_duration: float = 0.1, loop: bool = True,
+                 clock: Optional[AnimationClock] = None):
         """
         Args:
             frames: Lista de superficies de pygame (los frames de la animación)
             frame_duration: Duración de cada frame en segundos
             loop: Si la animación debe repetirse al terminar
+            clock: Reloj a usar (por defecto, animation_clock)
         """
         self.frames = frames
         self.frame_duration = frame_duration
         self.loop = loop
         
-        self.current_frame = 0
-        self.time_accumulated = 0.0
-        self.finished = False
-        
-    def update(self, dt: float):
-        """Actualiza la animación"""
-        if self.finished and not self.loop:
-            return
-        
-        self.time_accumulated += dt
-        
-        # Avanzar frames si pasó suficiente tiempo
-        while self.time_accumulated >= self.frame_duration:
-            self.time_accumulated -= self.frame_duration
-            self.current_frame += 1
-            
-            # Si llegamos al final
-            if self.current_frame >= len(self.frames):
-                if self.loop:
-                    self.current_frame = 0
-                else:
-                    self.current_frame = len(self.frames) - 1
-                    self.finished = True
+        self.clock = clock or animation_clock
+        self.start_time = self.clock.time
+    
+    @property
+    def current_frame(self) -> int:
+        """Índice del frame actual según el reloj"""
+        index = int(self.clock.elapsed(self.start_time) / self.frame_duration)
+        if self.loop:
+            return index % len(self.frames)
+        return min(index, len(self.frames) - 1)
     
     def get_current_frame(self) -> pygame.Surface:
         """Retorna el frame actual"""
@@ -49,13 +69,13 @@ class Animation:
     
     def reset(self):
         """Reinicia la animación desde el principio"""
-        self.current_frame = 0
-        self.time_accumulated = 0.0
-        self.finished = False
+        self.start_time = self.clock.time
     
     def is_finished(self) -> bool:
         """Verifica si la animación terminó (solo relevante si loop=False)"""
-        return self.finished
+        if self.loop:
+            return False
+        return self.clock.elapsed(self.start_time) >= len(self.frames) * self.frame_duration
 
 
 class AnimationController:
@@ -99,11 +119,6 @@ class AnimationController:
         if reset:
             self.current_animation.reset()
     
-    def update(self, dt: float):
-        """Actualiza la animación actual"""
-        if self.current_animation:
-            self.current_animation.update(dt)
-    
     def get_current_frame(self) -> Optional[pygame.Surface]:
         """Retorna el frame actual de la animación activa"""
         if self.current_animation:
@@ -115,6 +130,38 @@ class AnimationController:
         return self.current_animation_name
 
 
+# Frames faltantes ya reportados (para avisar una sola vez por ruta)
+_reported_missing = set()
+
+
+def has_animation_frames(folder_path: str, prefix: str) -> bool:
+    """Verifica (O(1), vía manifiesto) si existe una animación en disco"""
+    return (asset_manifest.exists(f"{folder_path}/{prefix}0.png") or
+            asset_manifest.exists(f"{folder_path}/{prefix}sheet.png"))
+
+
+def animation_frame_requests(folder_path: str, prefix: str, num_frames: int,
+                             scale: tuple = None) -> List[tuple]:
+    """
+    Lista las imágenes que cargaría load_animation_frames con estos argumentos,
+    para precargarlas (ver AssetLoader).
+    
+    Returns:
+        Lista de (ruta, escala) de los archivos presentes en el manifiesto
+    """
+    sheet_path = f"{folder_path}/{prefix}sheet.png"
+    if asset_manifest.exists(sheet_path):
+        sheet_scale = (scale[0] * num_frames, scale[1]) if scale else None
+        return [(sheet_path, sheet_scale)]
+    
+    requests = []
+    for i in range(num_frames):
+        path = f"{folder_path}/{prefix}{i}.png"
+        if asset_manifest.exists(path):
+            requests.append((path, scale))
+    return requests
+
+
 def load_animation_frames(folder_path: str, prefix: str, num_frames: int, 
                           scale: tuple = None) -> List[pygame.Surface]:
     """
@@ -127,7 +174,8 @@ def load_animation_frames(folder_path: str, prefix: str, num_frames: int,
         scale: Tupla (ancho, alto) para escalar los sprites, o None
         
     Returns:
-        Lista de superficies cargadas
+        Lista de superficies cargadas (subsuperficies del atlas de sprites,
+        compartidas vía asset_cache: no modificar)
         
     Ejemplo de estructura:
         assets/sprites/player/
@@ -136,27 +184,84 @@ def load_animation_frames(folder_path: str, prefix: str, num_frames: int,
             idle_2.png
             cast_0.png
             cast_1.png
+    
+    También acepta una tira en un solo archivo ({prefix}sheet.png) con los
+    num_frames frames en una fila; si existe, tiene prioridad.
     """
+    sheet_path = f"{folder_path}/{prefix}sheet.png"
+    if asset_manifest.exists(sheet_path):
+        try:
+            return load_sprite_sheet(sheet_path, columns=num_frames, scale=scale)
+        except pygame.error as e:
+            print(f"WARNING: No se pudo cargar sprite sheet {sheet_path}: {e}")
+    
     frames = []
     
     for i in range(num_frames):
-        try:
-            path = f"{folder_path}/{prefix}{i}.png"
-            frame = pygame.image.load(path).convert_alpha()
-            
-            if scale:
-                frame = pygame.transform.scale(frame, scale)
-            
+        path = f"{folder_path}/{prefix}{i}.png"
+        frame = None
+        
+        # Consulta O(1) al manifiesto: los frames faltantes no tocan el disco
+        if asset_manifest.exists(path):
+            try:
+                frame = asset_cache.load_image(path, scale, packed=True)
+            except pygame.error as e:
+                error = e
+        else:
+            error = "archivo no encontrado"
+        
+        if frame is not None:
             frames.append(frame)
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"WARNING: No se pudo cargar frame {path}: {e}")
-            # Crear frame placeholder si falla
-            if scale:
-                placeholder = pygame.Surface(scale, pygame.SRCALPHA)
-            else:
-                placeholder = pygame.Surface((32, 32), pygame.SRCALPHA)
-            placeholder.fill((255, 0, 255, 128))  # Magenta semi-transparente
-            frames.append(placeholder)
+            continue
+        
+        if path not in _reported_missing:
+            _reported_missing.add(path)
+            print(f"WARNING: No se pudo cargar frame {path}: {error}")
+        
+        # Crear frame placeholder si falla
+        if scale:
+            placeholder = pygame.Surface(scale, pygame.SRCALPHA)
+        else:
+            placeholder = pygame.Surface((32, 32), pygame.SRCALPHA)
+        placeholder.fill((255, 0, 255, 128))  # Magenta semi-transparente
+        frames.append(placeholder)
+    
+    return frames
+
+
+def load_sprite_sheet(path: str, columns: int, rows: int = 1,
+                      num_frames: int = None, scale: tuple = None) -> List[pygame.Surface]:
+    """
+    Carga los frames de un sprite sheet con una cuadrícula regular.
+    
+    Args:
+        path: Ruta del archivo del sheet
+        columns: Número de columnas de la cuadrícula
+        rows: Número de filas de la cuadrícula
+        num_frames: Frames a usar (por defecto columns * rows), en orden de lectura
+        scale: Tupla (ancho, alto) de cada frame, o None para el tamaño original
+        
+    Returns:
+        Lista de subsuperficies del sheet (que a su vez vive en el atlas)
+        
+    Raises:
+        FileNotFoundError, pygame.error: Si el sheet no se puede cargar
+    """
+    if num_frames is None:
+        num_frames = columns * rows
+    
+    # Escalar el sheet completo para que cada celda mida "scale"
+    sheet_scale = (scale[0] * columns, scale[1] * rows) if scale else None
+    sheet = asset_cache.load_image(path, sheet_scale, packed=True)
+    
+    frame_w = sheet.get_width() // columns
+    frame_h = sheet.get_height() // rows
+    
+    frames = []
+    for i in range(num_frames):
+        col = i % columns
+        row = i // columns
+        frames.append(sheet.subsurface((col * frame_w, row * frame_h, frame_w, frame_h)))
     
     return frames
 
@@ -225,7 +330,8 @@ class Player:
         self.anim_controller.play("cast", reset=True)
     
     def update(self, dt):
-        self.anim_controller.update(dt)
+        # El frame sale de animation_clock (el estado llama a tick(dt) una vez
+        # por frame); aquí solo quedan las transiciones entre animaciones
         
         # Volver a idle cuando termine la animación de cast
         if self.anim_controller.get_current_animation_name() == "cast":
@@ -4,6 +4,12 @@ from dataclasses import dataclass, field
 
 from config.enums import SpellType, EffectType
 from config.spell_data import get_spell_data, SpellData
+from config.screen import LOGICAL_WIDTH, LOGICAL_HEIGHT
+from systems.asset_cache import asset_cache
+from systems.asset_manifest import asset_manifest
+from systems.render_queue import RenderLayer, RenderQueue
+from systems.quality_governor import quality_governor
+from systems.glow import glow_library
 
 
 @dataclass
@@ -18,26 +24,40 @@ class AreaEffectState:
     affected_enemies: Set[int] = field(default_factory=set)  # IDs de enemigos afectados
 
 
+# Superficies renderizadas compartidas entre todos los efectos:
+#   (tipo, radio)          -> copia propia del sprite (alpha de superficie)
+#   (tipo, radio, nivel)   -> círculo procedural con el alpha del nivel
+_area_visuals = {}
+
+
 class AreaEffect:
     """
     Efecto de área estático que persiste en una zona.
     Ejemplos: Lava, Vapor, Barro, Temblor, etc.
     """
     
-    # Constantes de pantalla
-    SCREEN_WIDTH = 1280
-    SCREEN_HEIGHT = 720
+    # Límites del espacio lógico (independientes de la ventana)
+    SCREEN_WIDTH = LOGICAL_WIDTH
+    SCREEN_HEIGHT = LOGICAL_HEIGHT
+    
+    # Alpha visual: valor normal y niveles del fade out
+    BASE_ALPHA = 180
+    ALPHA_BUCKETS = 16
+    BUCKET_ALPHAS = [12 * i for i in range(ALPHA_BUCKETS)]  # 0 .. BASE_ALPHA
+    GLOW_INTENSITY = 0.5  # Intensidad del brillo interior (color secundario) a alpha pleno
     
     def __init__(self):
         self.state = AreaEffectState()
         self.rect = pygame.Rect(0, 0, 100, 100)  # Área de efecto
-        self.sprite = None  # ← AGREGAR
+        self.sprite = None  # Sprite compartido (None = dibujo procedural)
+        self.spell_type: Optional[SpellType] = None
 
         
     def activate(self, spell_type: SpellType, center_x: float, center_y: float):
         """Activa el efecto de área en una posición específica"""
         self.state.active = True
         self.state.spell_data = get_spell_data(spell_type)
+        self.spell_type = spell_type
         self.state.x = center_x
         self.state.y = center_y
         self.state.lifetime = 0.0
@@ -52,15 +72,27 @@ class AreaEffect:
     
     def _load_sprite(self, spell_type: SpellType):
         """Carga el sprite del efecto de área"""
-        try:
-            sprite_path = f"assets/sprites/areas/{spell_type.name.lower()}.png"
-            self.sprite = pygame.image.load(sprite_path).convert_alpha()
+        sprite_path = f"assets/sprites/areas/{spell_type.name.lower()}.png"
 
+        # Sin sprite: dibujo procedural (consulta O(1) al manifiesto)
+        if not asset_manifest.exists(sprite_path):
+            self.sprite = None
+            return
+
+        # Una copia por (tipo, radio): el alpha de superficie se ajusta
+        # antes de cada blit sin tocar la imagen de la caché
+        radius = self.get_radius()
+        key = (spell_type, radius)
+        self.sprite = _area_visuals.get(key)
+        if self.sprite is not None:
+            return
+
+        try:
             # Escalar según radio
-            radius = self.get_radius()
             size = int(radius * 2)
-            self.sprite = pygame.transform.scale(self.sprite, (size, size))
-        except:
+            self.sprite = asset_cache.load_image(sprite_path, (size, size)).copy()
+            _area_visuals[key] = self.sprite
+        except pygame.error:
             self.sprite = None
 
     def _update_rect(self, radius: float):
@@ -152,51 +184,59 @@ class AreaEffect:
         self.state.spell_data = None
         self.state.affected_enemies.clear()
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja el efecto de área en pantalla"""
+    def submit(self, queue: RenderQueue):
+        """Encola el efecto de área para dibujarlo"""
         if not self.state.active:
             return
         
         radius = self.get_radius()
-        alpha = self._calculate_alpha()
+        bucket = self._alpha_bucket()
         
         if self.sprite:
-            # Usar sprite con alpha
-            sprite_copy = self.sprite.copy()
-            sprite_copy.set_alpha(alpha)
-            rect = sprite_copy.get_rect(center=(int(self.state.x), int(self.state.y)))
-            screen.blit(sprite_copy, rect)
+            # Sprite con alpha de superficie (uniforme, se aplica al volcar)
+            queue.submit_centered(self.sprite, (self.state.x, self.state.y),
+                                  RenderLayer.AREA_EFFECTS,
+                                  alpha=self.BUCKET_ALPHAS[bucket])
         else:
-            if not self.state.active:
-                return
+            # Círculos procedurales ya renderizados para este nivel de alpha
+            surf = self._get_procedural_surface(radius, bucket)
+            queue.submit(surf, (int(self.state.x - radius), int(self.state.y - radius)),
+                         RenderLayer.AREA_EFFECTS)
             
-            radius = self.get_radius()
-            
-            # Calcular alpha para efecto de parpadeo/fade
-            alpha = self._calculate_alpha()
-            
-            # Crear superficie temporal con transparencia
-            surf = pygame.Surface((int(radius * 2), int(radius * 2)), pygame.SRCALPHA)
-            
-            # Dibujar círculo con color primario
-            color_with_alpha = (*self.state.spell_data.color_primario, alpha)
-            pygame.draw.circle(surf, color_with_alpha, 
-                              (int(radius), int(radius)), int(radius))
-            
-            # Si tiene color secundario, dibujar círculo interno
-            if self.state.spell_data.color_secundario:
-                inner_radius = max(1, int(radius * 0.6))
-                inner_alpha = min(255, int(alpha * 1.3))
-                inner_color = (*self.state.spell_data.color_secundario, inner_alpha)
-                pygame.draw.circle(surf, inner_color, 
-                                 (int(radius), int(radius)), inner_radius)
-            
-            # Blit en posición correcta
-            screen.blit(surf, (int(self.state.x - radius), int(self.state.y - radius)))
+            # Degradado: brillo aditivo del color secundario encima
+            secundario = self.state.spell_data.color_secundario
+            if secundario and quality_governor.tier.degradado_areas:
+                glow_library.submit(queue, secundario, (self.state.x, self.state.y), radius,
+                                    RenderLayer.AREA_EFFECTS,
+                                    intensity=self.GLOW_INTENSITY * bucket / (self.ALPHA_BUCKETS - 1))
             
             # DEBUG: Dibujar borde del área de efecto
             # pygame.draw.circle(screen, (255, 255, 0), 
             #                   (int(self.state.x), int(self.state.y)), int(radius), 2)
+    
+    def _get_procedural_surface(self, radius: float, bucket: int) -> pygame.Surface:
+        """Retorna (creándola la primera vez) la superficie procedural de un nivel de alpha"""
+        key = (self.spell_type, radius, bucket)
+        surf = _area_visuals.get(key)
+        if surf is not None:
+            return surf
+        
+        alpha = self.BUCKET_ALPHAS[bucket]
+        
+        # Superficie con transparencia
+        surf = pygame.Surface((int(radius * 2), int(radius * 2)), pygame.SRCALPHA)
+        
+        # Círculo con color primario
+        color_with_alpha = (*self.state.spell_data.color_primario, alpha)
+        pygame.draw.circle(surf, color_with_alpha, 
+                          (int(radius), int(radius)), int(radius))
+        
+        _area_visuals[key] = surf
+        return surf
+    
+    def _alpha_bucket(self) -> int:
+        """Nivel de alpha (índice en BUCKET_ALPHAS) según el fade out"""
+        return round(self._calculate_alpha() * (self.ALPHA_BUCKETS - 1) / self.BASE_ALPHA)
         
     def _calculate_alpha(self) -> int:
         """Calcula el alpha para efecto visual"""
@@ -209,9 +249,9 @@ class AreaEffect:
             remaining = duracion - self.state.lifetime
             fade_duration = duracion - fade_start
             fade_percent = remaining / fade_duration
-            return int(180 * fade_percent)
+            return int(self.BASE_ALPHA * fade_percent)
         
-        return 180  # Alpha por defecto (semi-transparente)
+        return self.BASE_ALPHA  # Alpha por defecto (semi-transparente)
 
 
 class AreaEffectPool:
@@ -269,10 +309,10 @@ class AreaEffectPool:
         
         self.active_effects = still_active
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja todos los efectos activos"""
+    def submit(self, queue: RenderQueue):
+        """Encola todos los efectos activos"""
         for effect in self.active_effects:
-            effect.draw(screen)
+            effect.submit(queue)
     
     def get_active_effects(self) -> List[AreaEffect]:
         """Retorna lista de efectos activos (para colisiones)"""
@@ -0,0 +1,318 @@
+"""
+Bundle binario de assets pre-horneados
+Guarda los fondos ya decodificados y escalados (píxeles RGBA crudos) en
+archivos que en tiempo de ejecución se mapean en memoria; las superficies
+se crean con pygame.image.frombuffer, sin decodificar PNG/JPG ni reescalar.
+
+    world_<lógico>.bundle        capas del fondo de la partida, al tamaño
+                                 lógico del mundo (uno solo)
+    backgrounds_<WxH>.bundle     fondos de menú (load_screen_image), uno
+                                 por resolución de ventana
+
+Formato del archivo:
+    MAGIC (4 bytes) | largo del índice (uint32 LE) | índice JSON | blobs RGBA
+
+Hornear (desde la raíz del proyecto):
+    python -m systems.asset_bundle                 # mundo + todas las resoluciones
+    python -m systems.asset_bundle 1280x720        # mundo + una sola
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from config.screen import LOGICAL_SIZE
+from systems.asset_cache import AssetCache
+
+
+MAGIC = b"SWB1"
+HEADER = struct.Struct("<4sI")
+BLOB_ALIGN = 16
+
+BUNDLE_DIR = "assets/bundles"
+BACKGROUNDS_DIR = "assets/backgrounds"
+
+# Resoluciones ofrecidas en el menú de opciones
+DEFAULT_RESOLUTIONS = [(800, 600), (1024, 768), (1280, 720)]
+
+# Fondos que se cargan con load_screen_image (nombre sin extensión); el
+# resto de assets/backgrounds son capas del mundo, siempre a LOGICAL_SIZE
+SCREEN_BACKGROUNDS = ("menu_bg", "victory_bg", "gameover_bg")
+
+
+def bundle_path_for(resolution: Tuple[int, int]) -> str:
+    """Ruta del bundle de fondos de menú de una resolución"""
+    return f"{BUNDLE_DIR}/backgrounds_{resolution[0]}x{resolution[1]}.bundle"
+
+
+def world_bundle_path() -> str:
+    """Ruta del bundle de las capas del mundo (tamaño lógico)"""
+    return f"{BUNDLE_DIR}/world_{LOGICAL_SIZE[0]}x{LOGICAL_SIZE[1]}.bundle"
+
+
+def entry_name(path: str, scale: Optional[Tuple[int, int]], alpha: bool) -> str:
+    """Nombre de una entrada del índice (misma clave que la caché de assets)"""
+    norm_path, norm_scale, norm_alpha = AssetCache.make_key(path, scale, alpha)
+    size = f"{norm_scale[0]}x{norm_scale[1]}" if norm_scale else "orig"
+    return f"{norm_path}|{size}|{'alpha' if norm_alpha else 'opaque'}"
+
+
+def background_sources(screen: bool) -> List[Tuple[str, bool]]:
+    """
+    Fondos a hornear: (ruta, alpha).
+    Los PNG se usan con convert_alpha() (capas parallax) y los JPG con convert().
+
+    Args:
+        screen: True para los fondos de menú, False para las capas del mundo
+    """
+    sources = []
+    if not os.path.isdir(BACKGROUNDS_DIR):
+        return sources
+
+    for filename in sorted(os.listdir(BACKGROUNDS_DIR)):
+        stem, ext = os.path.splitext(filename)
+        ext = ext.lower()
+        if ext in (".png", ".jpg", ".jpeg") and (stem in SCREEN_BACKGROUNDS) == screen:
+            sources.append((f"{BACKGROUNDS_DIR}/{filename}", ext == ".png"))
+    return sources
+
+
+def _file_hash(path: str) -> str:
+    """SHA-1 del contenido de un archivo fuente"""
+    sha = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class AssetBundle:
+    """
+    Bundle de solo lectura mapeado en memoria.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Ruta del archivo .bundle
+
+        Raises:
+            OSError, ValueError: Si el archivo no existe o no es un bundle válido
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise
+
+        magic, index_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} no es un bundle de assets")
+
+        index_start = HEADER.size
+        index = json.loads(self._mmap[index_start:index_start + index_len].decode("utf-8"))
+        self.resolution = tuple(index["resolution"])
+        self.entries: Dict[str, dict] = index["entries"]
+
+        self.loads = 0
+
+    @classmethod
+    def open_for_resolution(cls, resolution: Tuple[int, int]) -> Optional["AssetBundle"]:
+        """Abre el bundle de fondos de menú de una resolución (None si no hay)"""
+        return cls.open_path(bundle_path_for(resolution))
+
+    @classmethod
+    def open_world(cls) -> Optional["AssetBundle"]:
+        """Abre el bundle de las capas del mundo (None si no hay)"""
+        return cls.open_path(world_bundle_path())
+
+    @classmethod
+    def open_path(cls, path: str) -> Optional["AssetBundle"]:
+        """Abre un bundle, o None si no existe o es inválido"""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print(f"WARNING: No se pudo abrir el bundle {path}: {e}")
+            return None
+
+    def _is_fresh(self, entry: dict) -> bool:
+        """Verifica (con un stat) que el archivo fuente no cambió desde el horneado"""
+        try:
+            st = os.stat(entry["source"])
+        except OSError:
+            return False
+        return st.st_size == entry["source_size"] and st.st_mtime_ns == entry["source_mtime"]
+
+    def has(self, path: str, scale: Optional[Tuple[int, int]], alpha: bool) -> bool:
+        """Verifica si el bundle tiene una entrada vigente para la imagen"""
+        entry = self.entries.get(entry_name(path, scale, alpha))
+        return entry is not None and self._is_fresh(entry)
+
+    def load(self, path: str, scale: Optional[Tuple[int, int]],
+             alpha: bool) -> Optional[pygame.Surface]:
+        """
+        Crea una superficie (ya convertida al formato de pantalla) desde el bundle.
+
+        Returns:
+            Superficie, o None si la entrada no existe o está desactualizada
+        """
+        entry = self.entries.get(entry_name(path, scale, alpha))
+        if entry is None or not self._is_fresh(entry):
+            return None
+
+        start = entry["offset"]
+        pixels = memoryview(self._mmap)[start:start + entry["length"]]
+        surface = pygame.image.frombuffer(pixels, tuple(entry["size"]), "RGBA")
+
+        # convert() copia al formato de pantalla; la vista al mmap se libera
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        pixels.release()
+
+        self.loads += 1
+        return surface
+
+    def stale_sources(self) -> List[str]:
+        """Fuentes que cambiaron desde el último horneado"""
+        return [e["source"] for e in self.entries.values() if not self._is_fresh(e)]
+
+    def close(self):
+        """Libera el mapeo y el archivo"""
+        self._mmap.close()
+        self._file.close()
+
+
+def bake_bundle(resolution: Tuple[int, int],
+                sources: Optional[List[Tuple[str, bool]]] = None,
+                path: Optional[str] = None) -> dict:
+    """
+    Hornea (o re-hornea de forma incremental) un bundle a una resolución.
+    Las entradas cuyo archivo fuente mantiene el mismo hash se copian del
+    bundle anterior sin volver a decodificar.
+
+    Args:
+        resolution: (ancho, alto) al que se escalan los fondos
+        sources: Lista de (ruta, alpha); por defecto los fondos de menú
+        path: Archivo destino; por defecto el bundle de menú de la resolución
+
+    Returns:
+        dict: {'path': str, 'baked': int, 'reused': int}
+
+    Nota: el horneado no necesita ventana; la conversión al formato de
+    pantalla se hace al cargar.
+    """
+    if sources is None:
+        sources = background_sources(screen=True)
+    if path is None:
+        path = bundle_path_for(resolution)
+    old = None
+    if os.path.exists(path):
+        try:
+            old = AssetBundle(path)
+        except (OSError, ValueError, KeyError, struct.error):
+            old = None
+
+    entries: Dict[str, dict] = {}
+    blobs: List[bytes] = []
+    offset = 0
+    stats = {"path": path, "baked": 0, "reused": 0}
+
+    for source, alpha in sources:
+        name = entry_name(source, resolution, alpha)
+        digest = _file_hash(source)
+        st = os.stat(source)
+
+        old_entry = old.entries.get(name) if old else None
+        if old_entry is not None and old_entry["sha1"] == digest:
+            start = old_entry["offset"]
+            blob = old._mmap[start:start + old_entry["length"]]
+            stats["reused"] += 1
+        else:
+            try:
+                surface = pygame.image.load(source)
+            except pygame.error as e:
+                print(f"WARNING: {source} no se pudo decodificar ({e}), se omite")
+                continue
+            surface = pygame.transform.scale(surface, resolution)
+            blob = pygame.image.tobytes(surface, "RGBA")
+            stats["baked"] += 1
+
+        padding = (-offset) % BLOB_ALIGN
+        if padding:
+            blobs.append(b"\0" * padding)
+            offset += padding
+
+        entries[name] = {
+            "source": os.path.normpath(source),
+            "sha1": digest,
+            "source_size": st.st_size,
+            "source_mtime": st.st_mtime_ns,
+            "size": [resolution[0], resolution[1]],
+            "offset": offset,
+            "length": len(blob),
+        }
+        blobs.append(blob)
+        offset += len(blob)
+
+    if old:
+        old.close()
+
+    # Los offsets del índice son relativos al inicio de los blobs; se
+    # recalculan como absolutos una vez conocido el tamaño del índice
+    index_len = 0
+    while True:
+        data_start = HEADER.size + index_len
+        data_start += (-data_start) % BLOB_ALIGN
+        index = {
+            "resolution": list(resolution),
+            "entries": {
+                name: dict(entry, offset=entry["offset"] + data_start)
+                for name, entry in entries.items()
+            }
+        }
+        encoded = json.dumps(index).encode("utf-8")
+        if len(encoded) == index_len:
+            break
+        index_len = len(encoded)
+
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, index_len))
+        f.write(encoded)
+        f.write(b"\0" * (data_start - HEADER.size - index_len))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+    return stats
+
+
+def main(argv: List[str]):
+    """Punto de entrada: hornea los bundles pedidos por línea de comandos"""
+    resolutions = DEFAULT_RESOLUTIONS
+    if argv:
+        resolutions = [tuple(int(v) for v in arg.lower().split("x")) for arg in argv]
+
+    # Las capas del mundo no dependen de la ventana: un solo bundle
+    bakes = [(LOGICAL_SIZE, background_sources(screen=False), world_bundle_path())]
+    bakes += [(resolution, background_sources(screen=True), bundle_path_for(resolution))
+              for resolution in resolutions]
+
+    for resolution, sources, path in bakes:
+        stats = bake_bundle(resolution, sources, path)
+        print(f"✓ {stats['path']}: {stats['baked']} horneados, "
+              f"{stats['reused']} reutilizados")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,279 @@
+"""
+Caché central de superficies
+Todas las cargas de imágenes del juego pasan por aquí para no
+decodificar ni reescalar el mismo PNG más de una vez.
+"""
+import os
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple
+
+import pygame
+
+from systems.texture_atlas import sprite_atlas
+
+
+class AssetCache:
+    """
+    Caché LRU de superficies cargadas, convertidas y escaladas.
+
+    La clave es (ruta, escala, modo alpha). El tamaño total está limitado
+    por un presupuesto de bytes: al superarlo se descartan las entradas
+    usadas hace más tiempo. Los sprites empaquetados en el atlas no cuentan:
+    sus páginas quedan residentes aunque la entrada se desaloje (ver
+    systems/texture_atlas.py), y volver a pedirlos no toca el disco.
+
+    IMPORTANTE: las superficies devueltas son compartidas. Quien necesite
+    modificarlas debe trabajar sobre una copia.
+    """
+
+    DEFAULT_BUDGET = 128 * 1024 * 1024  # 128 MB
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET):
+        """
+        Args:
+            budget_bytes: Máximo de bytes de píxeles que puede retener la caché
+        """
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._entries: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+        # Bundles pre-horneados (ver systems/asset_bundle.py): fondos de menú
+        # de la resolución actual y capas del mundo a tamaño lógico
+        self.bundle = None
+        self.world_bundle = None
+        
+        # Imágenes escaladas al tamaño de pantalla: (ruta, alpha)
+        self.screen_size: Optional[Tuple[int, int]] = None
+        self._screen_images: Set[Tuple[str, bool]] = set()
+
+        # Contadores
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(path: str, scale: Optional[Tuple[int, int]] = None,
+                 alpha: bool = True) -> tuple:
+        """Construye la clave normalizada de una entrada"""
+        return (
+            os.path.normpath(path),
+            (int(scale[0]), int(scale[1])) if scale else None,
+            bool(alpha)
+        )
+
+    def load_image(self, path: str, scale: Optional[Tuple[int, int]] = None,
+                   alpha: bool = True, packed: bool = False) -> pygame.Surface:
+        """
+        Retorna la superficie de una imagen, cargándola solo si no está en caché.
+
+        Args:
+            path: Ruta del archivo de imagen
+            scale: Tupla (ancho, alto) para escalar, o None
+            alpha: True para convert_alpha(), False para convert()
+            packed: Si True (y alpha), la imagen se copia al atlas de sprites
+                    y se retorna como subsuperficie de una de sus páginas
+
+        Returns:
+            Superficie compartida lista para blitear
+
+        Raises:
+            FileNotFoundError, pygame.error: Si la imagen no se puede cargar
+        """
+        key = self.make_key(path, scale, alpha)
+
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+
+        # Si ya estaba en el atlas (p. ej. tras un desalojo) no hace falta disco
+        region = sprite_atlas.get(key) if packed and alpha else None
+        if region is not None:
+            self._store(key, region)
+            return region
+
+        # Los fondos a pantalla completa vienen ya decodificados y escalados
+        bundle = self.bundle_for(path, key[1], alpha)
+        surface = bundle.load(path, key[1], alpha) if bundle else None
+        if surface is not None:
+            return self._prepare(key, surface, packed, converted=True)
+
+        return self._prepare(key, pygame.image.load(path), packed)
+
+    def load_screen_image(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """
+        Carga una imagen escalada al tamaño de pantalla actual (fondos).
+        La entrada queda registrada como dependiente de la resolución: al
+        cambiarla (set_screen_size) se descarta y se reconstruye.
+
+        Args:
+            path: Ruta del archivo de imagen
+            alpha: True para convert_alpha(), False para convert()
+
+        Returns:
+            Superficie compartida del tamaño de la pantalla
+        """
+        if self.screen_size is None:
+            self.screen_size = pygame.display.get_surface().get_size()
+        surface = self.load_image(path, self.screen_size, alpha)
+        self._screen_images.add((os.path.normpath(path), bool(alpha)))
+        return surface
+
+    def set_screen_size(self, size: Tuple[int, int]) -> List[tuple]:
+        """
+        Cambia el tamaño de pantalla y descarta las entradas que dependían
+        del tamaño anterior.
+
+        Args:
+            size: Nuevo (ancho, alto) de la pantalla
+
+        Returns:
+            Lista de (ruta, escala, alpha) a reconstruir para el nuevo tamaño
+        """
+        size = (int(size[0]), int(size[1]))
+        old_size = self.screen_size
+        self.screen_size = size
+        if old_size is None or old_size == size:
+            return []
+
+        for path, alpha in self._screen_images:
+            self._discard(self.make_key(path, old_size, alpha))
+
+        return [(path, size, alpha) for path, alpha in sorted(self._screen_images)
+                if not self.has(path, size, alpha)]
+
+    def has(self, path: str, scale: Optional[Tuple[int, int]] = None,
+            alpha: bool = True) -> bool:
+        """Verifica si una imagen ya está en caché (sin contar hit/miss)"""
+        return self.make_key(path, scale, alpha) in self._entries
+
+    def store_decoded(self, path: str, surface: pygame.Surface,
+                      scale: Optional[Tuple[int, int]] = None,
+                      alpha: bool = True, packed: bool = False) -> pygame.Surface:
+        """
+        Registra una imagen decodificada fuera del hilo principal (ver AssetLoader).
+        La conversión al formato de pantalla y el atlas se hacen aquí, en el
+        hilo principal. Los argumentos son los mismos de load_image().
+
+        Args:
+            surface: Superficie recién decodificada (puede venir ya escalada)
+
+        Returns:
+            Superficie compartida lista para blitear
+        """
+        key = self.make_key(path, scale, alpha)
+
+        cached = self._entries.get(key)
+        if cached is not None:
+            return cached
+
+        self.misses += 1
+        return self._prepare(key, surface, packed)
+
+    def _prepare(self, key: tuple, surface: pygame.Surface, packed: bool,
+                 converted: bool = False) -> pygame.Surface:
+        """Convierte, escala, empaqueta y guarda una superficie recién cargada"""
+        _, scale, alpha = key
+
+        if not converted:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        if scale and surface.get_size() != scale:
+            surface = pygame.transform.scale(surface, scale)
+
+        if packed and alpha:
+            surface = sprite_atlas.pack(key, surface)
+
+        self._store(key, surface)
+        return surface
+
+    def mount_bundle(self, bundle):
+        """
+        Cambia el bundle de fondos de menú activo (o lo desmonta con None).
+
+        Args:
+            bundle: AssetBundle de la resolución actual, o None
+        """
+        if self.bundle is not None and self.bundle is not bundle:
+            self.bundle.close()
+        self.bundle = bundle
+
+    def mount_world_bundle(self, bundle):
+        """Cambia el bundle de las capas del mundo (o lo desmonta con None)"""
+        if self.world_bundle is not None and self.world_bundle is not bundle:
+            self.world_bundle.close()
+        self.world_bundle = bundle
+
+    def bundle_for(self, path: str, scale: Optional[Tuple[int, int]], alpha: bool):
+        """Bundle montado con una entrada vigente para la imagen (o None)"""
+        for bundle in (self.bundle, self.world_bundle):
+            if bundle is not None and bundle.has(path, scale, alpha):
+                return bundle
+        return None
+
+    def _store(self, key: tuple, surface: pygame.Surface):
+        """Inserta una entrada y aplica el presupuesto de bytes"""
+        size = self._surface_bytes(surface)
+
+        # Una superficie más grande que todo el presupuesto no se cachea
+        if size > self.budget_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.used_bytes -= self._surface_bytes(old)
+
+        self._entries[key] = surface
+        self.used_bytes += size
+        self._evict()
+
+    def _discard(self, key: tuple):
+        """Quita una entrada (si existe)"""
+        surface = self._entries.pop(key, None)
+        if surface is not None:
+            self.used_bytes -= self._surface_bytes(surface)
+
+    def _evict(self):
+        """Descarta las entradas menos usadas hasta caber en el presupuesto"""
+        while self.used_bytes > self.budget_bytes and self._entries:
+            _, surface = self._entries.popitem(last=False)
+            self.used_bytes -= self._surface_bytes(surface)
+            self.evictions += 1
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        """Bytes de píxeles que libera desalojar una superficie (0 si vive en el atlas)"""
+        if sprite_atlas.owns(surface):
+            return 0
+        return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+    def set_budget(self, budget_bytes: int):
+        """Cambia el presupuesto de bytes (descarta entradas si hace falta)"""
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def clear(self):
+        """Vacía la caché (los contadores se conservan)"""
+        self._entries.clear()
+        self.used_bytes = 0
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas de la caché (para debug)"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "atlas_bytes": sprite_atlas.get_stats()["bytes"],
+            "bundle_loads": sum(b.loads for b in (self.bundle, self.world_bundle) if b)
+        }
+
+
+# Instancia compartida por todos los cargadores de sprites
+asset_cache = AssetCache()
@@ -0,0 +1,218 @@
+"""
+Cargador de assets en paralelo
+Decodifica imágenes y sonidos en un ThreadPoolExecutor (la decodificación
+de PNG/JPG en SDL libera el GIL) y deja para el hilo principal solo el paso
+final: convert()/convert_alpha(), el atlas y el registro en las cachés.
+"""
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+from systems.asset_cache import asset_cache
+
+
+class LoadJob:
+    """Un asset pendiente: decodificación (en un hilo) + finalización (hilo principal)"""
+
+    def __init__(self, name: str, decode: Optional[Callable[[], object]],
+                 finish: Callable[[object], None]):
+        """
+        Args:
+            name: Nombre para el reporte (normalmente la ruta)
+            decode: Función que corre en un hilo de trabajo, o None si no hace falta
+            finish: Función que recibe el resultado de decode en el hilo principal
+        """
+        self.name = name
+        self.decode = decode
+        self.finish = finish
+
+        self.future: Optional[Future] = None
+        self.decode_ms = 0.0
+        self.finish_ms = 0.0
+        self.error: Optional[str] = None
+
+
+class AssetLoader:
+    """
+    Carga un lote de assets en paralelo y reporta progreso y tiempos.
+
+    Uso:
+        loader = AssetLoader()
+        loader.add_image("assets/sprites/player/idle_0.png", (100, 100), packed=True)
+        loader.start()
+        # en cada frame:
+        loader.pump()
+        if loader.done: ...
+    """
+
+    # Tiempo máximo por frame para finalizar assets en el hilo principal
+    DEFAULT_FRAME_BUDGET = 0.008  # 8 ms
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Hilos de decodificación (por defecto según CPUs, máx. 4)
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.jobs: List[LoadJob] = []
+        self._pending: List[LoadJob] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.completed = 0
+        self.current_name = ""
+        self._start_time = 0.0
+        self.total_ms = 0.0
+
+    # ======================
+    # REGISTRO DE ASSETS
+    # ======================
+
+    def add(self, name: str, decode: Optional[Callable[[], object]],
+            finish: Callable[[object], None]):
+        """Agrega un asset genérico al lote"""
+        self.jobs.append(LoadJob(name, decode, finish))
+
+    def add_image(self, path: str, scale: Optional[Tuple[int, int]] = None,
+                  alpha: bool = True, packed: bool = False):
+        """
+        Agrega una imagen para asset_cache (mismos argumentos que load_image).
+        Las imágenes que ya están en caché se omiten.
+        """
+        if asset_cache.has(path, scale, alpha):
+            return
+
+        # Las que están en el bundle pre-horneado no necesitan decodificarse
+        if asset_cache.bundle_for(path, scale, alpha) is not None:
+            self.add(path, None,
+                     lambda _: asset_cache.load_image(path, scale, alpha, packed))
+            return
+
+        def decode():
+            surface = pygame.image.load(path)
+            if scale:
+                surface = pygame.transform.scale(surface, (int(scale[0]), int(scale[1])))
+            return surface
+
+        self.add(path, decode,
+                 lambda surface: asset_cache.store_decoded(path, surface, scale, alpha, packed))
+
+    # ======================
+    # EJECUCIÓN
+    # ======================
+
+    def start(self):
+        """Lanza la decodificación de todo el lote"""
+        self._start_time = time.perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="asset-loader")
+        for job in self.jobs:
+            if job.decode is not None:
+                job.future = self._executor.submit(self._run_decode, job)
+        self._pending = list(self.jobs)
+
+    @staticmethod
+    def _run_decode(job: LoadJob):
+        """Corre en un hilo de trabajo y mide la decodificación"""
+        start = time.perf_counter()
+        try:
+            return job.decode()
+        finally:
+            job.decode_ms = (time.perf_counter() - start) * 1000
+
+    def pump(self, frame_budget: float = DEFAULT_FRAME_BUDGET) -> int:
+        """
+        Finaliza en el hilo principal los assets ya decodificados, en orden,
+        sin pasarse del presupuesto de tiempo del frame.
+
+        Returns:
+            Número de assets finalizados en esta llamada
+        """
+        deadline = time.perf_counter() + frame_budget
+        finished = 0
+
+        while self._pending:
+            job = self._pending[0]
+            if job.future is not None and not job.future.done():
+                break
+
+            self._pending.pop(0)
+            self.current_name = job.name
+            start = time.perf_counter()
+            try:
+                job.finish(job.future.result() if job.future is not None else None)
+            except (pygame.error, OSError) as e:
+                job.error = str(e)
+                print(f"WARNING: No se pudo cargar {job.name}: {e}")
+            job.finish_ms = (time.perf_counter() - start) * 1000
+
+            self.completed += 1
+            finished += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        if not self._pending and self._executor is not None:
+            self.total_ms = (time.perf_counter() - self._start_time) * 1000
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        return finished
+
+    def cancel(self):
+        """Cancela lo que falte (p. ej. si se sale del estado de carga)"""
+        if self._executor is not None:
+            # shutdown(cancel_futures=True) no existe en Python 3.8
+            for job in self._pending:
+                if job.future is not None:
+                    job.future.cancel()
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._pending.clear()
+
+    # ======================
+    # PROGRESO Y REPORTE
+    # ======================
+
+    @property
+    def done(self) -> bool:
+        """True cuando todos los assets están listos"""
+        return not self._pending and self._executor is None
+
+    @property
+    def progress(self) -> float:
+        """Fracción completada (0.0 a 1.0)"""
+        return self.completed / len(self.jobs) if self.jobs else 1.0
+
+    def get_report(self) -> dict:
+        """
+        Retorna los tiempos de carga.
+
+        Returns:
+            dict con total_ms, decode_ms (suma en hilos), finish_ms (suma en el
+            hilo principal), workers y 'assets': lista de
+            (nombre, decode_ms, finish_ms, error) ordenada de más lento a más rápido
+        """
+        assets = sorted(
+            ((job.name, job.decode_ms, job.finish_ms, job.error) for job in self.jobs),
+            key=lambda a: a[1] + a[2],
+            reverse=True
+        )
+        return {
+            "total_ms": self.total_ms,
+            "decode_ms": sum(job.decode_ms for job in self.jobs),
+            "finish_ms": sum(job.finish_ms for job in self.jobs),
+            "workers": self.max_workers,
+            "assets": assets
+        }
+
+    def print_report(self, top: int = 5):
+        """Imprime el resumen de tiempos y los assets más lentos"""
+        report = self.get_report()
+        print(f"✓ {len(self.jobs)} assets cargados en {report['total_ms']:.1f} ms "
+              f"(decodificación {report['decode_ms']:.1f} ms en {report['workers']} hilos, "
+              f"hilo principal {report['finish_ms']:.1f} ms)")
+        for name, decode_ms, finish_ms, error in report["assets"][:top]:
+            status = f"  ERROR: {error}" if error else ""
+            print(f"   {decode_ms:7.2f} + {finish_ms:6.2f} ms  {name}{status}")
@@ -0,0 +1,63 @@
+"""
+Manifiesto de assets
+Escanea la carpeta assets/ una sola vez al arrancar para que comprobar si
+un sprite existe sea una búsqueda O(1) en un set, sin tocar el disco ni
+lanzar excepciones dentro del bucle de juego.
+"""
+import os
+from typing import Set
+
+
+class AssetManifest:
+    """
+    Índice de archivos y carpetas disponibles bajo la raíz de assets.
+    Las rutas se guardan normalizadas (os.path.normpath) y relativas
+    al directorio de trabajo, igual que las usa el resto del juego.
+    """
+
+    def __init__(self, root: str = "assets"):
+        """
+        Args:
+            root: Carpeta raíz de los assets
+        """
+        self.root = root
+        self._files: Set[str] = set()
+        self._dirs: Set[str] = set()
+        self.scanned = False
+
+    def scan(self):
+        """Recorre la carpeta de assets y reconstruye el índice"""
+        self._files.clear()
+        self._dirs.clear()
+
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            self._dirs.add(os.path.normpath(dirpath))
+            for filename in filenames:
+                self._files.add(os.path.normpath(os.path.join(dirpath, filename)))
+
+        self.scanned = True
+        print(f"✓ Manifiesto de assets: {len(self._files)} archivos")
+
+    def exists(self, path: str) -> bool:
+        """Verifica si un archivo existe (escanea la primera vez si hace falta)"""
+        if not self.scanned:
+            self.scan()
+        return os.path.normpath(path) in self._files
+
+    def has_dir(self, path: str) -> bool:
+        """Verifica si una carpeta existe"""
+        if not self.scanned:
+            self.scan()
+        return os.path.normpath(path) in self._dirs
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas del manifiesto (para debug)"""
+        return {
+            "files": len(self._files),
+            "dirs": len(self._dirs),
+            "scanned": self.scanned
+        }
+
+
+# Instancia compartida, se escanea al arrancar el juego
+asset_manifest = AssetManifest()
@@ -1,5 +1,5 @@
 import pygame
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum, auto
 
 
@@ -19,8 +19,19 @@ class AudioManager:
     Versión simplificada: solo música de juego y sonido de hit.
     """
     
-    def __init__(self):
-        """Inicializa el sistema de audio"""
+    # Archivos de efectos de sonido
+    SOUND_FILES = {
+        SoundEffect.HIT: "assets/sounds/hit.mp3"
+    }
+    
+    def __init__(self, preload_sounds: bool = True):
+        """
+        Inicializa el sistema de audio.
+        
+        Args:
+            preload_sounds: Si False, los efectos no se cargan aquí; los carga
+                            el LoadingState en segundo plano (ver pending_sounds)
+        """
         # Inicializar pygame mixer
         try:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
@@ -45,7 +56,8 @@ class AudioManager:
         
         # Cargar recursos
         self._load_music()
-        self._load_sounds()
+        if preload_sounds:
+            self._load_sounds()
     
     def _load_music(self):
         """Carga los tracks de música"""
@@ -73,21 +85,33 @@ class AudioManager:
         if not self.audio_enabled:
             return
         
-        sound_files = {
-            SoundEffect.HIT: "assets/sounds/hit.mp3"
-        }
-        
-        for sound, filepath in sound_files.items():
+        for sound, filepath in self.pending_sounds():
             try:
-                sfx = pygame.mixer.Sound(filepath)
-                sfx.set_volume(self.sound_volume)
-                self.sound_effects[sound] = sfx
-                print(f"✓ Sonido cargado: {sound.name}")
+                self.register_sound(sound, pygame.mixer.Sound(filepath))
             except FileNotFoundError:
                 print(f"WARNING: No se encontró el archivo de sonido: {filepath}")
             except Exception as e:
                 print(f"WARNING: Error cargando sonido {filepath}: {e}")
     
+    def pending_sounds(self) -> List[Tuple[SoundEffect, str]]:
+        """Retorna los efectos (efecto, ruta) que todavía no están cargados"""
+        if not self.audio_enabled:
+            return []
+        return [(sound, filepath) for sound, filepath in self.SOUND_FILES.items()
+                if sound not in self.sound_effects]
+    
+    def register_sound(self, sound: SoundEffect, sfx: pygame.mixer.Sound):
+        """
+        Registra un efecto ya decodificado (p. ej. en un hilo del AssetLoader).
+        
+        Args:
+            sound: Efecto al que corresponde
+            sfx: Sonido cargado
+        """
+        sfx.set_volume(self.sound_volume)
+        self.sound_effects[sound] = sfx
+        print(f"✓ Sonido cargado: {sound.name}")
+    
     # ======================
     # CONTROL DE MÚSICA
     # ======================
@@ -1,8 +1,12 @@
+import math
 import pygame
 from typing import List, Optional
 from dataclasses import dataclass
 
 from config.enums import Element
+from systems.render_queue import RenderLayer, RenderQueue
+from systems.quality_governor import quality_governor
+from systems.glow import glow_library
 
 
 @dataclass
@@ -26,6 +30,7 @@ class CirculoMagico:
     RADIO_BASE = 40
     RADIO_GLOW = 55
     PULSE_SPEED = 3.0  # Velocidad de pulsación
+    GLOW_INTENSITY = 0.6  # Intensidad del halo aditivo a opacidad plena
     
     # Colores por elemento
     ELEMENT_COLORS = {
@@ -45,9 +50,62 @@ class CirculoMagico:
         Element.AGUA: (100, 150, 255)
     }
     
+    # Cuantización de la animación
+    PULSE_PHASES = 32   # Fases de la pulsación por ciclo
+    ALPHA_BUCKETS = 16  # Niveles de alpha durante el fade out
+    
+    # Frames compartidos (ver build_frame_cache)
+    _pulse_radii: List[int] = []
+    _disc_frames = {}    # elemento -> disco principal (se desvanece)
+    _symbol_frames = {}  # elemento -> borde + símbolo (opaco)
+    
     def __init__(self):
         self.state = CircleState()
         self.pulse_time = 0.0  # Para animación de pulsación
+    
+    # ======================
+    # FRAMES PRE-RENDERIZADOS
+    # ======================
+    
+    @classmethod
+    def build_frame_cache(cls):
+        """
+        Pre-renderiza los frames de todos los elementos (disco y capa de
+        borde + símbolo) y los halos aditivos de cada radio de la pulsación.
+        Se llama una sola vez (al crear el CircleManager).
+        """
+        if cls._symbol_frames:
+            return
+        
+        # Tabla de pulsación: radio del glow por fase (oscila entre 0.9 y 1.1)
+        cls._pulse_radii = [
+            int(cls.RADIO_GLOW * (1.0 + 0.1 * math.cos(2 * math.pi * phase / cls.PULSE_PHASES)))
+            for phase in range(cls.PULSE_PHASES)
+        ]
+        
+        for elemento in cls.ELEMENT_COLORS:
+            cls._disc_frames[elemento] = cls._render_disc(elemento)
+            cls._symbol_frames[elemento] = cls._render_symbol_layer(elemento)
+            for glow_radius in set(cls._pulse_radii):
+                glow_library.texture(cls.ELEMENT_GLOW[elemento], glow_radius, cls.GLOW_INTENSITY)
+    
+    @classmethod
+    def _render_disc(cls, elemento: Element) -> pygame.Surface:
+        """Disco principal del color del elemento"""
+        surf = pygame.Surface((cls.RADIO_BASE * 2, cls.RADIO_BASE * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, cls.ELEMENT_COLORS[elemento],
+                           (cls.RADIO_BASE, cls.RADIO_BASE), cls.RADIO_BASE)
+        return surf
+    
+    @classmethod
+    def _render_symbol_layer(cls, elemento: Element) -> pygame.Surface:
+        """Borde del círculo y símbolo del elemento (siempre opacos)"""
+        size = cls.RADIO_BASE * 2 + 1
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (cls.RADIO_BASE, cls.RADIO_BASE)
+        pygame.draw.circle(surf, cls.ELEMENT_COLORS[elemento], center, cls.RADIO_BASE, 3)
+        cls._draw_element_symbol(surf, elemento, center)
+        return surf
         
     def activate(self, elemento: Element, x: float, y: float, lifetime: float = 8.0):
         """Activa el círculo con un elemento específico"""
@@ -90,88 +148,79 @@ class CirculoMagico:
         self.state.active = False
         self.state.elemento = None
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja el círculo con efectos visuales"""
+    def submit(self, queue: RenderQueue):
+        """Encola el círculo con efectos visuales"""
         if not self.state.active:
             return
         
-        # Calcular pulsación (oscila entre 0.9 y 1.1)
-        pulse = 1.0 + 0.1 * pygame.math.Vector2(1, 0).rotate(self.pulse_time * 360).x
+        # Fase de la pulsación (cuantizada)
+        phase = int(self.pulse_time * self.PULSE_PHASES) % self.PULSE_PHASES
+        glow_radius = self._pulse_radii[phase]
         
-        # Calcular alpha según tiempo restante (fade out en últimos 2 segundos)
+        # Alpha según tiempo restante (fade out en el último 25% de vida),
+        # cuantizado en ALPHA_BUCKETS niveles
         time_percent = self.get_time_percent()
-        if time_percent < 0.25:  # Últimos 25% de vida
-            alpha = int(255 * (time_percent / 0.25))
+        if time_percent < 0.25:
+            bucket = int(self.ALPHA_BUCKETS * time_percent / 0.25)
+            alpha = 255 * bucket // self.ALPHA_BUCKETS
         else:
             alpha = 255
         
-        # Colores del elemento
-        color_primary = self.ELEMENT_COLORS[self.state.elemento]
-        color_glow = self.ELEMENT_GLOW[self.state.elemento]
-        
-        # Dibujar glow exterior (con pulsación)
-        glow_radius = int(self.RADIO_GLOW * pulse)
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        glow_alpha = min(alpha, 100)
-        pygame.draw.circle(glow_surf, (*color_glow, glow_alpha), 
-                          (glow_radius, glow_radius), glow_radius)
-        screen.blit(glow_surf, (int(self.state.x - glow_radius), 
-                                int(self.state.y - glow_radius)))
-        
-        # Dibujar círculo principal
-        main_surf = pygame.Surface((self.RADIO_BASE * 2, self.RADIO_BASE * 2), pygame.SRCALPHA)
-        pygame.draw.circle(main_surf, (*color_primary, alpha), 
-                          (self.RADIO_BASE, self.RADIO_BASE), self.RADIO_BASE)
-        screen.blit(main_surf, (int(self.state.x - self.RADIO_BASE), 
-                                int(self.state.y - self.RADIO_BASE)))
+        x, y = int(self.state.x), int(self.state.y)
         
-        # Dibujar borde
-        pygame.draw.circle(screen, (*color_primary, alpha), 
-                          (int(self.state.x), int(self.state.y)), 
-                          self.RADIO_BASE, 3)
+        # Halo aditivo (sin glow en calidad baja) y disco principal; ambos se desvanecen
+        if quality_governor.tier.glow_circulos:
+            glow_library.submit(queue, self.ELEMENT_GLOW[self.state.elemento], (x, y),
+                                glow_radius, RenderLayer.CIRCLES,
+                                intensity=self.GLOW_INTENSITY * alpha / 255)
+        queue.submit(self._disc_frames[self.state.elemento],
+                     (x - self.RADIO_BASE, y - self.RADIO_BASE),
+                     RenderLayer.CIRCLES, alpha=alpha)
         
-        # Dibujar símbolo del elemento en el centro
-        self._draw_element_symbol(screen, alpha)
+        # Borde + símbolo del elemento
+        queue.submit(self._symbol_frames[self.state.elemento],
+                     (x - self.RADIO_BASE, y - self.RADIO_BASE), RenderLayer.CIRCLES)
         
         # Dibujar timer (opcional, para debug/feedback)
         # self._draw_timer(screen, alpha)
     
-    def _draw_element_symbol(self, screen: pygame.Surface, alpha: int):
+    @staticmethod
+    def _draw_element_symbol(surf: pygame.Surface, elemento: Element, center: tuple):
         """Dibuja un símbolo representativo del elemento"""
         # Símbolos simples con formas geométricas
-        x, y = int(self.state.x), int(self.state.y)
-        color = (255, 255, 255, alpha)
+        x, y = center
+        color = (255, 255, 255)
         
-        if self.state.elemento == Element.FUEGO:
+        if elemento == Element.FUEGO:
             # Triángulo hacia arriba (llama)
             points = [(x, y - 15), (x - 10, y + 10), (x + 10, y + 10)]
-            pygame.draw.polygon(screen, color[:3], points)
+            pygame.draw.polygon(surf, color, points)
             
-        elif self.state.elemento == Element.HIELO:
+        elif elemento == Element.HIELO:
             # Copo de nieve (asterisco)
             for angle in range(0, 360, 60):
                 rad = pygame.math.Vector2(12, 0).rotate(angle)
                 end = (x + rad.x, y + rad.y)
-                pygame.draw.line(screen, color[:3], (x, y), end, 2)
+                pygame.draw.line(surf, color, (x, y), end, 2)
             
-        elif self.state.elemento == Element.RAYO:
+        elif elemento == Element.RAYO:
             # Rayo zigzag
             points = [(x, y - 12), (x - 6, y - 4), (x + 6, y + 4), (x, y + 12)]
-            pygame.draw.lines(screen, color[:3], False, points, 3)
+            pygame.draw.lines(surf, color, False, points, 3)
             
-        elif self.state.elemento == Element.TIERRA:
+        elif elemento == Element.TIERRA:
             # Cuadrado (roca)
             rect = pygame.Rect(x - 10, y - 10, 20, 20)
-            pygame.draw.rect(screen, color[:3], rect, 3)
+            pygame.draw.rect(surf, color, rect, 3)
             
-        elif self.state.elemento == Element.AGUA:
+        elif elemento == Element.AGUA:
             # Onda
             points = []
             for i in range(-10, 11, 2):
                 wave_y = y + 5 * pygame.math.Vector2(1, 0).rotate(i * 18).y
                 points.append((x + i, wave_y))
             if len(points) > 1:
-                pygame.draw.lines(screen, color[:3], False, points, 3)
+                pygame.draw.lines(surf, color, False, points, 3)
     
     def _draw_timer(self, screen: pygame.Surface, alpha: int):
         """Dibuja el timer restante (para debug)"""
@@ -191,7 +240,7 @@ class CircleManager:
     
     MAX_CIRCLES = 2
     
-    # Posiciones fijas para los círculos (frente al jugador)
+    # Posiciones fijas para los círculos (frente al jugador, coordenadas lógicas)
     CIRCLE_POSITIONS = [
         (300, 500),  # Primer círculo
         (450, 500),  # Segundo círculo
@@ -199,6 +248,7 @@ class CircleManager:
     
     def __init__(self):
         self.circles: List[CirculoMagico] = []
+        CirculoMagico.build_frame_cache()
         self.circle_lifetime = 8.0  # Duración por defecto
         
     def create_circle(self, elemento: Element) -> bool:
@@ -237,10 +287,10 @@ class CircleManager:
         
         self.circles = still_active
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja todos los círculos activos"""
+    def submit(self, queue: RenderQueue):
+        """Encola todos los círculos activos"""
         for circle in self.circles:
-            circle.draw(screen)
+            circle.submit(queue)
     
     def get_active_elements(self) -> List[Element]:
         """
@@ -296,5 +346,6 @@ def update(self, dt):
     self.circle_manager.update(dt)
 
 def draw(self, screen):
-    self.circle_manager.draw(screen)
+    self.circle_manager.submit(self.render_queue)
+    self.render_queue.flush(screen)
 """
\ No newline at end of file
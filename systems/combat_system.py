@@ -20,6 +20,11 @@ class CombatSystem:
         self.enemy_manager = enemy_manager
         self.audio = audio_manager
         
+        # Broadphase: foto de los enemigos y sus rects, tomada en cada update
+        self._enemies = []
+        self._enemy_rects = []
+        self.broadphase_overlaps = 0
+        
         # Callbacks para eventos de combate
         self.on_enemy_hit = None  # Callback(enemy, damage, element) -> None
         self.on_projectile_hit = None  # Callback(projectile, enemy) -> None
@@ -48,6 +53,12 @@ class CombatSystem:
             'enemies_killed': 0
         }
         
+        # Los rects de los enemigos no cambian durante el combate (el empujón
+        # mueve x, el rect se actualiza en el próximo update del enemigo)
+        self._enemies = list(self.enemy_manager.get_active_enemies())
+        self._enemy_rects = [enemy.rect for enemy in self._enemies]
+        self.broadphase_overlaps = 0
+        
         # Verificar colisiones de proyectiles
         projectile_stats = self._check_projectile_collisions()
         stats['projectile_hits'] = projectile_stats['hits']
@@ -76,11 +87,8 @@ class CombatSystem:
             if not projectile.state.active or projectile.state.spell_data is None:
                 continue
             
-            # Verificar colisión con cada enemigo
-            for enemy in self.enemy_manager.get_active_enemies():
-                if not projectile.rect.colliderect(enemy.rect):
-                    continue
-                
+            # Solo los enemigos que se superponen con el proyectil
+            for enemy in self._enemies_overlapping(projectile.rect):
                 # Verificar si el proyectil puede golpear (cooldown interno)
                 if not projectile.can_hit_enemy():
                     continue
@@ -144,11 +152,8 @@ class CombatSystem:
             if not area_effect.state.active:
                 continue
             
-            for enemy in self.enemy_manager.get_active_enemies():
-                # Verificar si el enemigo está dentro del área
-                if not area_effect.rect.colliderect(enemy.rect):
-                    continue
-                
+            # Solo los enemigos dentro del área
+            for enemy in self._enemies_overlapping(area_effect.rect):
                 # Verificar cooldown de tick (para evitar daño múltiple instantáneo)
                 if not area_effect.can_affect_enemy(id(enemy)):
                     continue
@@ -188,6 +193,23 @@ class CombatSystem:
         
         return stats
     
+    def _enemies_overlapping(self, rect):
+        """
+        Enemigos cuyo rect se superpone con rect, en el orden de la lista
+        de enemigos. La comparación contra todos los rects se hace en C
+        (Rect.collidelistall); en Python solo se recorren los que chocan.
+        
+        Args:
+            rect: Rect del proyectil o del área
+            
+        Returns:
+            list: Enemigos superpuestos
+        """
+        indices = rect.collidelistall(self._enemy_rects)
+        self.broadphase_overlaps += len(indices)
+        enemies = self._enemies
+        return [enemies[i] for i in indices]
+    
     def _apply_spell_effects(self, enemy, spell_data):
         """
         Aplica efectos de estado a un enemigo según el tipo de hechizo
@@ -338,5 +360,6 @@ class CombatSystem:
         return {
             'active_projectiles': len(list(self.spell_system.get_active_projectiles())),
             'active_areas': len(list(self.spell_system.get_active_area_effects())),
-            'active_enemies': len(list(self.enemy_manager.get_active_enemies()))
+            'active_enemies': len(list(self.enemy_manager.get_active_enemies())),
+            'broadphase_overlaps': self.broadphase_overlaps
         }
\ No newline at end of file
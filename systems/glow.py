@@ -0,0 +1,137 @@
+"""
+Texturas de brillo (glow)
+Degradados radiales pre-calculados con NumPy, uno por (color, radio,
+intensidad), que se dibujan con mezcla aditiva (BLEND_RGB_ADD): el negro
+no suma nada, así que un halo de luz cuesta un solo blit, sin superficies
+con alpha ni círculos apilados por frame.
+
+Uso típico:
+    glow_library.submit(queue, (255, 200, 0), (x, y), radius=50,
+                        layer=RenderLayer.CIRCLES, intensity=0.8)
+"""
+from typing import Dict, Tuple
+
+import numpy as np
+import pygame
+
+from systems.render_queue import RenderQueue
+
+
+class GlowLibrary:
+    """
+    Caché de degradados radiales opacos (negro en el borde).
+
+    La intensidad y el radio se cuantizan para que los halos que pulsan o
+    se desvanecen reutilicen un puñado de texturas en lugar de crear una
+    por frame.
+    """
+
+    LEVELS = 8         # Niveles de intensidad (0 = no se dibuja)
+    RADIUS_STEP = 4    # Los radios se redondean a múltiplos de esto
+    FALLOFF = 2.0      # Exponente de la caída (mayor = núcleo más concentrado)
+
+    def __init__(self):
+        # (color, radio, nivel) -> superficie RGB opaca de lado 2 * radio + 1
+        self._textures: Dict[tuple, pygame.Surface] = {}
+
+        # Estadísticas
+        self.created = 0
+
+    # ======================
+    # TEXTURAS
+    # ======================
+
+    def texture(self, color: Tuple[int, int, int], radius: float,
+                intensity: float = 1.0) -> pygame.Surface:
+        """
+        Degradado radial de un color (compartido, no modificar).
+
+        Args:
+            color: Color RGB en el centro
+            radius: Radio del halo (píxeles lógicos)
+            intensity: 0.0 - 1.0, multiplica el color
+
+        Returns:
+            Superficie opaca para dibujar con BLEND_RGB_ADD
+        """
+        radius = self.quantize_radius(radius)
+        level = self.quantize_intensity(intensity)
+        key = (tuple(color), radius, level)
+
+        surface = self._textures.get(key)
+        if surface is None:
+            surface = self._render(color, radius, level / self.LEVELS)
+            self._textures[key] = surface
+            self.created += 1
+        return surface
+
+    def _render(self, color: Tuple[int, int, int], radius: int,
+                intensity: float) -> pygame.Surface:
+        """Calcula el degradado con NumPy (una sola vez por clave)"""
+        axis = np.arange(-radius, radius + 1, dtype=np.float32)
+        distance = np.sqrt(axis[:, None] ** 2 + axis[None, :] ** 2)
+        falloff = np.clip(1.0 - distance / radius, 0.0, 1.0) ** self.FALLOFF
+
+        rgb = falloff[:, :, None] * (np.asarray(color, dtype=np.float32) * intensity)
+        return pygame.surfarray.make_surface(rgb.astype(np.uint8)).convert()
+
+    def quantize_radius(self, radius: float) -> int:
+        """Radio redondeado al paso de la caché (mínimo un paso)"""
+        step = self.RADIUS_STEP
+        return max(step, int(round(radius / step)) * step)
+
+    def quantize_intensity(self, intensity: float) -> int:
+        """Nivel de intensidad (0 - LEVELS)"""
+        return int(round(max(0.0, min(1.0, intensity)) * self.LEVELS))
+
+    # ======================
+    # DIBUJO
+    # ======================
+
+    def submit(self, queue: RenderQueue, color: Tuple[int, int, int],
+               center: Tuple[float, float], radius: float, layer: int,
+               intensity: float = 1.0):
+        """
+        Encola un halo aditivo centrado en un punto.
+
+        Args:
+            queue: Cola de renderizado
+            color: Color RGB en el centro
+            center: Centro en coordenadas lógicas
+            radius: Radio del halo
+            layer: Capa (ver RenderLayer)
+            intensity: 0.0 - 1.0 (por ejemplo, para desvanecerlo)
+        """
+        if self.quantize_intensity(intensity) == 0:
+            return
+        surface = self.texture(color, radius, intensity)
+        half = surface.get_width() // 2
+        queue.submit(surface, (int(center[0]) - half, int(center[1]) - half), layer,
+                     special_flags=pygame.BLEND_RGB_ADD)
+
+    def draw(self, target: pygame.Surface, color: Tuple[int, int, int],
+             center: Tuple[float, float], radius: float, intensity: float = 1.0):
+        """Dibuja un halo directamente sobre una superficie (pantallas de menú)"""
+        if self.quantize_intensity(intensity) == 0:
+            return
+        surface = self.texture(color, radius, intensity)
+        half = surface.get_width() // 2
+        target.blit(surface, (int(center[0]) - half, int(center[1]) - half),
+                    special_flags=pygame.BLEND_RGB_ADD)
+
+    def clear(self):
+        """Descarta las texturas (se vuelven a crear al usarse)"""
+        self._textures.clear()
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas de la caché (para debug)"""
+        return {
+            "textures": len(self._textures),
+            "created": self.created,
+            "bytes": sum(s.get_width() * s.get_height() * s.get_bytesize()
+                         for s in self._textures.values())
+        }
+
+
+# Instancia compartida por círculos, efectos de área y proyectiles
+glow_library = GlowLibrary()
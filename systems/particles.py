@@ -0,0 +1,294 @@
+"""
+Sistema de partículas
+Las partículas viven en arreglos de NumPy (posición, velocidad, vida,
+rotación) y se actualizan en bloque, sin objetos ni diccionarios por
+partícula. Cada tipo de partícula registra un sprite que se pre-rota a
+ANGLE_STEPS ángulos (y, si se desvanece, a ALPHA_LEVELS opacidades) una
+sola vez; dibujar es elegir la versión más cercana y hacer un blits().
+
+Uso típico:
+    particles = ParticleSystem(gravity=600)
+    chispa = particles.get_kind(("chispa", color), lambda: make_spark_sprite(color))
+    particles.emit_burst(chispa, x, y, count=10, speed=(80, 220), life=(0.2, 0.5))
+    ...
+    particles.update(dt)
+    particles.submit(queue, RenderLayer.PARTICLES)
+"""
+from typing import Callable, Dict, Hashable, List, Tuple
+
+import numpy as np
+import pygame
+
+from config.screen import LOGICAL_SIZE
+
+
+# ======================
+# SPRITES
+# ======================
+
+def make_spark_sprite(color: Tuple[int, int, int], size: int = 6) -> pygame.Surface:
+    """Chispa alargada (se orienta con la rotación de la partícula)"""
+    surf = pygame.Surface((size * 2, size), pygame.SRCALPHA)
+    pygame.draw.ellipse(surf, color, surf.get_rect())
+    core = tuple(min(255, c + 100) for c in color)
+    pygame.draw.ellipse(surf, core, surf.get_rect().inflate(-size, -size // 2))
+    return surf
+
+
+def make_confetti_sprite(color: Tuple[int, int, int], size: int) -> pygame.Surface:
+    """Rectángulo de confeti de size x 2*size"""
+    surf = pygame.Surface((size, size * 2), pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+class ParticleSystem:
+    """
+    Conjunto de partículas con capacidad fija.
+
+    Las partículas vivas ocupan siempre las primeras `count` posiciones de
+    los arreglos; al morir se compactan con una máscara booleana.
+    """
+
+    ANGLE_STEPS = 32     # Rotaciones pre-calculadas por sprite
+    ALPHA_LEVELS = 4     # Opacidades pre-calculadas para las que se desvanecen
+    MARGIN = 50          # Distancia fuera de los límites antes de descartar
+
+    def __init__(self, capacity: int = 4096, gravity: float = 0.0,
+                 bounds: Tuple[int, int] = LOGICAL_SIZE):
+        """
+        Args:
+            capacity: Máximo de partículas simultáneas (las nuevas se descartan)
+            gravity: Aceleración vertical (píxeles/s²)
+            bounds: Área visible (ancho, alto); lo que sale de ella muere
+        """
+        self.capacity = capacity
+        self.gravity = gravity
+        self.bounds = bounds
+        self.count = 0
+        self.density = 1.0  # Fracción de lo pedido que emite emit_burst (calidad)
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.angle = np.zeros(capacity, dtype=np.float32)
+        self.spin = np.zeros(capacity, dtype=np.float32)
+        self.kind = np.zeros(capacity, dtype=np.int32)
+
+        # Sprites pre-rotados de todos los tipos en una sola tabla:
+        #   índice = base[tipo] + nivel_alpha * ANGLE_STEPS + paso_de_ángulo
+        self._sprites: List[pygame.Surface] = []
+        self._half = np.zeros((0, 2), dtype=np.int32)
+        self._kind_base: List[int] = []
+        self._kind_levels: List[int] = []
+        self._kinds: Dict[Hashable, int] = {}
+
+        # Estadísticas
+        self.emitted = 0
+        self.dropped = 0
+
+    # ======================
+    # TIPOS
+    # ======================
+
+    def register(self, surface: pygame.Surface, fade: bool = True) -> int:
+        """
+        Pre-rota un sprite y lo registra como tipo de partícula.
+
+        Args:
+            surface: Sprite sin rotar
+            fade: True si la partícula se desvanece al final de su vida
+
+        Returns:
+            Identificador del tipo (para emit_burst/spawn)
+        """
+        levels = self.ALPHA_LEVELS if fade else 1
+        kind_id = len(self._kind_base)
+        self._kind_base.append(len(self._sprites))
+        self._kind_levels.append(levels)
+
+        half = []
+        for level in range(levels):
+            alpha = 255 * (level + 1) // levels
+            for step in range(self.ANGLE_STEPS):
+                rotated = pygame.transform.rotate(surface, step * 360 / self.ANGLE_STEPS)
+                if alpha < 255:
+                    # El alpha va en los píxeles para que todo salga en un solo blits()
+                    rotated.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                self._sprites.append(rotated)
+                half.append((rotated.get_width() // 2, rotated.get_height() // 2))
+
+        self._half = np.concatenate([self._half, np.array(half, dtype=np.int32)])
+        return kind_id
+
+    def get_kind(self, key: Hashable, builder: Callable[[], pygame.Surface],
+                 fade: bool = True) -> int:
+        """Retorna el tipo registrado bajo key, creándolo con builder() la primera vez"""
+        kind_id = self._kinds.get(key)
+        if kind_id is None:
+            kind_id = self.register(builder(), fade)
+            self._kinds[key] = kind_id
+        return kind_id
+
+    # ======================
+    # EMISIÓN
+    # ======================
+
+    def spawn(self, kind, x, y, vx, vy, life=np.inf, angle=0.0, spin=0.0):
+        """
+        Agrega partículas a partir de valores o arreglos (se difunden al
+        largo del arreglo más largo).
+
+        Args:
+            kind: Tipo (o arreglo de tipos)
+            x, y: Posición inicial
+            vx, vy: Velocidad inicial (píxeles/s)
+            life: Vida en segundos (inf = hasta salir de pantalla)
+            angle: Rotación inicial en grados
+            spin: Velocidad de rotación (grados/s)
+        """
+        columns = np.broadcast_arrays(kind, x, y, vx, vy, life, angle, spin)
+        n = columns[0].size
+        free = self.capacity - self.count
+        if n > free:
+            self.dropped += n - free
+            n = free
+        if n <= 0:
+            return
+
+        kind, x, y, vx, vy, life, angle, spin = (np.ravel(c)[:n] for c in columns)
+        s = slice(self.count, self.count + n)
+        self.kind[s] = kind
+        self.pos[s, 0] = x
+        self.pos[s, 1] = y
+        self.vel[s, 0] = vx
+        self.vel[s, 1] = vy
+        self.life[s] = life
+        self.max_life[s] = life
+        self.angle[s] = angle
+        self.spin[s] = spin
+
+        self.count += n
+        self.emitted += n
+
+    def emit_burst(self, kind: int, x: float, y: float, count: int,
+                   speed: Tuple[float, float] = (60.0, 200.0),
+                   life: Tuple[float, float] = (0.3, 0.6),
+                   direction: float = 0.0, spread: float = 360.0):
+        """
+        Estallido de partículas desde un punto (chispas, impactos).
+
+        Args:
+            kind: Tipo de partícula
+            x, y: Origen
+            count: Cantidad
+            speed: Rango de rapidez (píxeles/s)
+            life: Rango de vida (segundos)
+            direction: Dirección central en grados (0 = derecha, 90 = arriba)
+            spread: Apertura del cono en grados (360 = todas las direcciones)
+        """
+        count = int(round(count * self.density))
+        if count <= 0:
+            return
+
+        theta = np.radians(direction + np.random.uniform(-spread / 2, spread / 2, count))
+        rapidez = np.random.uniform(speed[0], speed[1], count)
+        vx = np.cos(theta) * rapidez
+        vy = -np.sin(theta) * rapidez
+
+        # Las chispas apuntan hacia donde se mueven
+        self.spawn(kind, x, y, vx, vy,
+                   life=np.random.uniform(life[0], life[1], count),
+                   angle=np.degrees(theta),
+                   spin=0.0)
+
+    # ======================
+    # ACTUALIZACIÓN
+    # ======================
+
+    def update(self, dt: float):
+        """Integra movimiento y descarta las partículas muertas o fuera de pantalla"""
+        n = self.count
+        if n == 0:
+            return
+
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        if self.gravity:
+            vel[:, 1] += self.gravity * dt
+        pos += vel * dt
+        self.angle[:n] += self.spin[:n] * dt
+        self.life[:n] -= dt
+
+        width, height = self.bounds
+        keep = ((self.life[:n] > 0)
+                & (pos[:, 1] < height + self.MARGIN)
+                & (pos[:, 0] > -self.MARGIN)
+                & (pos[:, 0] < width + self.MARGIN))
+
+        if not keep.all():
+            alive = np.flatnonzero(keep)
+            m = alive.size
+            for array in (self.pos, self.vel, self.life, self.max_life,
+                          self.angle, self.spin, self.kind):
+                array[:m] = array[alive]
+            self.count = m
+
+    # ======================
+    # DIBUJO
+    # ======================
+
+    def blit_sequence(self) -> List[tuple]:
+        """
+        Arma la secuencia (sprite, posición) de las partículas vivas.
+
+        Returns:
+            Lista apta para Surface.blits() / RenderQueue.submit_batch()
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        kind = self.kind[:n]
+        step = (np.round(self.angle[:n] * (self.ANGLE_STEPS / 360.0)).astype(np.int32)
+                % self.ANGLE_STEPS)
+
+        levels = np.asarray(self._kind_levels, dtype=np.int32)[kind]
+        # Las de vida infinita (confeti) no se desvanecen: inf/inf no se calcula
+        life = self.life[:n]
+        ratio = np.divide(life, self.max_life[:n], out=np.ones_like(life),
+                          where=np.isfinite(self.max_life[:n]))
+        level = np.minimum(np.ceil(ratio * levels).astype(np.int32), levels) - 1
+        level = np.maximum(level, 0)
+
+        index = (np.asarray(self._kind_base, dtype=np.int32)[kind]
+                 + level * self.ANGLE_STEPS + step)
+        topleft = self.pos[:n].astype(np.int32) - self._half[index]
+
+        sprites = self._sprites
+        return [(sprites[i], (x, y))
+                for i, x, y in zip(index.tolist(), topleft[:, 0].tolist(), topleft[:, 1].tolist())]
+
+    def draw(self, target: pygame.Surface):
+        """Dibuja directamente sobre una superficie (pantallas de menú)"""
+        target.blits(self.blit_sequence(), doreturn=0)
+
+    def submit(self, queue, layer: int):
+        """Encola todas las partículas en una capa de la RenderQueue"""
+        queue.submit_batch(self.blit_sequence(), layer)
+
+    def clear(self):
+        """Elimina todas las partículas (los tipos registrados se conservan)"""
+        self.count = 0
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas del sistema (para debug)"""
+        return {
+            "alive": self.count,
+            "capacity": self.capacity,
+            "kinds": len(self._kind_base),
+            "sprites": len(self._sprites),
+            "emitted": self.emitted,
+            "dropped": self.dropped
+        }
@@ -263,9 +263,6 @@ class PlayerController:
         Args:
             dt: Delta time
         """
-        # Actualizar animación
-        self.animation.update(dt)
-        
         # Volver a idle cuando termine la animación de cast
         current_anim = self.animation.get_current_animation_name()
         if current_anim and current_anim.startswith("cast_"):
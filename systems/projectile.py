@@ -1,11 +1,17 @@
 import pygame
 import math
+from collections import Counter
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 from config.enums import SpellType, TrajectoryType, BehaviorType
 from config.spell_data import get_spell_data, SpellData
-from systems.animation import AnimationController, Animation, load_animation_frames, create_placeholder_frames
+from config.screen import LOGICAL_WIDTH, LOGICAL_HEIGHT
+from systems.animation import (load_animation_frames, has_animation_frames, animation_frame_requests,
+                               animation_clock)
+from systems.render_queue import RenderLayer, RenderQueue
+from systems.quality_governor import quality_governor
+from systems.glow import glow_library
 
 
 @dataclass
@@ -22,15 +28,123 @@ class ProjectileState:
     trajectory_type: TrajectoryType = TrajectoryType.FRONTAL
 
 
+def _spell_sprite_args(spell_type: SpellType) -> tuple:
+    """Argumentos (carpeta, prefijo, frames, escala) de la animación de un hechizo"""
+    tamaño = get_spell_data(spell_type).tamaño
+    folder_path = f"assets/sprites/spells/{spell_type.name.lower()}"
+    return folder_path, "frame_", Projectile.ANIMATION_FRAMES, (tamaño * 2, tamaño * 2)
+
+
+def load_spell_frames(spell_type: SpellType) -> Optional[List[pygame.Surface]]:
+    """
+    Carga los frames de un hechizo (vía caché y atlas de sprites).
+    
+    Returns:
+        Lista de frames, o None si el hechizo no tiene sprites (usar procedural)
+    """
+    folder_path, prefix, num_frames, scale = _spell_sprite_args(spell_type)
+    
+    # Sin sprites: consulta O(1) al manifiesto, sin excepciones en cada spawn
+    if not has_animation_frames(folder_path, prefix):
+        return None
+    
+    return load_animation_frames(folder_path, prefix, num_frames=num_frames, scale=scale)
+
+
+def spell_frame_requests(spell_type: SpellType) -> List[tuple]:
+    """Imágenes (ruta, escala) que cargaría load_spell_frames, para precargar"""
+    return animation_frame_requests(*_spell_sprite_args(spell_type))
+
+
+def render_procedural_projectile(spell_data: SpellData) -> pygame.Surface:
+    """
+    Pre-renderiza el gráfico procedural de un proyectil (fallback sin sprites):
+    círculo principal, círculo interior (si hay color secundario) y brillo.
+    
+    Returns:
+        Superficie de lado 2 * tamaño + 1 con el proyectil centrado
+    """
+    color = spell_data.color_primario
+    radius = spell_data.tamaño
+    surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    
+    # Círculo principal
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    
+    # Círculo interior (si hay color secundario)
+    if spell_data.color_secundario:
+        inner_radius = max(1, radius // 2)
+        pygame.draw.circle(surf, spell_data.color_secundario, (radius, radius), inner_radius)
+    
+    # Brillo central
+    highlight_radius = max(1, radius // 4)
+    highlight_color = tuple(min(255, c + 100) for c in color)
+    pygame.draw.circle(
+        surf,
+        highlight_color,
+        (radius - radius // 3, radius - radius // 3),
+        highlight_radius
+    )
+    return surf
+
+
+# Frames por (tipo de hechizo, tamaño): sprites reales o el procedural
+_spell_frames = {}
+
+
+def get_spell_frames(spell_type: SpellType) -> List[pygame.Surface]:
+    """
+    Retorna los frames de un hechizo: los sprites si existen, o el gráfico
+    procedural pre-renderizado como animación de un solo frame.
+    """
+    spell_data = get_spell_data(spell_type)
+    key = (spell_type, spell_data.tamaño)
+    
+    frames = _spell_frames.get(key)
+    if frames is None:
+        frames = load_spell_frames(spell_type) or [render_procedural_projectile(spell_data)]
+        _spell_frames[key] = frames
+    return frames
+
+
+# Imposters por (tipo de hechizo, tamaño): un solo círculo del color primario
+_imposters = {}
+
+
+def get_spell_imposter(spell_type: SpellType) -> pygame.Surface:
+    """
+    Retorna la versión barata de un proyectil para enjambres (ver
+    ProjectileLOD): un círculo de un color, más chico que el sprite.
+    """
+    spell_data = get_spell_data(spell_type)
+    key = (spell_type, spell_data.tamaño)
+    
+    imposter = _imposters.get(key)
+    if imposter is None:
+        radius = max(2, spell_data.tamaño * 2 // 3)
+        imposter = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(imposter, spell_data.color_primario, (radius, radius), radius)
+        _imposters[key] = imposter
+    return imposter
+
+
+def preload_spell_frames():
+    """Prepara los frames de todos los hechizos (al crear el pool)"""
+    for spell_type in SpellType:
+        get_spell_frames(spell_type)
+        if get_spell_data(spell_type).lod is not None:
+            get_spell_imposter(spell_type)
+
+
 class Projectile:
     """
     Proyectil que viaja por la pantalla.
     Soporta 3 tipos de trayectorias, diferentes comportamientos y animaciones de sprites.
     """
     
-    # Constantes de pantalla
-    SCREEN_WIDTH = 1280
-    SCREEN_HEIGHT = 720
+    # Límites del espacio lógico (independientes de la ventana)
+    SCREEN_WIDTH = LOGICAL_WIDTH
+    SCREEN_HEIGHT = LOGICAL_HEIGHT
     
     # Constantes de trayectorias
     GRAVITY = 800.0  # Gravedad para trayectorias aéreas (píxeles/s²)
@@ -41,58 +155,24 @@ class Projectile:
     ANIMATION_FRAMES = 3  # Número de frames por animación
     ANIMATION_FRAME_DURATION = 0.1  # Duración de cada frame en segundos
     
+    # Halo aditivo (radio relativo al tamaño del hechizo)
+    GLOW_SCALE = 2.0
+    GLOW_INTENSITY = 0.5
+    
     def __init__(self):
         self.state = ProjectileState()
         self.rect = pygame.Rect(0, 0, 20, 20)  # Colisión básica
-        self.anim_controller = None  # Se crea al activar el proyectil
-        self.use_animation = False  # Flag para saber si tiene animación o fallback
         
-    def _load_animation(self, spell_type: SpellType):
-        """Carga la animación del proyectil según el tipo de hechizo"""
-        try:
-            # Intentar cargar frames desde carpeta del hechizo
-            spell_name = spell_type.name.lower()
-            folder_path = f"assets/sprites/spells/{spell_name}"
-
-            # Verificar que al menos existe el primer frame
-            first_frame_path = f"{folder_path}/frame_0.png"
-
-            # Intentar cargar el primer frame como prueba
-            test_frame = pygame.image.load(first_frame_path).convert_alpha()
-
-            # Si llegamos aquí, el archivo existe
-            frames = load_animation_frames(
-                folder_path,
-                "frame_",
-                num_frames=self.ANIMATION_FRAMES,
-                scale=(self.state.spell_data.tamaño * 2, self.state.spell_data.tamaño * 2)
-            )
-
-            # Crear animación
-            anim = Animation(
-                frames, 
-                frame_duration=self.ANIMATION_FRAME_DURATION, 
-                loop=True
-            )
-
-            # Crear controller y agregar animación
-            self.anim_controller = AnimationController()
-            self.anim_controller.add_animation("idle", anim)
-            self.anim_controller.play("idle")
-
-            self.use_animation = True
-            print(f"✓ Animación cargada para {spell_name}")
-
-        except (FileNotFoundError, pygame.error) as e:
-            # Fallback: usar gráficos procedurales
-            print(f"⚠ No se encontraron sprites para {spell_type.name}, usando fallback: {e}")
-            self.anim_controller = None
-            self.use_animation = False
+        # Animación: frames compartidos (sprites o procedural) e instante de inicio
+        self.frames: List[pygame.Surface] = []
+        self.anim_start = 0.0
+        self.spell_type: Optional[SpellType] = None
     
     def activate(self, spell_type: SpellType, start_x: float, start_y: float, 
                  trajectory: TrajectoryType):
         """Activa el proyectil con un hechizo específico"""
         self.state.active = True
+        self.spell_type = spell_type
         self.state.spell_data = get_spell_data(spell_type)
         self.state.trajectory_type = trajectory
         self.state.x = start_x
@@ -100,8 +180,9 @@ class Projectile:
         self.state.lifetime = 0.0
         self.state.enemigos_atravesados = 0
         
-        # Cargar animación
-        self._load_animation(spell_type)
+        # Animación (ya cargada en el pool, sin I/O)
+        self.frames = get_spell_frames(spell_type)
+        self.anim_start = animation_clock.time
         
         # Configurar velocidad según trayectoria
         self._setup_trajectory()
@@ -144,10 +225,6 @@ class Projectile:
         if self.state.lifetime > self.state.spell_data.duracion:
             return False
         
-        # Actualizar animación si existe
-        if self.use_animation and self.anim_controller:
-            self.anim_controller.update(dt)
-        
         # Aplicar física según trayectoria
         if self.state.trajectory_type == TrajectoryType.AEREA:
             # Aplicar gravedad
@@ -222,56 +299,37 @@ class Projectile:
         """Desactiva el proyectil para reutilizarlo"""
         self.state.active = False
         self.state.spell_data = None
-        self.anim_controller = None
-        self.use_animation = False
+        self.frames = []
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja el proyectil en pantalla"""
+    def submit(self, queue: RenderQueue, imposter: bool = False, frame_scale: float = 1.0,
+               glow: bool = True):
+        """
+        Encola el proyectil para dibujarlo.
+        
+        Args:
+            queue: Cola de renderizado
+            imposter: Dibujar el círculo simple en lugar del sprite
+            frame_scale: Multiplicador de la duración de cada frame (animación más lenta)
+            glow: Dibujar el halo (solo a detalle completo, sin ningún LOD activo)
+        """
         if not self.state.active:
             return
         
-        if self.use_animation and self.anim_controller:
-            # Usar animación de sprites
-            frame = self.anim_controller.get_current_frame()
-            if frame:
-                rect = frame.get_rect(center=(int(self.state.x), int(self.state.y)))
-                screen.blit(frame, rect)
+        if imposter:
+            surface = get_spell_imposter(self.spell_type)
         else:
-            # Fallback: gráficos procedurales (círculos de colores)
-            self._draw_procedural(screen)
-    
-    def _draw_procedural(self, screen: pygame.Surface):
-        """Dibuja el proyectil usando gráficos procedurales (fallback)"""
-        color = self.state.spell_data.color_primario
-        radius = self.state.spell_data.tamaño
-        
-        # Círculo principal
-        pygame.draw.circle(
-            screen, 
-            color, 
-            (int(self.state.x), int(self.state.y)), 
-            radius
-        )
-        
-        # Círculo interior (si hay color secundario)
-        if self.state.spell_data.color_secundario:
-            inner_radius = max(1, radius // 2)
-            pygame.draw.circle(
-                screen, 
-                self.state.spell_data.color_secundario, 
-                (int(self.state.x), int(self.state.y)), 
-                inner_radius
-            )
-        
-        # Brillo central (opcional, para más detalle)
-        highlight_radius = max(1, radius // 4)
-        highlight_color = tuple(min(255, c + 100) for c in color)
-        pygame.draw.circle(
-            screen,
-            highlight_color,
-            (int(self.state.x - radius // 3), int(self.state.y - radius // 3)),
-            highlight_radius
-        )
+            if glow and quality_governor.tier.glow_proyectiles:
+                spell_data = self.state.spell_data
+                glow_library.submit(queue, spell_data.color_secundario or spell_data.color_primario,
+                                    (self.state.x, self.state.y),
+                                    spell_data.tamaño * self.GLOW_SCALE,
+                                    RenderLayer.PROJECTILES, intensity=self.GLOW_INTENSITY)
+            
+            # Sprite real o gráfico procedural
+            elapsed = animation_clock.elapsed(self.anim_start)
+            duration = self.ANIMATION_FRAME_DURATION * frame_scale
+            surface = self.frames[int(elapsed / duration) % len(self.frames)]
+        queue.submit_centered(surface, (self.state.x, self.state.y), RenderLayer.PROJECTILES)
 
 
 class ProjectilePool:
@@ -286,7 +344,14 @@ class ProjectilePool:
             pool_size: Número de proyectiles pre-creados
         """
         self.pool: List[Projectile] = [Projectile() for _ in range(pool_size)]
+        
+        # Frames de todos los hechizos listos antes del primer disparo
+        preload_spell_frames()
         self.active_projectiles: List[Projectile] = []
+        
+        # Nivel de detalle del último frame (para debug)
+        self.imposters = 0
+        self.merged = 0
     
     def spawn(self, spell_type: SpellType, start_x: float, start_y: float,
               trajectory: TrajectoryType) -> Optional[Projectile]:
@@ -317,10 +382,47 @@ class ProjectilePool:
         
         self.active_projectiles = still_active
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja todos los proyectiles activos"""
-        for projectile in self.active_projectiles:
-            projectile.draw(screen)
+    def submit(self, queue: RenderQueue):
+        """
+        Encola todos los proyectiles activos, aplicando el nivel de detalle
+        de cada hechizo (SpellData.lod) según cuántos suyos hay en pantalla.
+        """
+        # Los que chocaron este frame siguen en la lista hasta el próximo update
+        visible = [p for p in self.active_projectiles if p.state.active]
+        counts = Counter(p.spell_type for p in visible)
+        occupied = set()
+        imposters = 0
+        merged = 0
+        
+        for projectile in visible:
+            lod = projectile.state.spell_data.lod
+            if lod is None:
+                projectile.submit(queue)
+                continue
+            
+            count = counts[projectile.spell_type]
+            
+            # Fusión: de los que caen en la misma celda se dibuja uno solo
+            fused = bool(lod.fusion_desde) and count > lod.fusion_desde
+            if fused:
+                cell = (projectile.spell_type,
+                        int(projectile.state.x) // lod.celda_fusion,
+                        int(projectile.state.y) // lod.celda_fusion)
+                if cell in occupied:
+                    merged += 1
+                    continue
+                occupied.add(cell)
+            
+            imposter = bool(lod.imposter_desde) and count > lod.imposter_desde
+            slow = bool(lod.animacion_lenta_desde) and count > lod.animacion_lenta_desde
+            # El halo es un blit aditivo extra: solo sin ningún recorte de LOD
+            projectile.submit(queue, imposter=imposter,
+                              frame_scale=lod.factor_animacion if slow else 1.0,
+                              glow=not (fused or imposter or slow))
+            imposters += imposter
+        
+        self.imposters = imposters
+        self.merged = merged
     
     def get_active_projectiles(self) -> List[Projectile]:
         """Retorna lista de proyectiles activos (para colisiones)"""
@@ -337,7 +439,9 @@ class ProjectilePool:
         return {
             "total": len(self.pool),
             "active": len(self.active_projectiles),
-            "available": len(self.pool) - len(self.active_projectiles)
+            "available": len(self.pool) - len(self.active_projectiles),
+            "imposters": self.imposters,
+            "merged": self.merged
         }
 
 
@@ -371,5 +475,6 @@ class PlayingState(State):
     
     def draw(self, pantalla):
         pantalla.fill((50, 80, 50))
-        self.projectile_pool.draw(pantalla)
+        self.projectile_pool.submit(self.render_queue)
+        self.render_queue.flush(pantalla)
 """
\ No newline at end of file
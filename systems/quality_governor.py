@@ -0,0 +1,124 @@
+"""
+Gobernador de calidad
+Mide el tiempo de trabajo de cada frame (sin la espera de Clock.tick) y
+mantiene un percentil sobre una ventana móvil. Si se pasa del presupuesto
+baja un nivel de calidad (config/quality.py); si sobra margen, sube uno.
+
+Los sistemas leen el nivel actual desde la instancia compartida:
+    if quality_governor.tier.barras_hp: ...
+"""
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+
+from config.quality import (QualityTier, QUALITY_TIERS, QUALITY_AUTO, FRAME_BUDGET_MS,
+                            QUALITY_PERCENTILE, QUALITY_WINDOW, DOWNGRADE_RATIO, UPGRADE_RATIO,
+                            UPGRADE_HOLD)
+
+
+class QualityGovernor:
+    """Elige el nivel de calidad según el tiempo de frame medido"""
+
+    # Cada cuántos frames se recalcula el percentil
+    EVAL_INTERVAL = 15
+
+    def __init__(self, tiers: List[QualityTier] = QUALITY_TIERS, enabled: bool = QUALITY_AUTO,
+                 budget_ms: float = FRAME_BUDGET_MS, percentile: float = QUALITY_PERCENTILE,
+                 window: int = QUALITY_WINDOW, downgrade_ratio: float = DOWNGRADE_RATIO,
+                 upgrade_ratio: float = UPGRADE_RATIO, upgrade_hold: int = UPGRADE_HOLD):
+        """
+        Args:
+            tiers: Niveles de mayor a menor calidad
+            enabled: False para quedarse siempre en el primer nivel
+            budget_ms: Presupuesto por frame en milisegundos
+            percentile: Percentil de la ventana que se compara con el presupuesto
+            window: Tamaño de la ventana (también es la espera mínima entre cambios)
+            downgrade_ratio: Bajar si el percentil supera budget_ms * ratio
+            upgrade_ratio: Subir si el percentil queda bajo budget_ms * ratio
+            upgrade_hold: Frames que deben pasar tras una bajada antes de subir
+        """
+        self.tiers = tiers
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.percentile = percentile
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.upgrade_hold = upgrade_hold
+
+        self.index = 0
+        self._samples: deque = deque(maxlen=window)
+        self._since_eval = 0
+        self._since_downgrade = upgrade_hold
+
+        # Estadísticas
+        self.last_percentile_ms: Optional[float] = None
+        self.changes = 0
+
+    @property
+    def tier(self) -> QualityTier:
+        """Nivel de calidad actual"""
+        return self.tiers[self.index]
+
+    def record(self, frame_ms: float) -> bool:
+        """
+        Registra el tiempo de trabajo de un frame.
+
+        Args:
+            frame_ms: Milisegundos de trabajo (p. ej. Clock.get_rawtime())
+
+        Returns:
+            True si el nivel de calidad cambió
+        """
+        if not self.enabled:
+            return False
+
+        self._samples.append(frame_ms)
+        self._since_eval += 1
+        self._since_downgrade += 1
+        if len(self._samples) < self._samples.maxlen or self._since_eval < self.EVAL_INTERVAL:
+            return False
+        self._since_eval = 0
+
+        value = float(np.percentile(self._samples, self.percentile))
+        self.last_percentile_ms = value
+
+        if value > self.budget_ms * self.downgrade_ratio and self.index < len(self.tiers) - 1:
+            self._since_downgrade = 0
+            return self._set_index(self.index + 1)
+        if (value < self.budget_ms * self.upgrade_ratio and self.index > 0
+                and self._since_downgrade >= self.upgrade_hold):
+            return self._set_index(self.index - 1)
+        return False
+
+    def _set_index(self, index: int) -> bool:
+        """Cambia de nivel y reinicia la ventana (el efecto tarda en medirse)"""
+        self.index = index
+        self._samples.clear()
+        self.changes += 1
+        print(f"⚙️ Calidad: {self.tier.nombre} "
+              f"(p{self.percentile:g} {self.last_percentile_ms:.1f} ms / {self.budget_ms:.1f} ms)")
+        return True
+
+    def reset(self):
+        """Vuelve al nivel más alto y descarta las mediciones"""
+        self.index = 0
+        self._samples.clear()
+        self._since_eval = 0
+        self._since_downgrade = self.upgrade_hold
+        self.last_percentile_ms = None
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas del gobernador (para debug)"""
+        return {
+            "tier": self.tier.nombre,
+            "index": self.index,
+            "enabled": self.enabled,
+            "percentile_ms": self.last_percentile_ms,
+            "budget_ms": self.budget_ms,
+            "changes": self.changes
+        }
+
+
+# Instancia compartida por el juego y los sistemas de render
+quality_governor = QualityGovernor()
@@ -0,0 +1,282 @@
+"""
+Backends de presentación
+Separa cómo llega cada frame a la ventana:
+
+    SoftwareBackend  pygame.display.set_mode + Surface.blits() (siempre disponible)
+    SDL2Backend      pygame._sdl2.video Renderer/Texture: los sprites se suben
+                     una vez como texturas y la composición con alpha y el
+                     escalado los hace el renderer de SDL (GPU si hay driver)
+
+Los estados de menú siguen dibujando sobre una Surface de software
+(Game.pantalla); con SDL2 de esa superficie se suben solo los rects que
+cambiaron. La partida entrega su RenderQueue con draw_world(); su UI se
+dibuja sobre un overlay que se conserva entre frames y del que también se
+suben solo las zonas que cambiaron.
+"""
+import weakref
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+from config.screen import LOGICAL_SIZE
+
+try:
+    from pygame._sdl2 import video as sdl2_video
+    from pygame._sdl2.sdl2 import error as SDL2Error
+except ImportError:  # pygame compilado sin _sdl2
+    sdl2_video = None
+    SDL2Error = pygame.error
+
+
+class SoftwareBackend:
+    """Todo con Surface.blit sobre la superficie de la ventana"""
+
+    name = "software"
+
+    def __init__(self, caption: str):
+        self.caption = caption
+        self.screen: Optional[pygame.Surface] = None
+
+    def open(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Crea (o redimensiona) la ventana y retorna la superficie donde dibujar"""
+        self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(self.caption)
+        return self.screen
+
+    def draw_world(self, screen: pygame.Surface, queue, canvas,
+                   overlay: Optional[Callable[[pygame.Surface], None]] = None):
+        """Vuelca la cola sobre el lienzo del mundo y lo presenta en screen"""
+        queue.flush(canvas.surface, canvas.render_scale)
+        canvas.present(screen, overlay)
+
+    def present(self, screen: pygame.Surface, rects: Optional[List[pygame.Rect]]):
+        """Muestra el frame (None = pantalla completa, lista = solo esas áreas)"""
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def capture(self, screen: pygame.Surface, canvas):
+        """Deja el último frame en screen (aquí siempre lo está)"""
+        pass
+
+    def get_stats(self) -> dict:
+        return {"backend": self.name, "driver": pygame.display.get_driver(), "textures": 0}
+
+
+class SDL2Backend:
+    """
+    Presentación con pygame._sdl2.video.
+
+    Las texturas se crean la primera vez que se dibuja cada superficie y se
+    descartan junto con ella (WeakKeyDictionary). Las superficies que se
+    envían a la cola deben tratarse como inmutables: si se modifican en el
+    lugar, la textura no se vuelve a subir.
+    """
+
+    name = "sdl2"
+
+    # special_flags de pygame -> modo de mezcla de SDL (1 = BLEND por defecto)
+    BLEND_MODES = {
+        0: 1,
+        pygame.BLEND_ADD: 2,
+        pygame.BLEND_RGB_ADD: 2,
+        pygame.BLEND_MULT: 4,
+        pygame.BLEND_RGB_MULT: 4,
+    }
+
+    def __init__(self, caption: str, accelerated: bool = True):
+        """
+        Args:
+            caption: Título de la ventana
+            accelerated: Exigir un renderer acelerado (falla si no hay)
+        """
+        if sdl2_video is None:
+            raise pygame.error("pygame sin soporte _sdl2")
+
+        # convert()/convert_alpha() necesitan un modo de video: ventana oculta de 1x1
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        self.caption = caption
+        self.window = sdl2_video.Window(caption, size=LOGICAL_SIZE)
+        try:
+            self.renderer = sdl2_video.Renderer(self.window, accelerated=1 if accelerated else -1)
+        except SDL2Error:
+            self.window.destroy()
+            raise
+        self.accelerated = accelerated
+
+        self.screen: Optional[pygame.Surface] = None
+        self._screen_texture = None
+        self._screen_synced = False    # La textura de los menús refleja a screen
+
+        # Mundo: textura destino a la escala de render + UI encima
+        self._world = None
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_texture = None
+        self._last_was_world = False   # Hay un frame del mundo sin presentar
+        self._showing_world = False    # Lo último presentado fue el mundo
+
+        self._textures: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self.uploads = 0
+
+    # ======================
+    # VENTANA
+    # ======================
+
+    def open(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Redimensiona la ventana y retorna la superficie de software de los menús"""
+        self.window.size = size
+        self.screen = pygame.Surface(size).convert()
+        self._screen_texture = sdl2_video.Texture(self.renderer, size, streaming=True)
+        self._screen_synced = False
+        return self.screen
+
+    # ======================
+    # MUNDO
+    # ======================
+
+    def draw_world(self, screen: pygame.Surface, queue, canvas,
+                   overlay: Optional[Callable[..., Optional[List[pygame.Rect]]]] = None):
+        """
+        Dibuja la cola con texturas y la UI encima (se presenta en present()).
+
+        overlay se llama como overlay(superficie, True): la superficie
+        conserva lo dibujado en el frame anterior y la función retorna los
+        rects que cambió (None = toda la superficie), que son lo único que
+        se sube a la textura.
+        """
+        renderer = self.renderer
+        scale = canvas.render_scale
+        render_size = canvas.render_size
+
+        if self._world is None or self._world.get_rect().size != render_size:
+            self._world = sdl2_video.Texture(self.renderer, render_size, target=True)
+
+        renderer.target = self._world
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+
+        for surface, pos, area, flags, alpha in queue.drain():
+            texture = self._texture(surface)
+            texture.blend_mode = self.BLEND_MODES.get(flags, 1)
+            texture.alpha = 255 if alpha is None else alpha
+
+            w, h = area.size if area is not None else surface.get_size()
+            texture.draw(srcrect=area,
+                         dstrect=(pos[0] * scale, pos[1] * scale, w * scale, h * scale))
+
+        renderer.target = None
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+
+        dest = canvas.viewport(self.window.size)
+        self._world.draw(dstrect=dest)
+
+        if overlay is not None:
+            if self._overlay is None:
+                self._overlay = pygame.Surface(LOGICAL_SIZE, pygame.SRCALPHA)
+                self._overlay.fill((0, 0, 0, 0))
+                self._overlay_texture = sdl2_video.Texture(self.renderer, LOGICAL_SIZE,
+                                                           streaming=True)
+                self._overlay_texture.blend_mode = 1
+            self._upload(self._overlay_texture, self._overlay, overlay(self._overlay, True))
+            self._overlay_texture.draw(dstrect=dest)
+
+        self._last_was_world = True
+
+    @staticmethod
+    def _upload(texture, surface: pygame.Surface, rects: Optional[List[pygame.Rect]]):
+        """Sube a una textura de streaming los rects de surface (None = toda)"""
+        if rects is None:
+            texture.update(surface)
+            return
+        bounds = surface.get_rect()
+        for rect in rects:
+            rect = bounds.clip(rect)
+            if rect.width and rect.height:
+                texture.update(surface.subsurface(rect), rect)
+
+    def _texture(self, surface: pygame.Surface):
+        """Textura de una superficie (se sube una sola vez)"""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = sdl2_video.Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+            self.uploads += 1
+        return texture
+
+    # ======================
+    # PRESENTACIÓN
+    # ======================
+
+    def present(self, screen: pygame.Surface, rects: Optional[List[pygame.Rect]]):
+        """Muestra el frame del mundo, o la superficie de los menús si cambió"""
+        if self._last_was_world:
+            self.renderer.present()
+            self._last_was_world = False
+            self._showing_world = True
+            self._screen_synced = False
+            return
+
+        # Menús: nada cambió -> no hay nada que subir ni presentar
+        if rects is not None and not rects:
+            return
+
+        # Tras un frame del mundo o una textura nueva se sube la pantalla completa
+        self._upload(self._screen_texture, screen, rects if self._screen_synced else None)
+        self._screen_synced = True
+        self._showing_world = False
+
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self._screen_texture.draw()
+        self.renderer.present()
+
+    def capture(self, screen: pygame.Surface, canvas):
+        """
+        Copia el último frame del mundo a screen, para los estados que
+        dibujan encima (pausa). Si lo último presentado fue un menú, screen
+        ya tiene lo que se ve y no hay nada que copiar.
+        """
+        if self._world is None or not self._showing_world:
+            return
+
+        self.renderer.target = self._world
+        world_size = self._world.get_rect().size
+        if world_size == canvas.render_size:
+            self.renderer.to_surface(canvas.surface)
+        else:
+            # La escala cambió después del último frame del mundo: se lee a
+            # su tamaño y se lleva al del lienzo
+            frame = self.renderer.to_surface(pygame.Surface(world_size).convert())
+            pygame.transform.scale(frame, canvas.render_size, canvas.surface)
+        self.renderer.target = None
+
+        overlay = self._overlay
+        canvas.present(screen, None if overlay is None
+                       else lambda target: target.blit(overlay, (0, 0)))
+
+    def get_stats(self) -> dict:
+        return {
+            "backend": self.name,
+            "driver": "acelerado" if self.accelerated else "software",
+            "textures": len(self._textures),
+        }
+
+
+def create_backend(preference: str, caption: str):
+    """
+    Elige el backend al iniciar.
+
+    Args:
+        preference: "auto" (SDL2 acelerado si hay driver, si no software),
+                    "sdl2" (SDL2 aunque el renderer sea por software) o "software"
+        caption: Título de la ventana
+    """
+    if preference in ("auto", "sdl2"):
+        try:
+            return SDL2Backend(caption, accelerated=(preference == "auto"))
+        except (pygame.error, SDL2Error) as e:
+            print(f"⚠️ Renderer SDL2 no disponible ({e}), usando software")
+    return SoftwareBackend(caption)
@@ -0,0 +1,207 @@
+"""
+Cola de renderizado por capas
+Los sistemas envían (superficie, posición, capa) durante el frame; al final
+se descartan los elementos fuera de pantalla y cada capa se vuelca con una
+sola llamada a Surface.blits(), en orden de capa.
+
+Las posiciones están en coordenadas lógicas (config/screen.py). Con una
+escala de render menor a 1 las superficies se reducen una sola vez y se
+reutilizan mientras sigan vivas.
+"""
+import weakref
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pygame
+
+from config.screen import LOGICAL_SIZE
+
+
+class RenderLayer(IntEnum):
+    """Orden de dibujo (de atrás hacia adelante)"""
+    BACKGROUND = 0
+    SCREEN_FX = 10       # Flash de daño y tintes de pantalla
+    AREA_EFFECTS = 20
+    PROJECTILES = 30
+    CIRCLES = 40
+    CHARACTERS = 50      # Princesa y jugador
+    ENEMIES = 60
+    PARTICLES = 65       # Chispas e impactos
+    ENEMY_UI = 70        # Barras de HP e iconos de estado
+
+
+class RenderQueue:
+    """
+    Acumula los blits de un frame y los ejecuta agrupados por capa.
+
+    Dentro de una capa se respeta el orden de envío. Los elementos con alpha
+    propio (superficies compartidas que se desvanecen) cortan el lote; el
+    alpha se aplica solo para ese blit y la superficie queda como estaba.
+    El HUD no pasa por la cola: se dibuja encima, a la resolución de la
+    ventana (ver WorldCanvas.present).
+    """
+
+    def __init__(self):
+        self._layers: Dict[int, list] = {}
+        
+        # Versiones reducidas: superficie original -> (escala, superficie)
+        self._scaled: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+        # Contadores del último flush
+        self.submitted = 0
+        self.culled = 0
+        self.batches = 0
+        self._batches = 0
+
+    # ======================
+    # ENVÍO
+    # ======================
+
+    def submit(self, surface: pygame.Surface, pos: Tuple[int, int], layer: int,
+               area: Optional[pygame.Rect] = None, alpha: Optional[int] = None,
+               special_flags: int = 0):
+        """
+        Encola un blit.
+
+        Args:
+            surface: Superficie a dibujar
+            pos: Esquina superior izquierda en pantalla
+            layer: Capa (ver RenderLayer)
+            area: Porción de la superficie (como en Surface.blit)
+            alpha: Alpha de superficie a aplicar justo antes del blit
+            special_flags: Modo de mezcla (pygame.BLEND_*)
+        """
+        self._layers.setdefault(layer, []).append(
+            (surface, pos, area, special_flags, alpha)
+        )
+
+    def submit_batch(self, blits: List[tuple], layer: int):
+        """
+        Encola varios blits de una vez (partículas).
+
+        Args:
+            blits: Secuencia de (superficie, posición)
+            layer: Capa (ver RenderLayer)
+        """
+        self._layers.setdefault(layer, []).extend(
+            (surface, pos, None, 0, None) for surface, pos in blits
+        )
+
+    def submit_centered(self, surface: pygame.Surface, center: Tuple[float, float],
+                        layer: int, alpha: Optional[int] = None):
+        """Encola un blit centrado en un punto"""
+        w, h = surface.get_size()
+        self.submit(surface, (int(center[0]) - w // 2, int(center[1]) - h // 2),
+                    layer, alpha=alpha)
+
+    # ======================
+    # VOLCADO
+    # ======================
+
+    def drain(self) -> Iterator[tuple]:
+        """
+        Recorre lo encolado en orden de capa, ya sin lo que cae fuera de
+        pantalla, y vacía la cola. Para backends que no dibujan con
+        Surface.blits() (ver systems/render_backend.py).
+        
+        Yields:
+            (superficie, posición, área, special_flags, alpha) en coordenadas lógicas
+        """
+        for _, item in self._visible_items():
+            yield item
+
+    def flush(self, target: pygame.Surface, scale: float = 1.0):
+        """
+        Dibuja todo lo encolado sobre target y vacía la cola.
+        
+        Args:
+            target: Superficie destino (tamaño lógico * scale)
+            scale: Escala de render interno
+        """
+        self._batches = 0
+        batch: List[tuple] = []
+        current_layer = None
+
+        for layer, (surface, pos, area, flags, alpha) in self._visible_items():
+            # Un blits() por capa
+            if layer != current_layer:
+                self._blit_batch(target, batch)
+                current_layer = layer
+            
+            if scale != 1.0:
+                surface, pos, area = self._scale_item(surface, pos, area, scale)
+
+            if alpha is None:
+                batch.append((surface, pos, area, flags))
+            else:
+                # La superficie suele ser compartida (caché): se deja como estaba
+                self._blit_batch(target, batch)
+                previous = surface.get_alpha()
+                surface.set_alpha(alpha)
+                target.blit(surface, pos, area, flags)
+                surface.set_alpha(previous)
+
+        self._blit_batch(target, batch)
+        self.batches = self._batches
+
+    def _visible_items(self) -> Iterator[tuple]:
+        """Genera (capa, elemento) en orden, descartando lo que cae fuera de pantalla"""
+        viewport = pygame.Rect((0, 0), LOGICAL_SIZE)
+        submitted = 0
+        culled = 0
+        
+        for layer in sorted(self._layers):
+            for item in self._layers[layer]:
+                surface, pos, area = item[0], item[1], item[2]
+                submitted += 1
+                
+                size = area.size if area is not None else surface.get_size()
+                if not viewport.colliderect((pos, size)):
+                    culled += 1
+                    continue
+                yield layer, item
+        
+        self._layers.clear()
+        self.submitted = submitted
+        self.culled = culled
+
+    def _blit_batch(self, target: pygame.Surface, batch: List[tuple]):
+        """Vuelca un lote pendiente con un solo blits()"""
+        if batch:
+            target.blits(batch, doreturn=0)
+            self._batches += 1
+            batch.clear()
+
+    def _scale_item(self, surface: pygame.Surface, pos: Tuple[int, int],
+                    area: Optional[pygame.Rect], scale: float) -> tuple:
+        """Lleva un elemento de coordenadas lógicas a la escala de render"""
+        cached = self._scaled.get(surface)
+        if cached is None or cached[0] != scale:
+            w, h = surface.get_size()
+            size = (max(1, round(w * scale)), max(1, round(h * scale)))
+            if surface.get_bitsize() in (24, 32):
+                scaled = pygame.transform.smoothscale(surface, size)
+            else:
+                scaled = pygame.transform.scale(surface, size)
+            cached = (scale, scaled)
+            self._scaled[surface] = cached
+        
+        if area is not None:
+            # Se escalan los bordes para que las rebanadas contiguas no dejen huecos
+            x0, y0 = int(area.x * scale), int(area.y * scale)
+            x1, y1 = int(area.right * scale), int(area.bottom * scale)
+            area = pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+        
+        return cached[1], (int(pos[0] * scale), int(pos[1] * scale)), area
+    
+    def clear(self):
+        """Descarta lo encolado sin dibujar"""
+        self._layers.clear()
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas del último frame (para debug)"""
+        return {
+            "submitted": self.submitted,
+            "culled": self.culled,
+            "batches": self.batches
+        }
@@ -0,0 +1,174 @@
+"""
+Efectos de pantalla completa
+Flash, oscurecido, fundido y vignette sin crear superficies por frame: los
+buffers del tamaño de la pantalla se crean una vez (por tamaño y color) y
+se dibujan con alpha de superficie. La máscara de la vignette se calcula
+una sola vez con NumPy.
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pygame
+
+
+class ScreenEffects:
+    """Buffers reutilizables para los efectos que cubren toda la pantalla"""
+
+    def __init__(self):
+        # (tamaño, color) -> superficie opaca de un solo color
+        self._solids: Dict[tuple, pygame.Surface] = {}
+
+        # tamaño -> máscara de vignette (alpha por píxel, 255 en las esquinas)
+        self._vignettes: Dict[Tuple[int, int], pygame.Surface] = {}
+
+        # Copia congelada de la pantalla (pausa)
+        self._snapshot: Optional[pygame.Surface] = None
+
+        # Estadísticas
+        self.buffers_created = 0
+
+    # ======================
+    # COLOR PLANO
+    # ======================
+
+    def solid(self, size: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Superficie de un color del tamaño pedido (compartida, no modificar).
+        Se dibuja con set_alpha() o con el alpha de RenderQueue.submit().
+
+        Args:
+            size: Tamaño de la superficie
+            color: Color RGB
+
+        Returns:
+            Superficie opaca reutilizable
+        """
+        key = (tuple(size), tuple(color))
+        surface = self._solids.get(key)
+        if surface is None:
+            surface = pygame.Surface(size).convert()
+            surface.fill(color)
+            self._solids[key] = surface
+            self.buffers_created += 1
+        return surface
+
+    def tint(self, target: pygame.Surface, color: Tuple[int, int, int], alpha: int):
+        """
+        Cubre target con un color semitransparente.
+
+        Args:
+            target: Superficie destino
+            color: Color RGB
+            alpha: Opacidad (0-255)
+        """
+        if alpha <= 0:
+            return
+        if alpha >= 255:
+            target.fill(color)
+            return
+        surface = self.solid(target.get_size(), color)
+        surface.set_alpha(int(alpha))
+        target.blit(surface, (0, 0))
+
+    def flash(self, target: pygame.Surface, color: Tuple[int, int, int], alpha: int):
+        """Destello de un color (daño, impacto)"""
+        self.tint(target, color, alpha)
+
+    def dim(self, target: pygame.Surface, alpha: int):
+        """Oscurece target (fondo de menús superpuestos)"""
+        self.tint(target, (0, 0, 0), alpha)
+
+    def fade(self, target: pygame.Surface, progress: float,
+             color: Tuple[int, int, int] = (0, 0, 0)):
+        """
+        Fundido hacia un color.
+
+        Args:
+            target: Superficie destino
+            progress: 0.0 (sin cambio) a 1.0 (color pleno)
+            color: Color final
+        """
+        self.tint(target, color, int(255 * max(0.0, min(1.0, progress))))
+
+    # ======================
+    # VIGNETTE
+    # ======================
+
+    def vignette(self, target: pygame.Surface, strength: int):
+        """
+        Oscurece los bordes de target según la distancia al centro.
+
+        Args:
+            target: Superficie destino
+            strength: Alpha en las esquinas (0-255)
+        """
+        if strength <= 0:
+            return
+        mask = self._vignette_mask(target.get_size())
+        mask.set_alpha(int(strength))
+        target.blit(mask, (0, 0))
+
+    def _vignette_mask(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Máscara negra con alpha proporcional a la distancia al centro"""
+        size = tuple(size)
+        mask = self._vignettes.get(size)
+        if mask is not None:
+            return mask
+
+        w, h = size
+        cx, cy = w // 2, h // 2
+        x = np.arange(w, dtype=np.float32) - cx
+        y = np.arange(h, dtype=np.float32) - cy
+        distance = np.sqrt(x[:, None] ** 2 + y[None, :] ** 2)
+        factor = np.clip(distance / np.hypot(cx, cy), 0.0, 1.0)
+
+        mask = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        mask.fill((0, 0, 0, 0))
+        alpha = pygame.surfarray.pixels_alpha(mask)
+        alpha[:] = (factor * 255).astype(np.uint8)
+        del alpha  # libera el lock de la superficie
+
+        self._vignettes[size] = mask
+        self.buffers_created += 1
+        return mask
+
+    # ======================
+    # INSTANTÁNEA
+    # ======================
+
+    def snapshot(self, source: pygame.Surface, dim_alpha: int = 0) -> pygame.Surface:
+        """
+        Congela una copia (oscurecida) de source en un buffer reutilizable.
+        La copia es válida hasta la próxima llamada.
+
+        Args:
+            source: Superficie a copiar (normalmente el último frame)
+            dim_alpha: Oscurecido a aplicar una sola vez sobre la copia
+
+        Returns:
+            Superficie con la instantánea
+        """
+        if self._snapshot is None or self._snapshot.get_size() != source.get_size():
+            self._snapshot = pygame.Surface(source.get_size()).convert()
+            self.buffers_created += 1
+        self._snapshot.blit(source, (0, 0))
+        self.dim(self._snapshot, dim_alpha)
+        return self._snapshot
+
+    def clear(self):
+        """Libera los buffers (p. ej. tras un cambio de resolución)"""
+        self._solids.clear()
+        self._vignettes.clear()
+        self._snapshot = None
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas de los buffers (para debug)"""
+        return {
+            "solids": len(self._solids),
+            "vignettes": len(self._vignettes),
+            "buffers_created": self.buffers_created
+        }
+
+
+# Instancia compartida por todos los estados
+screen_effects = ScreenEffects()
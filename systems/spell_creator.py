@@ -174,9 +174,9 @@ class SpellCastingSystem:
         """Actualiza círculos (el cooldown se maneja automáticamente con time.time())"""
         self.circle_manager.update(dt)
     
-    def draw(self, screen):
-        """Dibuja los círculos"""
-        self.circle_manager.draw(screen)
+    def submit(self, queue):
+        """Encola los círculos"""
+        self.circle_manager.submit(queue)
     
     def can_cast(self) -> bool:
         """Verifica si se puede lanzar un hechizo"""
@@ -296,11 +296,10 @@ class PlayingState:
                             projectile.deactivate()
     
     def draw(self, screen):
-        # Dibujar círculos
-        self.spell_casting.draw(screen)
-        
-        # Dibujar hechizos
-        self.spell_system.draw(screen)
+        # Encolar círculos y hechizos
+        self.spell_casting.submit(self.render_queue)
+        self.spell_system.submit(self.render_queue)
+        self.render_queue.flush(screen)
         
         # Dibujar UI de cooldown
         cooldown_info = self.spell_casting.get_cooldown_info()
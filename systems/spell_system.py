@@ -6,6 +6,7 @@ from config.enums import SpellType, BehaviorType, TrajectoryType
 from config.spell_data import get_spell_data
 from systems.projectile import ProjectilePool, Projectile
 from systems.area_effect import AreaEffectPool, AreaEffect
+from systems.render_queue import RenderQueue
 
 
 class SpellSystem:
@@ -160,11 +161,10 @@ class SpellSystem:
         self.projectile_pool.update(dt)
         self.area_pool.update(dt)
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja todos los proyectiles y efectos de área"""
-        # Dibujar efectos de área primero (debajo de los proyectiles)
-        self.area_pool.draw(screen)
-        self.projectile_pool.draw(screen)
+    def submit(self, queue: RenderQueue):
+        """Encola todos los proyectiles y efectos de área (cada uno en su capa)"""
+        self.area_pool.submit(queue)
+        self.projectile_pool.submit(queue)
     
     def get_active_projectiles(self):
         """Retorna proyectiles activos para sistema de colisiones"""
@@ -217,5 +217,6 @@ def update(self, dt):
                 ...
 
 def draw(self, screen):
-    self.spell_system.draw(screen)
+    self.spell_system.submit(self.render_queue)
+    self.render_queue.flush(screen)
 """
\ No newline at end of file
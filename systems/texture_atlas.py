@@ -0,0 +1,146 @@
+"""
+Atlas de texturas en tiempo de ejecución
+Empaqueta los frames pequeños de sprites en unas pocas superficies grandes.
+Cada frame queda como subsuperficie de una página del atlas.
+
+Las regiones no se liberan: las páginas quedan residentes hasta clear().
+Por eso no cuentan en el presupuesto de bytes de AssetCache (desalojar una
+región de la caché no libera sus píxeles) y su memoria se informa aparte,
+en get_stats()["bytes"].
+"""
+from typing import Dict, List, Optional
+
+import pygame
+
+
+class _Shelf:
+    """Fila horizontal dentro de una página del atlas"""
+
+    def __init__(self, y: int, height: int):
+        self.y = y
+        self.height = height
+        self.x = 0
+
+
+class _AtlasPage:
+    """Página del atlas: una superficie grande con sus filas ocupadas"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.surface = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.shelves: List[_Shelf] = []
+        self.next_y = 0
+        self.used_pixels = 0
+
+    def allocate(self, width: int, height: int) -> Optional[pygame.Rect]:
+        """Busca hueco para un rectángulo (shelf packing). None si no cabe."""
+        # Reutilizar una fila existente lo bastante alta
+        for shelf in self.shelves:
+            if height <= shelf.height and shelf.x + width <= self.size:
+                rect = pygame.Rect(shelf.x, shelf.y, width, height)
+                shelf.x += width
+                return rect
+
+        # Abrir una fila nueva
+        if self.next_y + height > self.size or width > self.size:
+            return None
+
+        shelf = _Shelf(self.next_y, height)
+        self.shelves.append(shelf)
+        self.next_y += height
+        shelf.x = width
+        return pygame.Rect(0, shelf.y, width, height)
+
+
+class TextureAtlas:
+    """
+    Atlas dinámico de sprites.
+    Copia cada superficie en una página compartida y devuelve la
+    subsuperficie correspondiente. Las regiones se indexan por clave,
+    así volver a pedir el mismo sprite no duplica píxeles.
+    """
+
+    def __init__(self, page_size: int = 1024, padding: int = 1):
+        """
+        Args:
+            page_size: Lado (en píxeles) de cada página cuadrada
+            padding: Separación entre regiones para evitar sangrado
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: List[_AtlasPage] = []
+        self._regions: Dict[tuple, pygame.Surface] = {}
+
+    def get(self, key: tuple) -> Optional[pygame.Surface]:
+        """Retorna la región ya empaquetada para una clave, o None"""
+        return self._regions.get(key)
+
+    def owns(self, surface: pygame.Surface) -> bool:
+        """True si surface es una región de alguna página del atlas"""
+        parent = surface.get_parent()
+        return parent is not None and any(parent is page.surface for page in self.pages)
+
+    def pack(self, key: tuple, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Copia una superficie dentro del atlas.
+
+        Args:
+            key: Clave de la región (la misma de la caché de assets)
+            surface: Superficie con alpha por píxel a empaquetar
+
+        Returns:
+            Subsuperficie del atlas, o la superficie original si no cabe en una página
+        """
+        region = self._regions.get(key)
+        if region is not None:
+            return region
+
+        width, height = surface.get_size()
+        padded_w = width + self.padding
+        padded_h = height + self.padding
+
+        if padded_w > self.page_size or padded_h > self.page_size:
+            return surface
+
+        rect = None
+        for page in self.pages:
+            rect = page.allocate(padded_w, padded_h)
+            if rect is not None:
+                break
+        else:
+            page = _AtlasPage(self.page_size)
+            self.pages.append(page)
+            rect = page.allocate(padded_w, padded_h)
+
+        rect.size = (width, height)
+
+        # BLEND_RGBA_MAX sobre una zona vacía copia los píxeles tal cual
+        # (un blit normal premultiplicaría los bordes semitransparentes)
+        page.surface.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        page.used_pixels += width * height
+
+        region = page.surface.subsurface(rect)
+        self._regions[key] = region
+        return region
+
+    def clear(self):
+        """Descarta todas las páginas"""
+        self.pages.clear()
+        self._regions.clear()
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas del atlas (para debug)"""
+        total = len(self.pages) * self.page_size * self.page_size
+        used = sum(page.used_pixels for page in self.pages)
+        return {
+            "pages": len(self.pages),
+            "regions": len(self._regions),
+            "fill": used / total if total else 0.0,
+            "bytes": sum(page.surface.get_bytesize() * page.size * page.size
+                         for page in self.pages)
+        }
+
+
+# Atlas compartido para todos los sprites de assets/sprites
+sprite_atlas = TextureAtlas()
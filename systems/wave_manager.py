@@ -352,6 +352,14 @@ class WaveManager:
             "transition_time": max(0, self.transition_timer)
         }
     
+    def get_progress_key(self) -> tuple:
+        """
+        Clave que cambia cuando cambia lo que muestra get_wave_progress(),
+        sin armar el diccionario (la UI la compara cada frame).
+        """
+        remaining = len(self.current_spawn_queue) + len(self.enemy_manager.get_active_enemies())
+        return (self.current_wave_index, self.wave_state, remaining)
+    
     def is_wave_active(self) -> bool:
         """Verifica si hay una oleada activa"""
         return self.wave_state in (WaveState.SPAWNING, WaveState.FIGHTING)
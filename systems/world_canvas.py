@@ -0,0 +1,110 @@
+"""
+Lienzo del mundo
+La partida se dibuja en una superficie fuera de pantalla con el tamaño
+lógico multiplicado por la escala de render; al final del frame se escala
+una sola vez a la ventana, con bandas negras si la proporción no coincide.
+"""
+from typing import Callable, Optional, Tuple
+
+import pygame
+
+from config.screen import LOGICAL_SIZE, DEFAULT_RENDER_SCALE
+
+
+class WorldCanvas:
+    """Superficie de render interno y su presentación en la ventana"""
+
+    def __init__(self, render_scale: float = DEFAULT_RENDER_SCALE):
+        """
+        Args:
+            render_scale: Fracción del tamaño lógico a la que se dibuja
+        """
+        self.render_scale = render_scale
+        self.surface = pygame.Surface(self.render_size).convert()
+
+        # Destino del escalado (se reutiliza mientras no cambie el tamaño)
+        self._scaled: Optional[pygame.Surface] = None
+        
+        # Superficie lógica para la UI cuando la ventana no mide lo mismo
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_scaled: Optional[pygame.Surface] = None
+
+    @property
+    def render_size(self) -> Tuple[int, int]:
+        """Tamaño real de la superficie de render"""
+        return (round(LOGICAL_SIZE[0] * self.render_scale),
+                round(LOGICAL_SIZE[1] * self.render_scale))
+
+    def set_render_scale(self, render_scale: float):
+        """Cambia la escala de render interno (recrea la superficie)"""
+        if render_scale == self.render_scale:
+            return
+        self.render_scale = render_scale
+        self.surface = pygame.Surface(self.render_size).convert()
+        self._scaled = None
+
+    def viewport(self, window_size: Tuple[int, int]) -> pygame.Rect:
+        """Rectángulo de la ventana que ocupa el mundo (conserva la proporción)"""
+        win_w, win_h = window_size
+        factor = min(win_w / LOGICAL_SIZE[0], win_h / LOGICAL_SIZE[1])
+        w = round(LOGICAL_SIZE[0] * factor)
+        h = round(LOGICAL_SIZE[1] * factor)
+        return pygame.Rect((win_w - w) // 2, (win_h - h) // 2, w, h)
+
+    def present(self, window: pygame.Surface,
+                overlay: Optional[Callable[[pygame.Surface], None]] = None):
+        """
+        Copia el lienzo a la ventana en una sola pasada de escalado.
+
+        Args:
+            window: Superficie de la ventana
+            overlay: Función que dibuja la UI sobre una superficie de tamaño
+                     lógico. No pasa por la escala de render: si la ventana
+                     mide lo mismo que el espacio lógico se dibuja directo
+                     sobre ella, nítida.
+        """
+        dest = self.viewport(window.get_size())
+
+        # Lienzo a tamaño lógico y ventana distinta: la UI viaja con el mundo
+        if overlay is not None and dest.size != LOGICAL_SIZE \
+                and self.surface.get_size() == LOGICAL_SIZE:
+            overlay(self.surface)
+            overlay = None
+
+        if dest.size == self.surface.get_size():
+            window.blit(self.surface, dest)
+        else:
+            if self._scaled is None or self._scaled.get_size() != dest.size:
+                self._scaled = pygame.Surface(dest.size).convert()
+            pygame.transform.scale(self.surface, dest.size, self._scaled)
+            window.blit(self._scaled, dest)
+
+        # Bandas negras (letterbox)
+        if dest.size != window.get_size():
+            win = window.get_rect()
+            for band in (pygame.Rect(0, 0, win.width, dest.top),
+                         pygame.Rect(0, dest.bottom, win.width, win.height - dest.bottom),
+                         pygame.Rect(0, dest.top, dest.left, dest.height),
+                         pygame.Rect(dest.right, dest.top, win.width - dest.right, dest.height)):
+                if band.width > 0 and band.height > 0:
+                    window.fill((0, 0, 0), band)
+
+        if overlay is not None:
+            self._draw_overlay(window, dest, overlay)
+
+    def _draw_overlay(self, window: pygame.Surface, dest: pygame.Rect,
+                      overlay: Callable[[pygame.Surface], None]):
+        """Dibuja la UI sobre el mundo ya presentado"""
+        if dest.size == LOGICAL_SIZE:
+            overlay(window.subsurface(dest))
+            return
+
+        # Ventana y lienzo de otro tamaño: UI a tamaño lógico y luego escalada
+        if self._overlay is None:
+            self._overlay = pygame.Surface(LOGICAL_SIZE, pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 0))
+        overlay(self._overlay)
+        if self._overlay_scaled is None or self._overlay_scaled.get_size() != dest.size:
+            self._overlay_scaled = pygame.Surface(dest.size, pygame.SRCALPHA)
+        pygame.transform.smoothscale(self._overlay, dest.size, self._overlay_scaled)
+        window.blit(self._overlay_scaled, dest)
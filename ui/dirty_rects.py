@@ -0,0 +1,71 @@
+"""
+Dibujo por rectángulos sucios
+Las pantallas de menú pasan la mayor parte del tiempo quietas: solo cambia
+un botón bajo el mouse o un slider. En lugar de redibujar y hacer flip de
+toda la pantalla, se guarda una copia del fondo ya compuesto y en cada frame
+se repintan únicamente los widgets que cambiaron.
+"""
+from typing import List, Optional
+
+import pygame
+
+
+class DirtyRegionTracker:
+    """
+    Lleva el fondo compuesto de una pantalla y los rectángulos a actualizar.
+
+    Uso típico en el draw() de un estado:
+        if tracker.needs_full_redraw(pantalla):
+            ...dibujar fondo y textos fijos...
+            tracker.save_backdrop(pantalla)
+            ...dibujar widgets...
+            return None                      # flip completo
+        return tracker.redraw_widgets(pantalla, widgets)
+
+    Los widgets deben exponer `dirty`, `dirty_rect` y `draw(pantalla)`
+    (ver ui/menu_classes.py).
+    """
+
+    def __init__(self):
+        self.backdrop: Optional[pygame.Surface] = None
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Fuerza un redibujado completo en el próximo frame"""
+        self.full_redraw = True
+
+    def has_backdrop(self, pantalla: pygame.Surface) -> bool:
+        """Verifica si hay un fondo guardado del tamaño de la pantalla actual"""
+        return self.backdrop is not None and self.backdrop.get_size() == pantalla.get_size()
+
+    def needs_full_redraw(self, pantalla: pygame.Surface) -> bool:
+        """True si hay que componer la pantalla entera (y hacer flip)"""
+        return self.full_redraw or not self.has_backdrop(pantalla)
+
+    def save_backdrop(self, pantalla: pygame.Surface):
+        """Guarda el fondo ya compuesto (sin los widgets que cambian)"""
+        if self.has_backdrop(pantalla):
+            self.backdrop.blit(pantalla, (0, 0))
+        else:
+            self.backdrop = pantalla.copy()
+        self.full_redraw = False
+
+    def restore(self, pantalla: pygame.Surface, rect: pygame.Rect) -> pygame.Rect:
+        """Repone el fondo bajo un rectángulo y lo retorna recortado a la pantalla"""
+        rect = rect.clip(pantalla.get_rect())
+        pantalla.blit(self.backdrop, rect, rect)
+        return rect
+
+    def redraw_widgets(self, pantalla: pygame.Surface, widgets) -> List[pygame.Rect]:
+        """
+        Repinta los widgets marcados como sucios.
+
+        Returns:
+            Rectángulos a pasar a pygame.display.update()
+        """
+        rects = []
+        for widget in widgets:
+            if widget.dirty:
+                rects.append(self.restore(pantalla, widget.dirty_rect))
+                widget.draw(pantalla)
+        return rects
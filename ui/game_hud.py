@@ -1,13 +1,50 @@
 """
 Sistema de UI para el estado de juego
 Maneja todo el rendering de la interfaz de usuario
+
+El HUD vive en una superficie persistente dividida en regiones. Cada región
+tiene una clave (puntos, vidas, estado de la oleada, círculos, tramo del
+cooldown...) y solo se vuelve a dibujar cuando su clave cambia; en el caso
+común el HUD cuesta un único blits() del overlay. Sobre un destino que se
+conserva entre frames (overlay del backend SDL2) solo se copian las
+regiones que cambiaron.
 """
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
 import pygame
 
+from systems.asset_cache import asset_cache
+from systems.texture_atlas import sprite_atlas
+from ui.text_cache import text_cache
+from systems.quality_governor import quality_governor
+
+
+# Clave que nunca coincide: fuerza a redibujar la región
+_STALE = object()
+
+
+@dataclass
+class HudRegion:
+    """Zona del overlay que se redibuja por separado"""
+    name: str
+    rect: pygame.Rect
+    key: Callable[[Any], Any]              # game_state -> valor comparable
+    draw: Callable[[pygame.Surface, Any], None]
+    last_key: Any = _STALE
+    bounds: Optional[pygame.Rect] = None   # Parte realmente dibujada (None = vacía)
+
 
 class GameHUD:
     """Maneja toda la interfaz de usuario durante el juego"""
     
+    # Ancho de la barra de cooldown y tramo (en píxeles) que dispara un redibujado
+    COOLDOWN_BAR_WIDTH = 200
+    COOLDOWN_BUCKET = 4
+    
+    # Altura donde empieza el debug (F3)
+    DEBUG_TOP = 400
+    
     def __init__(self, fonts):
         """
         Args:
@@ -32,24 +69,180 @@ class GameHUD:
         self.COLOR_LIGHT_GREEN = (100, 200, 100)
         self.COLOR_LIGHT_YELLOW = (200, 200, 100)
         
-    def draw(self, screen, game_state):
+        # Overlay persistente y sus regiones (se crean con el primer draw)
+        self._overlay: Optional[pygame.Surface] = None
+        self._regions: List[HudRegion] = []
+        self._blits: List[tuple] = []  # Secuencia para blits() (se arma al redibujar)
+        
+        # Modo retenido: destino que ya tiene el HUD y si tiene el debug (F3)
+        self._retained_target: Optional[pygame.Surface] = None
+        self._debug_shown = False
+        
+        # Estadísticas
+        self.region_redraws = 0
+        
+    def draw(self, screen, game_state, retained=False):
         """
         Dibuja toda la UI del juego
         
         Args:
             screen: Surface de pygame donde dibujar
             game_state: Referencia al PlayingState con toda la info necesaria
+            retained: True si screen conserva lo que se le dibujó el frame
+                      anterior (transparente, solo UI): se actualiza solo lo
+                      que cambió
+            
+        Returns:
+            Con retained, los rects de screen que cambiaron (None = todo);
+            sin retained, None
         """
-        self._draw_player_stats(screen, game_state)
-        self._draw_wave_info(screen, game_state)
-        self._draw_score(screen, game_state)
-        self._draw_cooldown_bar(screen, game_state)
-        self._draw_active_circles(screen, game_state)
-        self._draw_controls(screen, game_state)
-        
-        # Debug info (solo si se presiona F3)
-        if pygame.key.get_pressed()[pygame.K_F3]:
+        if self._overlay is None or self._overlay.get_size() != screen.get_size():
+            self._build_overlay(screen.get_size())
+        
+        # Redibujar solo las regiones cuya clave cambió
+        dirty = []
+        for region in self._regions:
+            key = region.key(game_state)
+            if key != region.last_key:
+                region.last_key = key
+                dirty.append(region)
+        if dirty:
+            self._redraw_regions(dirty, game_state)
+        
+        # Debug info (solo si se presiona F3; cambia cada frame, va directo)
+        debug = pygame.key.get_pressed()[pygame.K_F3]
+        
+        if retained:
+            return self._update_retained(screen, dirty, debug, game_state)
+        
+        screen.blits(self._blits, doreturn=0)
+        if debug:
             self._draw_debug_info(screen, game_state)
+        return None
+    
+    def _update_retained(self, screen, dirty, debug, game_state):
+        """
+        Lleva a un destino retenido las regiones redibujadas y el debug.
+        
+        Returns:
+            Rects que cambiaron (None = todo el destino)
+        """
+        if screen is not self._retained_target:
+            # Destino nuevo: copia completa del overlay
+            self._retained_target = screen
+            screen.fill((0, 0, 0, 0))
+            screen.blit(self._overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            changed = None
+        else:
+            # BLEND_RGBA_MAX sobre una zona limpia copia los píxeles tal cual
+            changed = []
+            for region in dirty:
+                screen.fill((0, 0, 0, 0), region.rect)
+                screen.blit(self._overlay, region.rect, region.rect,
+                            special_flags=pygame.BLEND_RGBA_MAX)
+                changed.append(region.rect)
+        
+        if debug or self._debug_shown:
+            area = self._debug_area(screen)
+            screen.fill((0, 0, 0, 0), area)
+            if debug:
+                screen.set_clip(area)
+                self._draw_debug_info(screen, game_state)
+                screen.set_clip(None)
+            if changed is not None:
+                changed.append(area)
+        self._debug_shown = debug
+        
+        return changed
+    
+    def _debug_area(self, screen):
+        """Zona que ocupa el debug (F3): debajo del HUD y a la izquierda de los controles"""
+        width, height = screen.get_size()
+        return pygame.Rect(0, self.DEBUG_TOP, width - 250, height - self.DEBUG_TOP)
+    
+    def _redraw_regions(self, dirty, game_state):
+        """
+        Limpia y redibuja las regiones sucias. Las que se superponen con
+        una sucia se redibujan también (la limpieza borra su parte).
+        """
+        pending = list(dirty)
+        while pending:
+            region = pending.pop()
+            for other in self._regions:
+                if other not in dirty and other.rect.colliderect(region.rect):
+                    dirty.append(other)
+                    pending.append(other)
+        
+        overlay = self._overlay
+        for region in dirty:
+            overlay.fill((0, 0, 0, 0), region.rect)
+        for region in self._regions:
+            if region in dirty:
+                region.draw(overlay, game_state)
+                self.region_redraws += 1
+        
+        # Solo se copia a pantalla lo que tiene píxeles (menos área que el rect)
+        for region in dirty:
+            bounds = overlay.subsurface(region.rect).get_bounding_rect()
+            region.bounds = bounds.move(region.rect.topleft) if bounds.width else None
+        self._blits = [(overlay, region.bounds.topleft, region.bounds)
+                       for region in self._regions if region.bounds is not None]
+    
+    def invalidate(self):
+        """Fuerza a redibujar todas las regiones en el próximo frame"""
+        for region in self._regions:
+            region.last_key = _STALE
+    
+    def _build_overlay(self, size):
+        """Crea el overlay y define las regiones para el tamaño dado"""
+        width = size[0]
+        right = width - 250
+        self._overlay = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        self._retained_target = None
+        
+        # Los rects acotan lo que dibuja cada _draw_* (ver posiciones en cada uno)
+        self._regions = [
+            HudRegion("vidas", pygame.Rect(0, 0, 300, 40),
+                      self._player_stats_key, self._draw_player_stats),
+            HudRegion("oleada", pygame.Rect(0, 40, 300, 75),
+                      self._wave_info_key, self._draw_wave_info),
+            HudRegion("puntos", pygame.Rect(0, 115, 300, 25),
+                      self._score_key, self._draw_score),
+            HudRegion("cooldown", pygame.Rect(0, 140, 300, 45),
+                      self._cooldown_key, self._draw_cooldown_bar),
+            HudRegion("circulos", pygame.Rect(right, 0, 250, 180),
+                      self._active_circles_key, self._draw_active_circles),
+            HudRegion("controles", pygame.Rect(right, 180, 250, 260),
+                      self._controls_key, self._draw_controls),
+        ]
+    
+    # === CLAVES DE LAS REGIONES ===
+    
+    def _player_stats_key(self, game_state):
+        return game_state.player_hp
+    
+    def _wave_info_key(self, game_state):
+        return game_state.wave_manager.get_progress_key()
+    
+    def _score_key(self, game_state):
+        return game_state.puntos
+    
+    def _cooldown_key(self, game_state):
+        spell_casting = game_state.spell_casting
+        if spell_casting.can_cast():
+            return None
+        creator = spell_casting.spell_creator
+        fill = int(self.COOLDOWN_BAR_WIDTH * creator.get_cooldown_percent())
+        return (fill // self.COOLDOWN_BUCKET, f"{creator.get_cooldown_remaining():.1f}")
+    
+    def _active_circles_key(self, game_state):
+        return tuple(circle.state.elemento
+                     for circle in game_state.spell_casting.circle_manager.circles)
+    
+    def _controls_key(self, game_state):
+        return game_state.game.gestos_activos
+    
+    # === DIBUJO DE LAS REGIONES ===
     
     def _draw_player_stats(self, screen, game_state):
         """Dibuja las vidas del jugador"""
@@ -57,7 +250,8 @@ class GameHUD:
         y = self.padding
         
         # Corazones de vida
-        hp_text = self.font_small.render(
+        hp_text = text_cache.render(
+            self.font_small,
             f"❤️ x{game_state.player_hp}", 
             True, 
             self.COLOR_RED
@@ -73,7 +267,8 @@ class GameHUD:
         total_waves = game_state.wave_manager.get_total_waves()
         
         # Número de oleada
-        wave_text = self.font_small.render(
+        wave_text = text_cache.render(
+            self.font_small,
             f"Oleada: {progress['wave_number']}/{total_waves}",
             True,
             self.COLOR_WHITE
@@ -83,7 +278,8 @@ class GameHUD:
         # Enemigos restantes (solo durante combate)
         if progress["state"] in ("spawning", "fighting"):
             y += 30
-            enemies_text = self.font_mini.render(
+            enemies_text = text_cache.render(
+                self.font_mini,
                 f"Enemigos: {progress['enemies_remaining']}/{progress['enemies_total']}",
                 True,
                 self.COLOR_GRAY
@@ -95,7 +291,8 @@ class GameHUD:
         x = self.padding
         y = self.padding + 110
         
-        score_text = self.font_small.render(
+        score_text = text_cache.render(
+            self.font_small,
             f"Puntos: {game_state.puntos}",
             True,
             self.COLOR_WHITE
@@ -110,11 +307,11 @@ class GameHUD:
         cooldown_info = game_state.spell_casting.get_cooldown_info()
         
         # Label
-        label = self.font_mini.render("Cooldown:", True, self.COLOR_GRAY)
+        label = text_cache.render(self.font_mini, "Cooldown:", True, self.COLOR_GRAY)
         screen.blit(label, (x, y - 20))
         
         # Dimensiones de la barra
-        bar_width = 200
+        bar_width = self.COOLDOWN_BAR_WIDTH
         bar_height = 20
         
         # Fondo de la barra
@@ -141,7 +338,8 @@ class GameHUD:
             
             # Texto de tiempo restante
             remaining = cooldown_info["remaining"]
-            time_text = self.font_mini.render(
+            time_text = text_cache.render(
+                self.font_mini,
                 f"{remaining:.1f}s", 
                 True, 
                 self.COLOR_WHITE
@@ -155,7 +353,7 @@ class GameHUD:
                 self.COLOR_GREEN, 
                 (x, y, bar_width, bar_height)
             )
-            ready_text = self.font_mini.render("READY!", True, self.COLOR_BLACK)
+            ready_text = text_cache.render(self.font_mini, "READY!", True, self.COLOR_BLACK)
             text_x = x + bar_width // 2 - ready_text.get_width() // 2
             screen.blit(ready_text, (text_x, y + 2))
         
@@ -176,7 +374,8 @@ class GameHUD:
         circle_info = game_state.spell_casting.get_circle_info()
         
         # Título
-        title = self.font_small.render(
+        title = text_cache.render(
+            self.font_small,
             "Círculos Activos:", 
             True, 
             self.COLOR_WHITE
@@ -184,7 +383,8 @@ class GameHUD:
         screen.blit(title, (x, y))
         
         # Contador
-        counter_text = self.font_mini.render(
+        counter_text = text_cache.render(
+            self.font_mini,
             f"({circle_info['active_circles']}/{circle_info['max_circles']})",
             True,
             self.COLOR_DARK_GRAY
@@ -197,7 +397,8 @@ class GameHUD:
         
         if not elements:
             # Sin círculos activos
-            none_text = self.font_mini.render(
+            none_text = text_cache.render(
+                self.font_mini,
                 "(ninguno)", 
                 True, 
                 self.COLOR_DARK_GRAY
@@ -214,7 +415,8 @@ class GameHUD:
                 pygame.draw.circle(screen, color, (circle_x, circle_y), 8)
                 
                 # Nombre del elemento
-                elem_text = self.font_mini.render(
+                elem_text = text_cache.render(
+                    self.font_mini,
                     f"{i+1}. {elem_name}", 
                     True, 
                     self.COLOR_WHITE
@@ -230,7 +432,7 @@ class GameHUD:
         y = 180
         
         # Título
-        title = self.font_small.render("Controles:", True, self.COLOR_WHITE)
+        title = text_cache.render(self.font_small, "Controles:", True, self.COLOR_WHITE)
         screen.blit(title, (x, y))
         
         y_offset = y + 35
@@ -243,17 +445,18 @@ class GameHUD:
         
         # Dibujar cada línea
         for line in controls:
-            text = self.font_mini.render(line, True, self.COLOR_GRAY)
+            text = text_cache.render(self.font_mini, line, True, self.COLOR_GRAY)
             screen.blit(text, (x, y_offset))
             y_offset += 22
     
     def _draw_debug_info(self, screen, game_state):
         """Dibuja información de debug (F3)"""
         x = self.padding
-        y = 400
+        y = self.DEBUG_TOP
         
         # Título
-        title = self.font_small.render(
+        title = text_cache.render(
+            self.font_small,
             "DEBUG - Pool Stats:", 
             True, 
             self.COLOR_YELLOW
@@ -262,13 +465,17 @@ class GameHUD:
         
         y += 30
         
+        # Los contadores cambian cada frame: se renderizan sin text_cache para
+        # no desalojar los textos estables ni falsear su tasa de aciertos
+        
         # Stats de spell system
         stats = game_state.spell_system.get_stats()
         
         # Proyectiles
         proj = stats["projectiles"]
         proj_text = self.font_mini.render(
-            f"Proyectiles: {proj['active']}/{proj['total']}",
+            f"Proyectiles: {proj['active']}/{proj['total']} "
+            f"(LOD: {proj['imposters']} simples, {proj['merged']} fusionados)",
             True,
             self.COLOR_WHITE
         )
@@ -293,6 +500,81 @@ class GameHUD:
             self.COLOR_WHITE
         )
         screen.blit(enemy_text, (x, y))
+        
+        # Caché de sprites
+        y += 25
+        cache = asset_cache.get_stats()
+        cache_text = self.font_mini.render(
+            f"Caché: {cache['hits']} hits / {cache['misses']} misses "
+            f"({cache['used_bytes'] // (1024 * 1024)} MB)",
+            True,
+            self.COLOR_WHITE
+        )
+        screen.blit(cache_text, (x, y))
+        
+        # Atlas de sprites
+        y += 25
+        atlas = sprite_atlas.get_stats()
+        atlas_text = self.font_mini.render(
+            f"Atlas: {atlas['regions']} sprites en {atlas['pages']} páginas "
+            f"({int(atlas['fill'] * 100)}%)",
+            True,
+            self.COLOR_WHITE
+        )
+        screen.blit(atlas_text, (x, y))
+        
+        # Caché de textos
+        y += 25
+        texts = text_cache.get_stats()
+        texts_text = self.font_mini.render(
+            f"Textos: {texts['entries']} en caché ({int(texts['hit_rate'] * 100)}% hits)",
+            True,
+            self.COLOR_WHITE
+        )
+        screen.blit(texts_text, (x, y))
+        
+        # Cola de renderizado (frame anterior)
+        y += 25
+        render = game_state.render_queue.get_stats()
+        render_text = self.font_mini.render(
+            f"Render: {render['submitted']} blits, {render['culled']} fuera de pantalla, "
+            f"{render['batches']} lotes, {game_state.particles.count} partículas",
+            True,
+            self.COLOR_WHITE
+        )
+        screen.blit(render_text, (x, y))
+        
+        # Backend de presentación
+        y += 25
+        backend = game_state.game.backend.get_stats()
+        backend_text = self.font_mini.render(
+            f"Backend: {backend['backend']} ({backend['driver']}), {backend['textures']} texturas",
+            True,
+            self.COLOR_WHITE
+        )
+        screen.blit(backend_text, (x, y))
+        
+        # Nivel de calidad adaptativo
+        y += 25
+        quality = quality_governor.get_stats()
+        measured = quality['percentile_ms']
+        quality_text = self.font_mini.render(
+            f"Calidad: {quality['tier']} (p{quality_governor.percentile:g} "
+            f"{'-' if measured is None else f'{measured:.1f}'} / {quality['budget_ms']:.1f} ms, "
+            f"{quality['changes']} cambios)",
+            True,
+            self.COLOR_WHITE
+        )
+        screen.blit(quality_text, (x, y))
+        
+        # Regiones del HUD redibujadas desde el inicio
+        y += 25
+        hud_text = self.font_mini.render(
+            f"HUD: {self.region_redraws} regiones redibujadas",
+            True,
+            self.COLOR_WHITE
+        )
+        screen.blit(hud_text, (x, y))
     
     # === MÉTODOS AUXILIARES ===
     
@@ -1,4 +1,5 @@
 import pygame
+from ui.text_cache import text_cache
 
 class Button:
     def __init__(self, x, y, ancho, alto, texto, fuente, color=(80, 80, 80), color_hover=(120, 120, 120)):
@@ -8,19 +9,28 @@ class Button:
         self.color = color
         self.color_hover = color_hover
         self.hover = False
+        self.dirty = True  # Cambió desde el último draw (ver ui/dirty_rects.py)
+        
+    @property
+    def dirty_rect(self):
+        return self.rect
         
     def draw(self, pantalla):
+        self.dirty = False
         color = self.color_hover if self.hover else self.color
         pygame.draw.rect(pantalla, color, self.rect, border_radius=8)
         pygame.draw.rect(pantalla, (255, 255, 255), self.rect, 2, border_radius=8)
         
-        texto_render = self.fuente.render(self.texto, True, (255, 255, 255))
+        texto_render = text_cache.render(self.fuente, self.texto, True, (255, 255, 255))
         texto_x = self.rect.centerx - texto_render.get_width() // 2
         texto_y = self.rect.centery - texto_render.get_height() // 2
         pantalla.blit(texto_render, (texto_x, texto_y))
         
     def update(self, mouse_pos):
-        self.hover = self.rect.collidepoint(mouse_pos)
+        hover = self.rect.collidepoint(mouse_pos)
+        if hover != self.hover:
+            self.hover = hover
+            self.dirty = True
         
     def clicked(self, evento):
         if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
@@ -34,8 +44,15 @@ class Slider:
         self.min_val = min_val
         self.max_val = max_val
         self.dragging = False
+        self.dirty = True
+        
+    @property
+    def dirty_rect(self):
+        # La perilla (radio 10) sobresale por los extremos
+        return self.rect.inflate(24, 4)
         
     def draw(self, pantalla):
+        self.dirty = False
         pygame.draw.rect(pantalla, (60, 60, 60), self.rect, border_radius=4)
         progreso_ancho = int((self.valor - self.min_val) / (self.max_val - self.min_val) * self.rect.width)
         progreso_rect = pygame.Rect(self.rect.x, self.rect.y, progreso_ancho, self.rect.height)
@@ -57,7 +74,10 @@ class Slider:
     def _update_valor(self, mouse_x):
         rel_x = mouse_x - self.rect.x
         rel_x = max(0, min(rel_x, self.rect.width))
-        self.valor = self.min_val + (rel_x / self.rect.width) * (self.max_val - self.min_val)
+        valor = self.min_val + (rel_x / self.rect.width) * (self.max_val - self.min_val)
+        if valor != self.valor:
+            self.valor = valor
+            self.dirty = True
 
 class Selector:
     def __init__(self, x, y, ancho, alto, opciones, indice, fuente):
@@ -67,8 +87,14 @@ class Selector:
         self.fuente = fuente
         self.btn_izq = pygame.Rect(x, y, 40, alto)
         self.btn_der = pygame.Rect(x + ancho - 40, y, 40, alto)
+        self.dirty = True
+        
+    @property
+    def dirty_rect(self):
+        return self.rect
         
     def draw(self, pantalla):
+        self.dirty = False
         pygame.draw.rect(pantalla, (60, 60, 60), self.rect, border_radius=8)
         pygame.draw.rect(pantalla, (255, 255, 255), self.rect, 2, border_radius=8)
         pygame.draw.polygon(pantalla, (255, 255, 255), [
@@ -81,16 +107,18 @@ class Selector:
             (self.btn_der.centerx - 5, self.btn_der.centery + 8),
             (self.btn_der.centerx + 8, self.btn_der.centery)
         ])
-        texto = self.fuente.render(self.opciones[self.indice], True, (255, 255, 255))
+        texto = text_cache.render(self.fuente, self.opciones[self.indice], True, (255, 255, 255))
         pantalla.blit(texto, (self.rect.centerx - texto.get_width()//2, self.rect.centery - texto.get_height()//2))
         
     def handle_event(self, evento):
         if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
             if self.btn_izq.collidepoint(evento.pos):
                 self.indice = (self.indice - 1) % len(self.opciones)
+                self.dirty = True
                 return True
             elif self.btn_der.collidepoint(evento.pos):
                 self.indice = (self.indice + 1) % len(self.opciones)
+                self.dirty = True
                 return True
         return False
         
@@ -0,0 +1,100 @@
+"""
+Caché de textos renderizados
+La mayoría de los textos de la UI no cambian de un frame a otro; con esta
+caché un texto repetido cuesta una búsqueda en un diccionario en lugar de
+una rasterización con font.render().
+"""
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+
+class TextCache:
+    """
+    Caché LRU de superficies de texto.
+
+    La clave es (fuente, texto, antialias, color, fondo). Las fuentes se
+    comparan por identidad, así que conviene reutilizar los objetos Font
+    (ver get_font).
+
+    IMPORTANTE: las superficies devueltas son compartidas. Quien necesite
+    modificarlas (p. ej. set_alpha) debe trabajar sobre una copia.
+    """
+
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            max_entries: Máximo de textos retenidos
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+        # Contadores
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool,
+               color: tuple, background: Optional[tuple] = None) -> pygame.Surface:
+        """
+        Equivalente a font.render(text, antialias, color, background), con caché.
+
+        Returns:
+            Superficie compartida con el texto
+        """
+        key = (font, text, antialias, tuple(color), tuple(background) if background else None)
+
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self._entries[key] = surface
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return surface
+
+    def get_font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """
+        Retorna una fuente compartida (evita crear pygame.font.Font cada frame).
+
+        Args:
+            size: Tamaño en puntos
+            name: Archivo de fuente, o None para la fuente por defecto
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        """Vacía la caché (los contadores se conservan)"""
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Retorna estadísticas de la caché (para debug)"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "fonts": len(self._fonts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions
+        }
+
+
+# Instancia compartida por toda la UI
+text_cache = TextCache()